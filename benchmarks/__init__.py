@@ -0,0 +1 @@
+"""Benchmarks for quick-data-cli; run with `python -m benchmarks --help`."""
@@ -0,0 +1,220 @@
+"""Benchmark suite for the analytics functions.
+
+    uv run python -m benchmarks generate --size 1m --wide
+    uv run python -m benchmarks run --size 10k --size 1m
+    uv run python -m benchmarks compare --threshold 0.1
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+app = typer.Typer(help="Generate synthetic datasets, time the analytics functions and track regressions.")
+
+DEFAULT_DIR = Path(os.getenv("QUICK_DATA_BENCH_DIR", "outputs/benchmarks"))
+
+_DATASET_HELP = "Dataset to use: orders, survey or products (repeatable; default: all)"
+_SIZE_HELP = "Row count: 10k, 1m, 10m, 100m or a number (repeatable)"
+
+
+def _targets(datasets: Optional[List[str]], sizes: List[str], wide: bool, narrow: bool):
+    from .datasets import DATASETS, parse_size
+
+    names = datasets or list(DATASETS)
+    unknown = [n for n in names if n not in DATASETS]
+    if unknown:
+        typer.secho(f"Error: Unknown dataset(s): {', '.join(unknown)}", err=True, fg=typer.colors.RED)
+        raise typer.Exit(1)
+    variants = ([False] if narrow or not wide else []) + ([True] if wide else [])
+    for size in sizes:
+        try:
+            rows = parse_size(size)
+        except ValueError:
+            typer.secho(f"Error: Invalid size: {size}", err=True, fg=typer.colors.RED)
+            raise typer.Exit(1)
+        for name in names:
+            for is_wide in variants:
+                yield name, rows, is_wide
+
+
+def _mb(value: Optional[float]) -> str:
+    return "" if value is None else f"{value:.1f}"
+
+
+@app.command(help="Write synthetic datasets (existing files are reused unless --force).")
+def generate(
+    datasets: Optional[List[str]] = typer.Option(None, "--dataset", "-d", help=_DATASET_HELP),
+    sizes: List[str] = typer.Option(["10k"], "--size", "-s", help=_SIZE_HELP),
+    wide: bool = typer.Option(False, "--wide", help="Generate the wide variant (40 extra numeric columns)"),
+    narrow: bool = typer.Option(False, "--narrow", help="With --wide, also generate the regular variant"),
+    seed: int = typer.Option(0, "--seed", help="Random seed"),
+    force: bool = typer.Option(False, "--force", help="Regenerate files that already exist"),
+    data_dir: Path = typer.Option(DEFAULT_DIR / "data", "--data-dir", help="Where datasets are written"),
+):
+    import time
+    from .datasets import generate as write
+
+    for name, rows, is_wide in _targets(datasets, sizes, wide, narrow):
+        start = time.perf_counter()
+        path = write(data_dir, name, rows, is_wide, seed, force)
+        console.print(
+            f"{path} ({path.stat().st_size / 1024**2:.1f} MB, {time.perf_counter() - start:.1f}s)"
+        )
+
+
+@app.command(help="Time load_data and the analytics functions and append the results to the history.")
+def run(
+    datasets: Optional[List[str]] = typer.Option(None, "--dataset", "-d", help=_DATASET_HELP),
+    sizes: List[str] = typer.Option(["10k"], "--size", "-s", help=_SIZE_HELP),
+    wide: bool = typer.Option(False, "--wide", help="Benchmark the wide variant"),
+    narrow: bool = typer.Option(False, "--narrow", help="With --wide, also benchmark the regular variant"),
+    cases: Optional[List[str]] = typer.Option(None, "--case", "-c", help="Function to time (repeatable; default: all)"),
+    repeat: int = typer.Option(3, "--repeat", "-r", help="Runs per case; the fastest is kept"),
+    memory: bool = typer.Option(
+        True, "--memory/--no-memory", help="Measure peak allocations in one extra run per case under tracemalloc"
+    ),
+    seed: int = typer.Option(0, "--seed", help="Random seed of the datasets"),
+    label: Optional[str] = typer.Option(None, "--label", help="Free-form note stored with the run"),
+    data_dir: Path = typer.Option(DEFAULT_DIR / "data", "--data-dir", help="Where datasets are read or generated"),
+    history_path: Path = typer.Option(DEFAULT_DIR / "history.json", "--history", help="JSON history file"),
+    save: bool = typer.Option(True, "--save/--no-save", help="Append the results to the history"),
+):
+    from quick_data_cli.config.settings import settings
+
+    from .datasets import generate as write
+    from .history import append
+    from .runner import CASE_NAMES, run_dataset
+
+    unknown = [c for c in cases or [] if c not in CASE_NAMES]
+    if unknown:
+        typer.secho(
+            f"Error: Unknown case(s): {', '.join(unknown)}. Available: {', '.join(CASE_NAMES)}",
+            err=True,
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    # The benchmarks call the functions directly; keep the caches and the
+    # daemon out of the measurements anyway.
+    settings.cache_enabled = False
+    settings.result_cache_enabled = False
+    settings.use_daemon = False
+
+    table = Table(title="Benchmark results", show_header=True, header_style="bold")
+    for column in ("Dataset", "Rows", "Case", "Seconds", "Rows/s", "MB/s", "Peak MB"):
+        table.add_column(column)
+
+    results = []
+    for name, rows, is_wide in _targets(datasets, sizes, wide, narrow):
+        path = write(data_dir, name, rows, is_wide, seed)
+        label_name = f"{name}-wide" if is_wide else name
+
+        def show(result):
+            console.print(
+                f"{result['dataset']} {result['rows']:,} rows  {result['case']}: {result['seconds']:.3f}s",
+                style="dim",
+            )
+
+        for result in run_dataset(path, name, label_name, cases, repeat, memory, on_result=show):
+            results.append(result)
+            table.add_row(
+                result["dataset"],
+                f"{result['rows']:,}",
+                result["case"],
+                f"{result['seconds']:.3f}",
+                f"{result['rows_per_s']:,.0f}" if result["rows_per_s"] else "",
+                f"{result['mb_per_s']:.1f}" if result["mb_per_s"] else "",
+                _mb(result["peak_mb"]),
+            )
+
+    console.print(table)
+    if save and results:
+        append(history_path, results, label)
+        console.print(f"Appended run to {history_path}")
+
+
+@app.command(help="Compare a run with earlier ones and flag regressions; exits 1 if any.")
+def compare(
+    history_path: Path = typer.Option(DEFAULT_DIR / "history.json", "--history", help="JSON history file"),
+    threshold: float = typer.Option(0.1, "--threshold", "-t", help="Relative slowdown or memory growth to flag"),
+    current: int = typer.Option(-1, "--run", help="Index of the run to check (default: latest)"),
+    baseline: Optional[int] = typer.Option(
+        None, "--baseline", help="Index of the run to compare with (default: latest earlier result per case)"
+    ),
+):
+    from .history import compare as compare_runs, load
+
+    runs = load(history_path)
+    if not runs:
+        typer.secho(f"Error: No benchmark history at {history_path}", err=True, fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    rows = compare_runs(runs, current, baseline, threshold)
+    run_info = runs[current % len(runs)]
+    table = Table(
+        title=f"Run {current % len(runs)} ({run_info['timestamp']}, {run_info['environment'].get('commit') or 'no commit'})",
+        show_header=True,
+        header_style="bold",
+    )
+    for column in ("Dataset", "Rows", "Case", "Seconds", "Baseline", "Change", "Peak MB", "Baseline", "Change"):
+        table.add_column(column)
+
+    def change(new, old):
+        if old is None or new is None:
+            return ""
+        return f"{(new - old) / old:+.1%}" if old else "n/a"
+
+    regressions = 0
+    for row in rows:
+        flagged = row["regressions"]
+        regressions += bool(flagged)
+        table.add_row(
+            row["dataset"],
+            f"{row['rows']:,}",
+            row["case"],
+            f"{row['seconds']:.3f}",
+            f"{row['base_seconds']:.3f}" if "base_seconds" in row else "",
+            change(row["seconds"], row.get("base_seconds")),
+            _mb(row["peak_mb"]),
+            _mb(row.get("base_peak_mb")),
+            change(row["peak_mb"], row.get("base_peak_mb")),
+            style="red" if flagged else None,
+        )
+    console.print(table)
+    if regressions:
+        console.print(f"[red]{regressions} regression(s) over {threshold:.0%}[/red]")
+        raise typer.Exit(1)
+    console.print(f"No regressions over {threshold:.0%}")
+
+
+@app.command("history", help="List the runs in the history.")
+def history_ls(
+    history_path: Path = typer.Option(DEFAULT_DIR / "history.json", "--history", help="JSON history file"),
+):
+    from .history import load
+
+    table = Table(title=str(history_path), show_header=True, header_style="bold")
+    for column in ("Run", "When", "Commit", "Label", "Results"):
+        table.add_column(column)
+    for i, run_info in enumerate(load(history_path)):
+        table.add_row(
+            str(i),
+            run_info["timestamp"],
+            run_info["environment"].get("commit") or "",
+            run_info.get("label") or "",
+            str(len(run_info["results"])),
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    app()
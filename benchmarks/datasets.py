@@ -0,0 +1,207 @@
+"""Synthetic datasets shaped like the sample files in `data/`.
+
+Each dataset is written in chunks, so generating 100M rows never holds
+more than one chunk in memory. Chunk `i` is drawn from its own seeded
+generator, so a given name, size and seed always produce the same file.
+The "wide" variant adds WIDE_METRICS float columns, half of them
+correlated with the dataset's main value column.
+"""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+CHUNK_ROWS = 1_000_000
+WIDE_METRICS = 40
+NULL_RATE = 0.005
+CUSTOMERS = 250_000
+
+SIZES = {"10k": 10_000, "1m": 1_000_000, "10m": 10_000_000, "100m": 100_000_000}
+
+
+def parse_size(value: str) -> int:
+    """Row count from a size name ("10k", "1m", ...) or a plain integer."""
+    value = value.strip().lower()
+    if value in SIZES:
+        return SIZES[value]
+    for suffix, factor in (("k", 1_000), ("m", 1_000_000)):
+        if value.endswith(suffix):
+            return int(float(value[: -len(suffix)]) * factor)
+    return int(value)
+
+
+def size_name(rows: int) -> str:
+    for name, count in SIZES.items():
+        if count == rows:
+            return name
+    return str(rows)
+
+
+def _pick(rng: np.random.Generator, choices: List[str], n: int, p: Optional[List[float]] = None) -> np.ndarray:
+    return np.asarray(choices, dtype=object)[rng.choice(len(choices), size=n, p=p)]
+
+
+def _ids(prefix: str, start: int, n: int) -> pd.Series:
+    return prefix + pd.Series(np.arange(start + 1, start + n + 1)).astype(str).str.zfill(9)
+
+
+def _dates(rng: np.random.Generator, first: str, days: int, n: int) -> np.ndarray:
+    # Formatting a few hundred distinct days once is far cheaper than
+    # formatting every row.
+    calendar = pd.date_range(first, periods=days, freq="D").strftime("%Y-%m-%d").to_numpy(dtype=object)
+    return calendar[rng.integers(0, days, size=n)]
+
+
+def _with_nulls(rng: np.random.Generator, values: np.ndarray) -> np.ndarray:
+    values = values.astype(np.float64)
+    values[rng.random(len(values)) < NULL_RATE] = np.nan
+    return values
+
+
+def _orders(rng: np.random.Generator, start: int, n: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "order_id": _ids("ord_", start, n),
+            "customer_id": "cust_" + pd.Series(rng.integers(0, CUSTOMERS, size=n)).astype(str),
+            "product_category": _pick(
+                rng, ["electronics", "books", "clothing", "home_garden", "sports"], n, [0.3, 0.2, 0.2, 0.15, 0.15]
+            ),
+            "order_value": _with_nulls(rng, np.round(rng.lognormal(5.0, 0.9, size=n), 2)),
+            "order_date": _dates(rng, "2023-01-01", 730, n),
+            "region": _pick(rng, ["west_coast", "midwest", "east_coast", "south"], n),
+            "payment_method": _pick(rng, ["credit_card", "paypal", "debit_card"], n, [0.5, 0.3, 0.2]),
+            "customer_segment": _pick(rng, ["premium", "standard", "basic"], n, [0.2, 0.5, 0.3]),
+        }
+    )
+
+
+def _survey(rng: np.random.Generator, start: int, n: int) -> pd.DataFrame:
+    tenure = np.round(rng.gamma(2.0, 1.6, size=n), 1)
+    satisfaction = np.clip(np.round(6.5 + 0.3 * tenure + rng.normal(0, 1.0, size=n), 1), 1.0, 10.0)
+    return pd.DataFrame(
+        {
+            "employee_id": _ids("emp_", start, n),
+            "department": _pick(rng, ["engineering", "sales", "marketing", "hr", "finance"], n),
+            "satisfaction_score": _with_nulls(rng, satisfaction),
+            "tenure_years": tenure,
+            "remote_work": _pick(rng, ["yes", "no", "hybrid"], n),
+            "salary_band": _pick(rng, ["senior", "mid", "junior"], n, [0.3, 0.4, 0.3]),
+        }
+    )
+
+
+def _products(rng: np.random.Generator, start: int, n: int) -> pd.DataFrame:
+    sales = np.round(rng.normal(1300, 450, size=n).clip(10))
+    return pd.DataFrame(
+        {
+            "product_id": _ids("prod_", start, n),
+            "category": _pick(rng, ["widgets", "gadgets", "tools", "accessories"], n),
+            "monthly_sales": _with_nulls(rng, sales),
+            "inventory_level": rng.integers(0, 100, size=n),
+            "supplier": _pick(rng, ["supplier_a", "supplier_b", "supplier_c", "supplier_d"], n),
+            "launch_date": _dates(rng, "2023-01-01", 540, n),
+            "rating": np.round(np.clip(3.2 + sales / 2500 + rng.normal(0, 0.3, size=n), 1.0, 5.0), 1),
+        }
+    )
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """A synthetic dataset and the columns the benchmark cases use."""
+
+    name: str
+    suffix: str
+    make: Callable[[np.random.Generator, int, int], pd.DataFrame]
+    value_column: str
+    category_column: str
+    date_column: Optional[str] = None
+    numeric_columns: List[str] = field(default_factory=list)
+
+
+DATASETS: Dict[str, DatasetSpec] = {
+    "orders": DatasetSpec(
+        "orders", ".json", _orders, "order_value", "product_category", "order_date", ["order_value"]
+    ),
+    "survey": DatasetSpec(
+        "survey", ".csv", _survey, "satisfaction_score", "department", None, ["satisfaction_score", "tenure_years"]
+    ),
+    "products": DatasetSpec(
+        "products",
+        ".csv",
+        _products,
+        "monthly_sales",
+        "category",
+        "launch_date",
+        ["monthly_sales", "inventory_level", "rating"],
+    ),
+}
+
+
+def metric_columns() -> List[str]:
+    return [f"metric_{i:02d}" for i in range(WIDE_METRICS)]
+
+
+def _widen(rng: np.random.Generator, df: pd.DataFrame, spec: DatasetSpec) -> pd.DataFrame:
+    base = df[spec.value_column].fillna(0).to_numpy()
+    scale = base.std() or 1.0
+    extra = {}
+    for i, name in enumerate(metric_columns()):
+        noise = rng.normal(0, scale, size=len(df))
+        # Even metrics track the value column, odd ones are independent.
+        extra[name] = np.round((base * rng.uniform(0.2, 1.0) + noise) if i % 2 == 0 else noise, 3)
+    return pd.concat([df, pd.DataFrame(extra, index=df.index)], axis=1)
+
+
+def dataset_path(data_dir: Path, name: str, rows: int, wide: bool = False, seed: int = 0) -> Path:
+    spec = DATASETS[name]
+    variant = "-wide" if wide else ""
+    return data_dir / f"{name}{variant}-{size_name(rows)}-s{seed}{spec.suffix}"
+
+
+def _chunks(spec: DatasetSpec, rows: int, wide: bool, seed: int):
+    for index, start in enumerate(range(0, rows, CHUNK_ROWS)):
+        rng = np.random.default_rng([seed, index])
+        df = spec.make(rng, start, min(CHUNK_ROWS, rows - start))
+        yield _widen(rng, df, spec) if wide else df
+
+
+def generate(data_dir: Path, name: str, rows: int, wide: bool = False, seed: int = 0, force: bool = False) -> Path:
+    """Write the dataset unless it already exists and return its path."""
+    spec = DATASETS[name]
+    path = dataset_path(data_dir, name, rows, wide, seed)
+    if path.exists() and not force:
+        return path
+    data_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8", newline="") as f:
+            if spec.suffix == ".json":
+                _write_json_array(f, _chunks(spec, rows, wide, seed))
+            else:
+                for i, chunk in enumerate(_chunks(spec, rows, wide, seed)):
+                    chunk.to_csv(f, header=i == 0, index=False)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return path
+
+
+def _write_json_array(f, chunks) -> None:
+    # An array of records, like ecommerce_orders.json, streamed chunk by
+    # chunk. JSON Lines escapes newlines inside strings, so every line is
+    # exactly one record.
+    f.write("[\n")
+    first = True
+    for chunk in chunks:
+        lines = chunk.to_json(orient="records", lines=True).rstrip("\n")
+        if not lines:
+            continue
+        if not first:
+            f.write(",\n")
+        f.write(lines.replace("\n", ",\n"))
+        first = False
+    f.write("\n]\n")
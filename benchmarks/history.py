@@ -0,0 +1,121 @@
+"""JSON history of benchmark runs and regression checks between them.
+
+The history file holds a list of runs, oldest first. Each run records
+the environment it ran in and one result per (dataset, rows, case).
+"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Differences below these are timer and allocator noise, whatever the ratio.
+MIN_SECONDS_DELTA = 0.005
+MIN_MB_DELTA = 1.0
+
+Key = Tuple[str, int, str]
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        proc = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return proc.stdout.strip() or None
+
+
+def environment() -> Dict[str, Any]:
+    import numpy
+    import pandas
+
+    try:
+        import pyarrow
+
+        arrow: Optional[str] = pyarrow.__version__
+    except ImportError:
+        arrow = None
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "pandas": pandas.__version__,
+        "numpy": numpy.__version__,
+        "pyarrow": arrow,
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def load(path: Path) -> List[Dict[str, Any]]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return []
+
+
+def append(path: Path, results: List[Dict[str, Any]], label: Optional[str] = None) -> Dict[str, Any]:
+    run = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "label": label,
+        "argv": sys.argv[1:],
+        "environment": environment(),
+        "results": results,
+    }
+    runs = load(path)
+    runs.append(run)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(runs, indent=2), encoding="utf-8")
+    os.replace(tmp_path, path)
+    return run
+
+
+def _key(result: Dict[str, Any]) -> Key:
+    return result["dataset"], result["rows"], result["case"]
+
+
+def compare(
+    runs: List[Dict[str, Any]], current: int = -1, baseline: Optional[int] = None, threshold: float = 0.1
+) -> List[Dict[str, Any]]:
+    """Compare run `current` against `baseline`, both indexes into `runs`.
+
+    Without a baseline, each result is compared with the latest earlier
+    run that measured the same dataset, size and case. A result regresses
+    when its time or peak memory grows by more than `threshold` (0.1 is
+    10%) and by more than the noise floor.
+    """
+    current %= len(runs)
+    if baseline is None:
+        earlier = runs[:current]
+    else:
+        earlier = [runs[baseline % len(runs)]]
+    previous: Dict[Key, Dict[str, Any]] = {}
+    for run in earlier:
+        for result in run["results"]:
+            previous[_key(result)] = result
+
+    rows = []
+    for result in runs[current]["results"]:
+        base = previous.get(_key(result))
+        row = {"dataset": result["dataset"], "rows": result["rows"], "case": result["case"], "regressions": []}
+        row["seconds"], row["peak_mb"] = result["seconds"], result["peak_mb"]
+        if base is not None:
+            row["base_seconds"], row["base_peak_mb"] = base["seconds"], base["peak_mb"]
+            for metric, floor in (("seconds", MIN_SECONDS_DELTA), ("peak_mb", MIN_MB_DELTA)):
+                old, new = base[metric], result[metric]
+                if old is None or new is None:
+                    continue
+                if new - old > floor and new > old * (1 + threshold):
+                    row["regressions"].append(metric)
+        rows.append(row)
+    return rows
@@ -0,0 +1,197 @@
+"""Time the analytics functions against a synthetic dataset.
+
+The dataset is parsed once by the `load_data` case (load cache off, so
+that is a real parse) and the resulting frame is shared by every other
+case. Each case runs `repeat` times; the fastest wall time is kept.
+
+Peak memory comes from one extra run under tracemalloc, kept apart from
+the timed runs because tracing slows allocation-heavy code. numpy
+reports its buffers to tracemalloc, Arrow does not; the process RSS
+high-water mark (reset before each run through /proc/self/clear_refs on
+Linux) is recorded alongside. RSS alone cannot measure a case, since
+memory freed by an earlier case is reused without raising it.
+"""
+
+import gc
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from quick_data_cli.analytics.chart import create_chart
+from quick_data_cli.analytics.correlations import find_correlations
+from quick_data_cli.analytics.distributions import analyze_distributions
+from quick_data_cli.analytics.outliers import detect_outliers
+from quick_data_cli.analytics.quality import validate_data_quality
+from quick_data_cli.analytics.segment import segment_by_column
+from quick_data_cli.analytics.time_series import time_series_analysis
+from quick_data_cli.utils.loader import load_data
+
+from .datasets import DATASETS, DatasetSpec, metric_columns
+
+WARMUP_ROWS = 1000
+
+_PROC_STATUS = Path("/proc/self/status")
+_CLEAR_REFS = Path("/proc/self/clear_refs")
+
+
+def _status_kb(field: str) -> Optional[int]:
+    try:
+        with _PROC_STATUS.open() as f:
+            for line in f:
+                if line.startswith(field):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _reset_peak_rss() -> bool:
+    # Writing 5 resets VmHWM to the current RSS (Linux 4.0+).
+    try:
+        _CLEAR_REFS.write_text("5")
+    except OSError:
+        return False
+    return _status_kb("VmHWM:") is not None
+
+
+@dataclass
+class Measurement:
+    seconds: float
+    peak_bytes: Optional[int]
+    rss_bytes: Optional[int]
+
+
+def measure(func: Callable[[], Any], repeat: int = 1, memory: bool = True) -> Measurement:
+    """Best wall time of `repeat` untraced runs, then one traced run for
+    the peak allocation."""
+    best = float("inf")
+    rss: Optional[int] = None
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        reset = _reset_peak_rss()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+        if reset:
+            rss = max(rss or 0, (_status_kb("VmHWM:") or 0) * 1024)
+    peak: Optional[int] = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return Measurement(best, peak, rss)
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    run: Callable[[pd.DataFrame, DatasetSpec, Path], Any]
+    applies: Callable[[DatasetSpec, pd.DataFrame], bool] = lambda spec, df: True
+
+
+def _numeric(spec: DatasetSpec, df: pd.DataFrame) -> List[str]:
+    return spec.numeric_columns + [c for c in metric_columns() if c in df.columns]
+
+
+# load_data is measured separately, since it produces the frame the other
+# cases share.
+CASES: List[Case] = [
+    Case(
+        "find_correlations",
+        lambda df, spec, out: find_correlations(df, _numeric(spec, df)),
+        lambda spec, df: len(_numeric(spec, df)) >= 2,
+    ),
+    Case("detect_outliers", lambda df, spec, out: detect_outliers(df, _numeric(spec, df))),
+    Case("segment_by_column", lambda df, spec, out: segment_by_column(df, spec.category_column)),
+    Case("analyze_distributions", lambda df, spec, out: analyze_distributions(df, spec.value_column)),
+    Case(
+        "time_series_analysis",
+        lambda df, spec, out: time_series_analysis(df, spec.date_column, spec.value_column),
+        lambda spec, df: spec.date_column is not None,
+    ),
+    Case("validate_data_quality", lambda df, spec, out: validate_data_quality(df)),
+    Case(
+        # A bar chart aggregates before plotting, so its output stays the
+        # same size at any row count.
+        "create_chart",
+        lambda df, spec, out: create_chart(
+            df, "bar", spec.category_column, spec.value_column, output=out / f"{spec.name}.html"
+        ),
+    ),
+]
+
+CASE_NAMES = ["load_data"] + [c.name for c in CASES]
+
+
+def _result(
+    dataset: str, path: Path, rows: int, columns: int, data_bytes: int, case: str, m: Measurement
+) -> Dict[str, Any]:
+    return {
+        "dataset": dataset,
+        "file": path.name,
+        "rows": rows,
+        "columns": columns,
+        "case": case,
+        "seconds": m.seconds,
+        "rows_per_s": rows / m.seconds if m.seconds else None,
+        "mb_per_s": data_bytes / 1024**2 / m.seconds if m.seconds else None,
+        "peak_mb": m.peak_bytes / 1024**2 if m.peak_bytes is not None else None,
+        "rss_mb": m.rss_bytes / 1024**2 if m.rss_bytes is not None else None,
+    }
+
+
+def run_dataset(
+    path: Path,
+    name: str,
+    dataset: str,
+    cases: Optional[List[str]] = None,
+    repeat: int = 1,
+    memory: bool = True,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """Benchmark one generated file. `dataset` labels the results (e.g.
+    "orders-wide"); `name` selects the spec. Throughput for load_data is in
+    file bytes, for the other cases in in-memory bytes."""
+    spec = DATASETS[name]
+    wanted = set(cases or CASE_NAMES)
+    results: List[Dict[str, Any]] = []
+
+    def emit(result: Dict[str, Any]) -> None:
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+
+    frames: List[pd.DataFrame] = []
+
+    def load() -> None:
+        loaded = load_data(path, use_cache=False, optimize=False)
+        # Keep only the first frame, so repeats do not accumulate copies.
+        if not frames:
+            frames.append(loaded)
+
+    m = measure(load, repeat, memory)
+    df = frames.pop()
+    rows, columns = len(df), len(df.columns)
+    if "load_data" in wanted:
+        emit(_result(dataset, path, rows, columns, path.stat().st_size, "load_data", m))
+
+    data_bytes = int(df.memory_usage(deep=True).sum())
+    with tempfile.TemporaryDirectory(prefix="quick-data-bench-") as out:
+        for case in CASES:
+            if case.name not in wanted or not case.applies(spec, df):
+                continue
+            # Warm up on a slice so lazy imports (plotly's writers, scipy)
+            # are not billed to the first timed run.
+            case.run(df.head(WARMUP_ROWS), spec, Path(out))
+            m = measure(lambda: case.run(df, spec, Path(out)), repeat, memory)
+            emit(_result(dataset, path, rows, columns, data_bytes, case.name, m))
+    return results
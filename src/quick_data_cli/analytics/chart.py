@@ -30,14 +30,14 @@ def create_chart(
     elif chart_type == "bar":
         if y_column:
             if groupby_column:
-                agg_data = df.groupby([x_column, groupby_column])[y_column].mean().reset_index()
+                agg_data = df.groupby([x_column, groupby_column], observed=True)[y_column].mean().reset_index()
                 fig = px.bar(agg_data, x=x_column, y=y_column, color=groupby_column, title=title)
             else:
-                agg = df.groupby(x_column)[y_column].mean().reset_index()
+                agg = df.groupby(x_column, observed=True)[y_column].mean().reset_index()
                 fig = px.bar(agg, x=x_column, y=y_column, title=title)
         else:
             if groupby_column:
-                counts = df.groupby([x_column, groupby_column]).size().reset_index(name="count")
+                counts = df.groupby([x_column, groupby_column], observed=True).size().reset_index(name="count")
                 fig = px.bar(counts, x=x_column, y="count", color=groupby_column, title=title)
             else:
                 counts = df[x_column].value_counts().reset_index()
@@ -0,0 +1,143 @@
+import pandas as pd
+import numpy as np
+from typing import Any, Callable, Dict, List, Tuple
+
+QUARTILES = (0.25, 0.5, 0.75)
+# Rows per tile for cache-sized passes over 2D blocks.
+TILE_ROWS = 8192
+
+
+def _select(part: np.ndarray, ks: List[int], lo: int, hi: int) -> None:
+    """Put the order statistics `ks` of rows lo:hi in place, splitting at the middle k."""
+    if not ks:
+        return
+    mid = len(ks) // 2
+    k = ks[mid]
+    part[lo:hi].partition(k - lo, axis=0)
+    _select(part, ks[:mid], lo, k)
+    _select(part, ks[mid + 1 :], k + 1, hi)
+
+
+def nan_quartiles(block: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """QUARTILES x columns of a 2D float array with `counts` non-nulls per column."""
+    result = np.full((len(QUARTILES), block.shape[1]), np.nan)
+    q = np.asarray(QUARTILES)
+    for n in np.unique(counts):
+        if n == 0:
+            continue
+        # NaNs partition to the end, so columns sharing a count go together.
+        cols = np.flatnonzero(counts == n)
+        part = np.array(block if len(cols) == block.shape[1] else block[:, cols], order="F")
+        virtual = q * (n - 1)
+        below = np.floor(virtual).astype(np.intp)
+        ks = sorted(set(below.tolist()))
+        _select(part, ks, 0, len(part))
+        a = part[below]
+        # The statistic above each quartile is the minimum up to the next k.
+        b = np.empty_like(a)
+        for i, k in enumerate(below):
+            stop = min([j for j in ks if j > k] + [int(n) - 1]) + 1
+            b[i] = part[k + 1 : stop].min(axis=0) if k + 1 < n else a[i]
+        # np.quantile's interpolation, so the results agree to the bit.
+        t = (virtual - below)[:, None]
+        diff = b - a
+        values = a + diff * t
+        np.subtract(b, diff * (1 - t), out=values, where=np.broadcast_to(t >= 0.5, values.shape))
+        result[:, cols] = values
+    return result
+
+
+def nan_moments(block: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """NaN-skipping mean and sample std (ddof=1) of every column of a 2D float array."""
+    complete = bool((counts == len(block)).all())
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = (block.sum(axis=0) if complete else np.nansum(block, axis=0)) / counts
+        # The std may differ from pandas' in the last bit.
+        squares = np.zeros(block.shape[1])
+        work = np.empty((min(TILE_ROWS, len(block)), block.shape[1]), order="F")
+        for start in range(0, len(block), TILE_ROWS):
+            rows = block[start : start + TILE_ROWS]
+            dev = work[: len(rows)]
+            np.subtract(rows, mean, out=dev)
+            if not complete:
+                dev[np.isnan(rows)] = 0.0
+            np.square(dev, out=dev)
+            squares += dev.sum(axis=0)
+        std = np.sqrt(squares / (counts - 1))
+    std[counts < 2] = np.nan
+    return mean, std
+
+
+class ColumnStats:
+    """Per-column statistics computed on first use and shared across analyses."""
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._cache: Dict[Tuple[str, Any], Any] = {}
+
+    def _get(self, kind: str, col: Any, compute: Callable[[], Any]) -> Any:
+        key = (kind, col)
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def prime(self, kind: str, values: Dict[Any, Any]) -> None:
+        """Cache bulk-computed statistics without overwriting existing ones."""
+        for col, value in values.items():
+            self._cache.setdefault((kind, col), value)
+
+    def cached(self, kind: str, col: Any) -> bool:
+        return (kind, col) in self._cache
+
+    def numeric_columns(self) -> List[str]:
+        return self._get("numeric", None, lambda: self.df.select_dtypes(include=[np.number]).columns.tolist())
+
+    def null_counts(self) -> pd.Series:
+        return self._get("nulls", None, lambda: self.df.isna().sum())
+
+    def null_count(self, col: Any) -> int:
+        return int(self.null_counts()[col])
+
+    def non_null(self, col: Any) -> int:
+        return len(self.df) - self.null_count(col)
+
+    def null_percentage(self, col: Any) -> float:
+        # Same arithmetic as Series.isnull().mean() * 100.
+        return self.null_count(col) / len(self.df) * 100 if len(self.df) else float("nan")
+
+    def values(self, col: Any) -> pd.Series:
+        return self._get("values", col, lambda: self.df[col].dropna())
+
+    def quartiles(self, col: Any) -> Dict[float, float]:
+        def compute() -> Dict[float, float]:
+            q = self.df[col].quantile(list(QUARTILES))
+            return {p: float(v) for p, v in zip(QUARTILES, q.to_numpy())}
+
+        return self._get("quartiles", col, compute)
+
+    def mean(self, col: Any) -> float:
+        return self._get("mean", col, lambda: float(self.df[col].mean()))
+
+    def std(self, col: Any) -> float:
+        return self._get("std", col, lambda: float(self.df[col].std()))
+
+    def median(self, col: Any) -> float:
+        return self._get("median", col, lambda: float(self.df[col].median()))
+
+    def min(self, col: Any) -> Any:
+        return self._get("min", col, lambda: self.df[col].min())
+
+    def max(self, col: Any) -> Any:
+        return self._get("max", col, lambda: self.df[col].max())
+
+    def skew(self, col: Any) -> float:
+        return self._get("skew", col, lambda: float(self.df[col].skew()))
+
+    def kurtosis(self, col: Any) -> float:
+        return self._get("kurtosis", col, lambda: float(self.df[col].kurtosis()))
+
+    def nunique(self, col: Any) -> int:
+        return self._get("nunique", col, lambda: int(self.df[col].nunique()))
+
+    def value_counts(self, col: Any) -> pd.Series:
+        return self._get("value_counts", col, lambda: self.df[col].value_counts())
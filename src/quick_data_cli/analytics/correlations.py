@@ -1,43 +1,347 @@
+import os
 import pandas as pd
 import numpy as np
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Tuple
+
+from .column_stats import ColumnStats
+
+METHODS = ("pearson", "spearman", "kendall")
+
+BLOCK_COLUMNS = 512
+BLOCK_ROWS = 1 << 16
+# Pairs x rows below which a process pool costs more than it saves.
+PARALLEL_MIN_WORK = 2_000_000
+
+
+def _standardize(df: pd.DataFrame, columns: List[str], dtype: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Standardized columns with NaN as 0, and a validity mask if anything is missing."""
+    values = np.empty((len(df), len(columns)), dtype=dtype, order="F")
+    mask = None
+    for k, col in enumerate(columns):
+        x = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = ~np.isnan(x)
+        if not valid.all():
+            if mask is None:
+                mask = np.ones(values.shape, dtype=dtype, order="F")
+            mask[:, k] = valid
+        if valid.any():
+            mean = x[valid].mean()
+            std = x[valid].std()
+            # A constant column keeps a rounding-level spread; leave it all zero.
+            if std > 16 * np.finfo(np.float64).eps * max(abs(mean), np.finfo(np.float64).tiny):
+                values[:, k] = np.where(valid, (x - mean) / std, 0.0)
+                continue
+        values[:, k] = 0.0
+    return values, mask
+
+
+def _complete_block(values: np.ndarray, i: slice, j: slice, ddof_n: int) -> np.ndarray:
+    # Columns with mean 0 and unit (population) variance over all rows.
+    return (values[:, i].T @ values[:, j]) / ddof_n
+
+
+def _pairwise_block(values: np.ndarray, mask: np.ndarray, i: slice, j: slice) -> np.ndarray:
+    """Pairwise-complete Pearson, like DataFrame.corr()."""
+    shape = (i.stop - i.start, j.stop - j.start)
+    n = np.zeros(shape)
+    sx = np.zeros(shape)
+    sy = np.zeros(shape)
+    sxx = np.zeros(shape)
+    syy = np.zeros(shape)
+    sxy = np.zeros(shape)
+    for r in range(0, values.shape[0], BLOCK_ROWS):
+        rows = slice(r, r + BLOCK_ROWS)
+        xi, xj = values[rows, i], values[rows, j]
+        mi, mj = mask[rows, i], mask[rows, j]
+        n += mi.T @ mj
+        sx += xi.T @ mj
+        sy += mi.T @ xj
+        sxx += (xi * xi).T @ mj
+        syy += mi.T @ (xj * xj)
+        sxy += xi.T @ xj
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = sxy - sx * sy / n
+        var_x = sxx - sx * sx / n
+        var_y = syy - sy * sy / n
+        # Cancellation leaves residues where a column is constant over the shared rows.
+        eps = 16 * np.finfo(values.dtype).eps
+        degenerate = (n < 2) | (var_x <= eps * sxx) | (var_y <= eps * syy)
+        corr = cov / np.sqrt(var_x * var_y)
+    corr[degenerate] = np.nan
+    return corr
+
+
+def correlation_blocks(
+    df: pd.DataFrame, columns: List[str], dtype: str = "float64", block: int = BLOCK_COLUMNS
+) -> Iterator[Tuple[int, int, np.ndarray]]:
+    """Yield (row offset, column offset, block) upper-triangle tiles of the Pearson matrix."""
+    values, mask = _standardize(df, columns, dtype)
+    n_rows, width = values.shape
+    if mask is None:
+        constant = ~values.any(axis=0)
+    for a in range(0, width, block):
+        i = slice(a, min(a + block, width))
+        for b in range(a, width, block):
+            j = slice(b, min(b + block, width))
+            if mask is None:
+                corr = _complete_block(values, i, j, n_rows).astype(np.float64)
+                corr[constant[i], :] = np.nan
+                corr[:, constant[j]] = np.nan
+                if n_rows < 2:
+                    corr[:] = np.nan
+            else:
+                corr = _pairwise_block(values, mask, i, j)
+            yield a, b, np.clip(corr, -1.0, 1.0, out=corr)
+
+
+def _rank(x: np.ndarray) -> np.ndarray:
+    """Average ranks (1-based) of a NaN-free array, as Series.rank()."""
+    order = np.argsort(x, kind="mergesort")
+    xs = x[order]
+    starts = np.flatnonzero(np.r_[True, xs[1:] != xs[:-1]])
+    ends = np.r_[starts[1:], len(xs)]
+    # Tied values share the mean of the positions they occupy.
+    average = (starts + ends + 1) / 2.0
+    ranks = np.empty(len(x))
+    ranks[order] = np.repeat(average, ends - starts)
+    return ranks
+
+
+def _pearson(x: np.ndarray, y: np.ndarray) -> float:
+    x = x - x.mean()
+    y = y - y.mean()
+    denom = np.sqrt((x @ x) * (y @ y))
+    return float(np.clip((x @ y) / denom, -1.0, 1.0)) if denom > 0 else float("nan")
+
+
+def _tie_pairs(sorted_values: np.ndarray) -> int:
+    # Pairs of equal values, given the values sorted so ties are adjacent.
+    if len(sorted_values) == 0:
+        return 0
+    boundaries = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1], True])
+    counts = np.diff(boundaries)
+    return int((counts * (counts - 1) // 2).sum())
+
+
+def _inversions(r: np.ndarray) -> int:
+    """Pairs i < j with r[i] > r[j], by a level-by-level bottom-up merge sort."""
+    n = len(r)
+    span = np.int64(n + 1)
+    position = np.arange(n, dtype=np.int64)
+    r = r.astype(np.int64)
+    total = 0
+    width = 1
+    while width < n:
+        group = position // (2 * width)
+        right = (position // width) % 2 == 1
+        # Prefixing the group keeps each pair's runs apart in one sorted array.
+        keys = group * span + r
+        left_keys = keys[~right]
+        right_keys = keys[right]
+        at_most = np.searchsorted(left_keys, right_keys, side="right")
+        # Left runs with a right partner are full: group g's ends at (g + 1) * width.
+        left_end = (group[right] + 1) * width
+        total += int((left_end - at_most).sum())
+        keys.sort(kind="stable")
+        r = keys % span
+        width *= 2
+    return total
+
+
+def kendall_tau(x: np.ndarray, y: np.ndarray) -> float:
+    """Kendall's tau-b of two NaN-free arrays (Knight's O(n log n) algorithm)."""
+    n = len(x)
+    if n < 2:
+        return float("nan")
+    order = np.lexsort((y, x))
+    xs, ys = x[order], y[order]
+    x_ties = _tie_pairs(xs)
+    # Pairs tied in both x and y are adjacent after the lexicographic sort.
+    same = np.r_[True, (xs[1:] != xs[:-1]) | (ys[1:] != ys[:-1]), True]
+    counts = np.diff(np.flatnonzero(same))
+    joint_ties = int((counts * (counts - 1) // 2).sum())
+    y_ties = _tie_pairs(np.sort(ys))
+    codes = np.unique(ys, return_inverse=True)[1].reshape(-1)
+    discordant = _inversions(codes)
+
+    total = n * (n - 1) // 2
+    denom = np.sqrt(float(total - x_ties) * float(total - y_ties))
+    if denom == 0:
+        return float("nan")
+    tau = (total - x_ties - y_ties + joint_ties - 2 * discordant) / denom
+    return float(np.clip(tau, -1.0, 1.0))
+
+
+def _pair_value(values: np.ndarray, i: int, j: int, method: str) -> float:
+    x, y = values[:, i], values[:, j]
+    valid = ~(np.isnan(x) | np.isnan(y))
+    x, y = x[valid], y[valid]
+    if len(x) < 2:
+        return float("nan")
+    if method == "kendall":
+        return kendall_tau(x, y)
+    return _pearson(_rank(x), _rank(y))
+
+
+_worker_values: Optional[np.ndarray] = None
+
+
+def _init_pair_worker(values: np.ndarray) -> None:
+    global _worker_values
+    _worker_values = values
+
+
+def _pair_worker(task: Tuple[int, int, str]) -> float:
+    return _pair_value(_worker_values, *task)  # type: ignore[arg-type]
+
+
+def _pair_correlations(values: np.ndarray, pairs: List[Tuple[int, int]], method: str, jobs: int) -> np.ndarray:
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(pairs))
+    if jobs <= 1 or len(pairs) * values.shape[0] < PARALLEL_MIN_WORK:
+        return np.array([_pair_value(values, i, j, method) for i, j in pairs], dtype=np.float64)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    tasks = [(i, j, method) for i, j in pairs]
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_pair_worker, initargs=(values,)) as pool:
+        chunk = max(1, len(tasks) // (jobs * 4))
+        return np.fromiter(pool.map(_pair_worker, tasks, chunksize=chunk), dtype=np.float64, count=len(tasks))
+
+
+def rank_correlation_blocks(
+    df: pd.DataFrame, columns: List[str], method: str, dtype: str = "float64", jobs: int = 1
+) -> Iterator[Tuple[int, int, np.ndarray]]:
+    """Tiles like correlation_blocks for Spearman or Kendall, on up to `jobs` processes."""
+    values = np.column_stack([df[c].to_numpy(dtype=np.float64, na_value=np.nan) for c in columns])
+    width = len(columns)
+    if method == "kendall":
+        pairs = [(i, j) for i in range(width) for j in range(i + 1, width)]
+        corr = np.eye(width)
+        if pairs:
+            ii, jj = np.array(pairs).T
+            corr[ii, jj] = corr[jj, ii] = _pair_correlations(values, pairs, method, jobs)
+        yield 0, 0, corr
+        return
+
+    missing = np.isnan(values).any(axis=0)
+    ranks = {}
+    for k, col in enumerate(columns):
+        x = values[:, k]
+        valid = ~np.isnan(x)
+        ranks[col] = np.full(len(x), np.nan)
+        ranks[col][valid] = _rank(x[valid])
+    ranked = pd.DataFrame(ranks, columns=columns)
+
+    # As in DataFrame.corr(), pairs with missing values are re-ranked over shared rows.
+    pairs = [(i, j) for i in range(width) for j in range(i + 1, width) if missing[i] or missing[j]]
+    fixes = _pair_correlations(values, pairs, method, jobs) if pairs else np.empty(0)
+    fix_i = np.array([p[0] for p in pairs], dtype=np.intp)
+    fix_j = np.array([p[1] for p in pairs], dtype=np.intp)
+    del values
+
+    for a, b, corr in correlation_blocks(ranked, columns, dtype=dtype):
+        inside = (fix_i >= a) & (fix_i < a + corr.shape[0]) & (fix_j >= b) & (fix_j < b + corr.shape[1])
+        corr[fix_i[inside] - a, fix_j[inside] - b] = fixes[inside]
+        if a == b:
+            corr[fix_j[inside] - b, fix_i[inside] - a] = fixes[inside]
+        yield a, b, corr
+
+
+def _strong_pairs(
+    corr: np.ndarray, a: int, b: int, threshold: float, top_k: Optional[int]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Strict upper triangle only.
+    with np.errstate(invalid="ignore"):
+        keep = np.abs(corr) > threshold
+    if a == b:
+        keep &= np.triu(np.ones(corr.shape, dtype=bool), k=1)
+    ii, jj = np.nonzero(keep)
+    v = corr[ii, jj]
+    if top_k is not None and len(v) > top_k:
+        best = np.argpartition(-np.abs(v), top_k - 1)[:top_k]
+        ii, jj, v = ii[best], jj[best], v[best]
+    return ii + a, jj + b, v
 
 
 def find_correlations(
     df: pd.DataFrame,
     columns: Optional[List[str]] = None,
     threshold: float = 0.3,
+    stats: Optional[ColumnStats] = None,
+    top_k: Optional[int] = None,
+    include_matrix: bool = True,
+    dtype: str = "float64",
+    method: str = "pearson",
+    jobs: int = 1,
 ) -> Dict[str, Any]:
+    """Column pairs whose correlation exceeds `threshold` in absolute value, strongest first."""
+    if method not in METHODS:
+        return {"error": f"Unsupported method: {method}. Use 'pearson', 'spearman' or 'kendall'"}
     if columns is None:
-        columns = df.select_dtypes(include=[np.number]).columns.tolist()
+        columns = (stats or ColumnStats(df)).numeric_columns()
     existing_columns = [c for c in columns if c in df.columns]
     if len(existing_columns) < 2:
         return {"error": "Need at least 2 numerical columns for correlation analysis"}
 
-    corr_matrix = df[existing_columns].corr()
+    if method == "pearson":
+        blocks = correlation_blocks(df, existing_columns, dtype=dtype)
+    else:
+        blocks = rank_correlation_blocks(df, existing_columns, method, dtype=dtype, jobs=jobs)
+    result = summarize_correlations(blocks, existing_columns, threshold, top_k, include_matrix)
+    result["method"] = method
+    return result
+
+
+def summarize_correlations(
+    blocks: Iterable[Tuple[int, int, np.ndarray]],
+    columns: List[Any],
+    threshold: float,
+    top_k: Optional[int] = None,
+    include_matrix: bool = True,
+) -> Dict[str, Any]:
+    """The find_correlations result from upper-triangle tiles of the matrix."""
+    width = len(columns)
+    matrix = np.full((width, width), np.nan) if include_matrix else None
+    found: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+    for a, b, corr in blocks:
+        if matrix is not None:
+            matrix[a : a + corr.shape[0], b : b + corr.shape[1]] = corr
+            matrix[b : b + corr.shape[1], a : a + corr.shape[0]] = corr.T
+        found.append(_strong_pairs(corr, a, b, threshold, top_k))
+
+    ii = np.concatenate([f[0] for f in found])
+    jj = np.concatenate([f[1] for f in found])
+    raw = np.concatenate([f[2] for f in found])
+    rounded = np.round(raw, 3)
+    # Strongest first; ties keep the (column_1, column_2) order of the matrix.
+    order = np.lexsort((jj, ii, -np.abs(rounded)))
+    if top_k is not None:
+        order = order[:top_k]
 
     strong_correlations = []
-    for i in range(len(existing_columns)):
-        for j in range(i + 1, len(existing_columns)):
-            v = corr_matrix.iloc[i, j]
-            if not pd.isna(v) and abs(v) > threshold:
-                strength = "strong" if abs(v) > 0.7 else "moderate"
-                direction = "positive" if v > 0 else "negative"
-                strong_correlations.append(
-                    {
-                        "column_1": existing_columns[i],
-                        "column_2": existing_columns[j],
-                        "correlation": round(float(v), 3),
-                        "strength": strength,
-                        "direction": direction,
-                    }
-                )
-
-    strong_correlations.sort(key=lambda x: abs(x["correlation"]), reverse=True)
-
-    return {
-        "correlation_matrix": corr_matrix.to_dict(),
+    for k in order:
+        v = raw[k]
+        strong_correlations.append(
+            {
+                "column_1": columns[ii[k]],
+                "column_2": columns[jj[k]],
+                "correlation": float(rounded[k]),
+                "strength": "strong" if abs(v) > 0.7 else "moderate",
+                "direction": "positive" if v > 0 else "negative",
+            }
+        )
+
+    result = {
         "strong_correlations": strong_correlations,
-        "columns_analyzed": existing_columns,
+        "columns_analyzed": columns,
         "threshold": threshold,
     }
+    if matrix is not None:
+        np.fill_diagonal(matrix, [1.0 if np.isfinite(matrix[k, k]) else np.nan for k in range(width)])
+        result = {
+            "correlation_matrix": pd.DataFrame(matrix, index=columns, columns=columns).to_dict(),
+            **result,
+        }
+    return result
@@ -0,0 +1,48 @@
+import pandas as pd
+from typing import Dict, Any, List, Optional
+
+from ..utils.dtypes import display_dtype
+from .column_stats import ColumnStats
+
+_SUMMARY_INDEX = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+
+
+def describe_dataframe(df: pd.DataFrame, stats: Optional[ColumnStats] = None) -> Dict[str, Any]:
+    stats = stats or ColumnStats(df)
+    columns: List[Dict[str, Any]] = []
+    for col in df.columns:
+        columns.append(
+            {
+                "column": col,
+                "dtype": display_dtype(df[col]),
+                "non_null": stats.non_null(col),
+                "null_percentage": float(stats.null_percentage(col)),
+            }
+        )
+
+    # Same rows as df.describe(include="number"), built from the shared stats.
+    numeric_summary = None
+    numeric = stats.numeric_columns()
+    if numeric:
+        numeric_summary = pd.DataFrame(
+            {
+                col: [
+                    stats.non_null(col),
+                    stats.mean(col),
+                    stats.std(col),
+                    stats.min(col),
+                    *stats.quartiles(col).values(),
+                    stats.max(col),
+                ]
+                for col in numeric
+            },
+            index=_SUMMARY_INDEX,
+            dtype="float64",
+        )
+
+    return {
+        "rows": int(df.shape[0]),
+        "column_count": int(df.shape[1]),
+        "columns": columns,
+        "numeric_summary": numeric_summary,
+    }
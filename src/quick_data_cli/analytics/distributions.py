@@ -1,43 +1,51 @@
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from ..utils.dtypes import display_dtype
+from .column_stats import ColumnStats
 
 
-def analyze_distributions(df: pd.DataFrame, column_name: str) -> Dict[str, Any]:
+def analyze_distributions(
+    df: pd.DataFrame,
+    column_name: str,
+    stats: Optional[ColumnStats] = None,
+) -> Dict[str, Any]:
     if column_name not in df.columns:
         return {"error": f"Column '{column_name}' not found"}
 
+    stats = stats or ColumnStats(df)
     s = df[column_name]
     result: Dict[str, Any] = {
         "column": column_name,
         "dtype": display_dtype(s),
         "total_values": int(len(s)),
-        "unique_values": int(s.nunique()),
-        "null_values": int(s.isnull().sum()),
-        "null_percentage": round(float(s.isnull().mean() * 100), 2),
+        "unique_values": stats.nunique(column_name),
+        "null_values": stats.null_count(column_name),
+        "null_percentage": round(float(stats.null_percentage(column_name)), 2),
     }
 
     if pd.api.types.is_numeric_dtype(s):
+        has_values = stats.non_null(column_name) > 0
+        quartiles = stats.quartiles(column_name) if has_values else {}
         result.update(
             {
                 "distribution_type": "numerical",
-                "mean": round(float(s.mean()), 3) if len(s.dropna()) else 0.0,
-                "median": round(float(s.median()), 3) if len(s.dropna()) else 0.0,
-                "std": round(float(s.std()), 3) if len(s.dropna()) else 0.0,
-                "min": float(s.min()) if len(s.dropna()) else 0.0,
-                "max": float(s.max()) if len(s.dropna()) else 0.0,
+                "mean": round(stats.mean(column_name), 3) if has_values else 0.0,
+                "median": round(stats.median(column_name), 3) if has_values else 0.0,
+                "std": round(stats.std(column_name), 3) if has_values else 0.0,
+                "min": float(stats.min(column_name)) if has_values else 0.0,
+                "max": float(stats.max(column_name)) if has_values else 0.0,
                 "quartiles": {
-                    "q25": round(float(s.quantile(0.25)), 3) if len(s.dropna()) else 0.0,
-                    "q50": round(float(s.quantile(0.50)), 3) if len(s.dropna()) else 0.0,
-                    "q75": round(float(s.quantile(0.75)), 3) if len(s.dropna()) else 0.0,
+                    "q25": round(quartiles[0.25], 3) if has_values else 0.0,
+                    "q50": round(quartiles[0.5], 3) if has_values else 0.0,
+                    "q75": round(quartiles[0.75], 3) if has_values else 0.0,
                 },
-                "skewness": round(float(s.skew()), 3) if len(s.dropna()) else 0.0,
-                "kurtosis": round(float(s.kurtosis()), 3) if len(s.dropna()) else 0.0,
+                "skewness": round(stats.skew(column_name), 3) if has_values else 0.0,
+                "kurtosis": round(stats.kurtosis(column_name), 3) if has_values else 0.0,
             }
         )
     else:
-        value_counts = s.value_counts().head(10)
+        value_counts = stats.value_counts(column_name).head(10)
         result.update(
             {
                 "distribution_type": "categorical",
@@ -2,66 +2,121 @@ import pandas as pd
 import numpy as np
 from typing import List, Optional, Dict, Any
 
+from .column_stats import ColumnStats, QUARTILES, TILE_ROWS, nan_moments, nan_quartiles
+
+METHODS = ("iqr", "zscore")
+
+# Bytes of float64 converted per block of columns.
+BLOCK_BYTES = 1 << 27
+SAMPLE_VALUES = 10
+
+
+def _columns(block: np.ndarray, todo: List[int]) -> np.ndarray:
+    return block if len(todo) == block.shape[1] else block[:, todo]
+
+
+def _block_bounds(stats: ColumnStats, block: np.ndarray, names: List[Any], counts: np.ndarray, method: str):
+    """Per-column bounds, computing only the statistics `stats` lacks."""
+    if method == "iqr":
+        todo = [j for j, col in enumerate(names) if counts[j] and not stats.cached("quartiles", col)]
+        if todo:
+            q = nan_quartiles(_columns(block, todo), counts[todo])
+            stats.prime(
+                "quartiles", {names[j]: {p: float(v) for p, v in zip(QUARTILES, q[:, k])} for k, j in enumerate(todo)}
+            )
+        q1 = np.array([stats.quartiles(col)[0.25] if n else np.nan for col, n in zip(names, counts)])
+        q3 = np.array([stats.quartiles(col)[0.75] if n else np.nan for col, n in zip(names, counts)])
+        iqr = q3 - q1
+        return q1 - 1.5 * iqr, q3 + 1.5 * iqr, None, None
+
+    todo = [
+        j for j, col in enumerate(names) if counts[j] and not (stats.cached("mean", col) and stats.cached("std", col))
+    ]
+    if todo:
+        mean, std = nan_moments(_columns(block, todo), counts[todo])
+        stats.prime("mean", {names[j]: float(mean[k]) for k, j in enumerate(todo)})
+        stats.prime("std", {names[j]: float(std[k]) for k, j in enumerate(todo)})
+    mean = np.array([stats.mean(col) if n else np.nan for col, n in zip(names, counts)])
+    std = np.array([stats.std(col) if n else np.nan for col, n in zip(names, counts)])
+    usable = (std != 0) & ~np.isnan(std)
+    lower = np.where(usable, mean - 3 * std, mean)
+    upper = np.where(usable, mean + 3 * std, mean)
+    return lower, upper, mean, np.where(usable, std, np.nan)
+
+
+def _block_masks(block: np.ndarray, lower, upper, mean, std) -> np.ndarray:
+    """Outlier mask of the block, tile by tile into reused buffers."""
+    mask = np.empty(block.shape, dtype=bool, order="F")
+    work = np.empty((min(TILE_ROWS, len(block)), block.shape[1]), order="F")
+    above = np.empty(work.shape, dtype=bool, order="F")
+    for start in range(0, len(block), TILE_ROWS):
+        rows = block[start : start + TILE_ROWS]
+        out = mask[start : start + TILE_ROWS]
+        if mean is None:
+            np.less(rows, lower, out=out)
+            np.greater(rows, upper, out=above[: len(rows)])
+            out |= above[: len(rows)]
+            continue
+        # Same arithmetic as |(x - mean) / std| > 3; a NaN std flags nothing.
+        z = work[: len(rows)]
+        np.subtract(rows, mean, out=z)
+        np.abs(z, out=z)
+        np.divide(z, std, out=z)
+        np.greater(z, 3, out=out)
+    return mask
+
 
 def detect_outliers(
     df: pd.DataFrame,
     columns: Optional[List[str]] = None,
     method: str = "iqr",
+    stats: Optional[ColumnStats] = None,
 ) -> Dict[str, Any]:
+    """Flag values beyond 1.5 IQR ("iqr") or 3 standard deviations ("zscore")."""
+    stats = stats or ColumnStats(df)
     if columns is None:
-        columns = df.select_dtypes(include=[np.number]).columns.tolist()
+        columns = stats.numeric_columns()
     existing = [c for c in (columns or []) if c in df.columns]
     if not existing:
         return {"error": "No numerical columns found for outlier detection"}
+    if method not in METHODS:
+        return {"error": f"Unsupported method: {method}. Use 'iqr' or 'zscore'"}
 
     outliers_info: Dict[str, Any] = {}
     total = 0
 
-    for col in existing:
-        series = df[col].dropna()
-        if series.empty:
+    width = max(1, BLOCK_BYTES // max(1, 8 * len(df)))
+    for start in range(0, len(existing), width):
+        names = existing[start : start + width]
+        block = np.asfortranarray(df[names].to_numpy(dtype=np.float64, na_value=np.nan))
+        counts = len(df) - np.count_nonzero(np.isnan(block), axis=0)
+        lower, upper, mean, std = _block_bounds(stats, block, names, counts, method)
+        mask = _block_masks(block, lower, upper, mean, std)
+        found = np.count_nonzero(mask, axis=0)
+
+        for j, col in enumerate(names):
+            if counts[j] == 0:
+                outliers_info[col] = {
+                    "outlier_count": 0,
+                    "outlier_percentage": 0.0,
+                    "lower_bound": None,
+                    "upper_bound": None,
+                    "outlier_values": [],
+                    "method": method,
+                }
+                continue
+
+            count = int(found[j])
+            total += count
+            rows = np.flatnonzero(mask[:, j])[:SAMPLE_VALUES] if count else []
             outliers_info[col] = {
-                "outlier_count": 0,
-                "outlier_percentage": 0.0,
-                "lower_bound": None,
-                "upper_bound": None,
-                "outlier_values": [],
+                "outlier_count": count,
+                "outlier_percentage": round(count / max(1, int(counts[j])) * 100, 2),
+                "lower_bound": round(float(lower[j]), 3),
+                "upper_bound": round(float(upper[j]), 3),
+                "outlier_values": df[col].iloc[rows].tolist(),
                 "method": method,
             }
-            continue
-
-        if method == "iqr":
-            q1 = series.quantile(0.25)
-            q3 = series.quantile(0.75)
-            iqr = q3 - q1
-            lower = q1 - 1.5 * iqr
-            upper = q3 + 1.5 * iqr
-            mask = (df[col] < lower) | (df[col] > upper)
-            outs = df.loc[mask, col]
-        elif method == "zscore":
-            std = series.std()
-            if std == 0 or np.isnan(std):
-                outs = series.iloc[0:0]
-                lower = float(series.mean())
-                upper = float(series.mean())
-            else:
-                z = np.abs((series - series.mean()) / std)
-                outs = series[z > 3]
-                lower = float(series.mean() - 3 * std)
-                upper = float(series.mean() + 3 * std)
-        else:
-            return {"error": f"Unsupported method: {method}. Use 'iqr' or 'zscore'"}
-
-        count = int(len(outs))
-        total += count
-        outliers_info[col] = {
-            "outlier_count": count,
-            "outlier_percentage": round(count / max(1, len(series)) * 100, 2),
-            "lower_bound": None if lower is None else round(float(lower), 3),
-            "upper_bound": None if upper is None else round(float(upper), 3),
-            "outlier_values": outs.head(10).tolist(),
-            "method": method,
-        }
 
     return {
         "method": method,
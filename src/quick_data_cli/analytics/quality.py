@@ -1,16 +1,43 @@
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Set, Tuple
 
+from .column_stats import ColumnStats
 
-def validate_data_quality(df: pd.DataFrame) -> Dict[str, Any]:
+
+def validate_data_quality(df: pd.DataFrame, stats: Optional[ColumnStats] = None) -> Dict[str, Any]:
+    stats = stats or ColumnStats(df)
     missing_data: Dict[str, float] = {}
     for col in df.columns:
-        pct = df[col].isnull().mean() * 100
+        pct = stats.null_percentage(col)
         if pct > 0:
             missing_data[col] = round(float(pct), 2)
 
     duplicate_rows = int(df.duplicated().sum())
 
+    mixed_types: List[Tuple[str, Set[str]]] = []
+    object_cols = df.select_dtypes(include=["object"]).columns
+    for col in object_cols:
+        sample_types = set(type(x).__name__ for x in df[col].dropna().head(100))
+        if len(sample_types) > 1:
+            mixed_types.append((col, sample_types))
+
+    return build_quality_report(
+        total_rows=int(len(df)),
+        total_columns=int(len(df.columns)),
+        missing_data=missing_data,
+        duplicate_rows=duplicate_rows,
+        mixed_types=mixed_types,
+    )
+
+
+def build_quality_report(
+    total_rows: int,
+    total_columns: int,
+    missing_data: Dict[str, float],
+    duplicate_rows: Optional[int],
+    mixed_types: List[Tuple[str, Set[str]]],
+) -> Dict[str, Any]:
+    # duplicate_rows is None when duplicates were not computed (streaming mode).
     issues = []
     recommendations = []
 
@@ -21,20 +48,17 @@ def validate_data_quality(df: pd.DataFrame) -> Dict[str, Any]:
             "Consider dropping columns with >50% missing data or investigate data collection process"
         )
 
-    if duplicate_rows > 0:
+    if duplicate_rows:
         issues.append(f"{duplicate_rows} duplicate rows found")
         recommendations.append("Remove duplicate rows or investigate if duplicates are intentional")
 
-    object_cols = df.select_dtypes(include=["object"]).columns
-    for col in object_cols:
-        sample_types = set(type(x).__name__ for x in df[col].dropna().head(100))
-        if len(sample_types) > 1:
-            issues.append(f"Mixed data types in column '{col}': {sample_types}")
-            recommendations.append(f"Standardize data types in column '{col}'")
+    for col, sample_types in mixed_types:
+        issues.append(f"Mixed data types in column '{col}': {sample_types}")
+        recommendations.append(f"Standardize data types in column '{col}'")
 
     score = 100.0
     score -= len(missing_data) * 5
-    score -= (duplicate_rows / max(1, len(df))) * 20
+    score -= ((duplicate_rows or 0) / max(1, total_rows)) * 20
     score -= len([col for col, pct in missing_data.items() if pct > 10]) * 10
     score = max(0.0, score)
 
@@ -42,8 +66,8 @@ def validate_data_quality(df: pd.DataFrame) -> Dict[str, Any]:
         recommendations.append("Data quality looks good! Proceed with analysis.")
 
     return {
-        "total_rows": int(len(df)),
-        "total_columns": int(len(df.columns)),
+        "total_rows": total_rows,
+        "total_columns": total_columns,
         "missing_data": missing_data,
         "duplicate_rows": duplicate_rows,
         "potential_issues": issues,
@@ -0,0 +1,78 @@
+import json
+import math
+import time
+import pandas as pd
+import numpy as np
+from typing import Any, Dict, List, Optional
+
+from .column_stats import ColumnStats
+from .correlations import find_correlations
+from .describe import describe_dataframe
+from .distributions import analyze_distributions
+from .outliers import detect_outliers
+from .quality import validate_data_quality
+
+ANALYSES = ("describe", "quality", "correlations", "outliers", "distributions")
+
+
+def analyze_dataset(
+    df: pd.DataFrame,
+    analyses: Optional[List[str]] = None,
+    columns: Optional[List[str]] = None,
+    threshold: float = 0.3,
+    method: str = "iqr",
+) -> Dict[str, Any]:
+    analyses = list(analyses or ANALYSES)
+    unknown = [a for a in analyses if a not in ANALYSES]
+    if unknown:
+        return {"error": f"Unknown analyses: {', '.join(unknown)}. Choose from {', '.join(ANALYSES)}"}
+
+    # One stats cache for every analysis: nulls, moments, quartiles and
+    # distinct counts are computed once per column.
+    stats = ColumnStats(df)
+    results: Dict[str, Any] = {}
+    timings: Dict[str, float] = {}
+    for name in analyses:
+        start = time.perf_counter()
+        if name == "describe":
+            results[name] = describe_dataframe(df, stats=stats)
+        elif name == "quality":
+            results[name] = validate_data_quality(df, stats=stats)
+        elif name == "correlations":
+            results[name] = find_correlations(df, columns=columns, threshold=threshold, stats=stats)
+        elif name == "outliers":
+            results[name] = detect_outliers(df, columns=columns, method=method, stats=stats)
+        elif name == "distributions":
+            targets = [c for c in (columns or df.columns) if c in df.columns]
+            results[name] = {str(c): analyze_distributions(df, c, stats=stats) for c in targets}
+        timings[name] = time.perf_counter() - start
+
+    return {
+        "rows": int(len(df)),
+        "column_count": int(len(df.columns)),
+        "analyses": results,
+        "timings": timings,
+    }
+
+
+def _jsonable(obj: Any) -> Any:
+    if isinstance(obj, pd.DataFrame):
+        return _jsonable(obj.to_dict())
+    if isinstance(obj, dict):
+        return {str(k): _jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set)):
+        return [_jsonable(v) for v in (sorted(obj, key=str) if isinstance(obj, set) else obj)]
+    if isinstance(obj, np.generic):
+        return _jsonable(obj.item())
+    if isinstance(obj, float) and not math.isfinite(obj):
+        # Strict JSON has no NaN/Infinity.
+        return None
+    if isinstance(obj, (pd.Timestamp, pd.Timedelta)):
+        return str(obj)
+    if obj is None or isinstance(obj, (str, int, float, bool)):
+        return obj
+    return str(obj)
+
+
+def report_to_json(report: Dict[str, Any]) -> str:
+    return json.dumps(_jsonable(report), indent=2)
@@ -17,11 +17,11 @@ def segment_by_column(
         numerical_cols.remove(column_name)
 
     if not numerical_cols:
-        segments = df.groupby(column_name).size().to_frame("count")
+        segments = df.groupby(column_name, observed=True).size().to_frame("count")
         segments = segments.sort_values("count", ascending=False).head(top_n)
     else:
         agg_dict = {col: ["count", "mean", "sum", "std"] for col in numerical_cols}
-        segments = df.groupby(column_name).agg(agg_dict)
+        segments = df.groupby(column_name, observed=True).agg(agg_dict)
         segments.columns = ["_".join(col).strip() for col in segments.columns]
         if len(segments.columns) > 0:
             segments = segments.sort_values(by=segments.columns[0], ascending=False)
@@ -31,7 +31,7 @@ def segment_by_column(
     if "count" in segments.columns:
         segments["percentage"] = (segments["count"] / total_rows * 100).round(2)
     else:
-        counts = df.groupby(column_name).size()
+        counts = df.groupby(column_name, observed=True).size()
         segments["count"] = counts
         segments["percentage"] = (counts / total_rows * 100).round(2)
 
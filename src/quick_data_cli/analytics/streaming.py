@@ -0,0 +1,399 @@
+import os
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Union
+
+from ..config.settings import settings
+from ..utils.dtypes import display_dtype
+from ..utils.filters import RowFilter
+from .correlations import summarize_correlations
+from .quality import build_quality_report
+
+_TYPE_SAMPLE_SIZE = 100
+
+
+def _is_describable(s: pd.Series) -> bool:
+    # Mirrors df.describe(include="number"), which leaves out booleans.
+    return pd.api.types.is_numeric_dtype(s.dtype) and not pd.api.types.is_bool_dtype(s.dtype)
+
+
+class ColumnAccumulator:
+    """Mergeable per-column counts and moments for chunked inputs."""
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.non_null = 0
+        self.dtypes: List[str] = []
+        self.numeric = True
+        self.saw_object = False
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.sample_types: List[str] = []
+
+    def update(self, s: pd.Series) -> None:
+        non_null = s.dropna()
+        self.rows += len(s)
+        self.non_null += len(non_null)
+
+        # An all-null chunk parses as float64 and says nothing about the dtype.
+        if len(non_null):
+            dtype = display_dtype(s)
+            if dtype not in self.dtypes:
+                self.dtypes.append(dtype)
+        if pd.api.types.is_object_dtype(s.dtype):
+            self.saw_object = True
+        if len(self.sample_types) < _TYPE_SAMPLE_SIZE:
+            head = non_null.head(_TYPE_SAMPLE_SIZE - len(self.sample_types))
+            self.sample_types.extend(type(x).__name__ for x in head.tolist())
+
+        if not self.numeric:
+            return
+        if len(non_null) and not _is_describable(s):
+            self.numeric = False
+            return
+        if not len(non_null):
+            return
+
+        values = non_null.to_numpy(dtype=np.float64)
+        other = ColumnAccumulator()
+        other.count = len(values)
+        other.mean = float(values.mean())
+        other.m2 = float(((values - other.mean) ** 2).sum())
+        other.min = float(values.min())
+        other.max = float(values.max())
+        self._merge_moments(other)
+
+    def merge(self, other: "ColumnAccumulator") -> None:
+        self.rows += other.rows
+        self.non_null += other.non_null
+        for dtype in other.dtypes:
+            if dtype not in self.dtypes:
+                self.dtypes.append(dtype)
+        self.saw_object = self.saw_object or other.saw_object
+        room = _TYPE_SAMPLE_SIZE - len(self.sample_types)
+        self.sample_types.extend(other.sample_types[:room])
+        if not other.numeric:
+            self.numeric = False
+        if self.numeric:
+            self._merge_moments(other)
+
+    def _merge_moments(self, other: "ColumnAccumulator") -> None:
+        # Chan et al. pairwise update, exact across any split of the rows.
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return
+        n = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / n
+        self.m2 += other.m2 + delta * delta * self.count * other.count / n
+        self.count = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def dtype(self) -> str:
+        if not self.dtypes:
+            return "float"
+        if len(self.dtypes) == 1:
+            return self.dtypes[0]
+        if set(self.dtypes) == {"int", "float"}:
+            return "float"
+        return "object"
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else float("nan")
+
+
+class FrameAccumulator:
+    """Per-column accumulators for a stream of DataFrame chunks."""
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.columns: Dict[str, ColumnAccumulator] = {}
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        for col in chunk.columns:
+            if col not in self.columns:
+                self.columns[col] = ColumnAccumulator()
+            self.columns[col].update(chunk[col])
+        self._add_rows(len(chunk))
+
+    def merge(self, other: "FrameAccumulator") -> None:
+        for col, acc in other.columns.items():
+            if col not in self.columns:
+                self.columns[col] = ColumnAccumulator()
+            self.columns[col].merge(acc)
+        self._add_rows(other.rows)
+
+    def _add_rows(self, n: int) -> None:
+        # Columns absent from some chunks count those rows as nulls.
+        self.rows += n
+        for acc in self.columns.values():
+            acc.rows = self.rows
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[pd.DataFrame]) -> "FrameAccumulator":
+        acc = cls()
+        for chunk in chunks:
+            acc.update(chunk)
+        return acc
+
+
+def describe_stream(chunks: Iterable[pd.DataFrame]) -> Dict[str, Any]:
+    acc = FrameAccumulator.from_chunks(chunks)
+
+    columns = []
+    numeric: Dict[str, Dict[str, float]] = {}
+    for col, c in acc.columns.items():
+        columns.append(
+            {
+                "column": col,
+                "dtype": c.dtype,
+                "non_null": c.non_null,
+                "null_percentage": (1 - c.non_null / acc.rows) * 100 if acc.rows else 0.0,
+            }
+        )
+        if c.numeric and c.count:
+            numeric[col] = {
+                "count": c.count,
+                "mean": c.mean,
+                "std": c.std,
+                "min": c.min,
+                "max": c.max,
+            }
+
+    return {
+        "rows": acc.rows,
+        "column_count": len(acc.columns),
+        "columns": columns,
+        "numeric_summary": numeric,
+    }
+
+
+def validate_data_quality_stream(chunks: Iterable[pd.DataFrame]) -> Dict[str, Any]:
+    acc = FrameAccumulator.from_chunks(chunks)
+
+    missing_data: Dict[str, float] = {}
+    mixed_types = []
+    for col, c in acc.columns.items():
+        pct = (1 - c.non_null / acc.rows) * 100 if acc.rows else 0.0
+        if pct > 0:
+            missing_data[col] = round(float(pct), 2)
+        sample_types = set(c.sample_types)
+        if c.saw_object and len(sample_types) > 1:
+            mixed_types.append((col, sample_types))
+
+    # Exact duplicate detection needs every row hash in memory, which the
+    # streaming mode exists to avoid.
+    report = build_quality_report(
+        total_rows=acc.rows,
+        total_columns=len(acc.columns),
+        missing_data=missing_data,
+        duplicate_rows=None,
+        mixed_types=mixed_types,
+    )
+    report["streamed"] = True
+    return report
+
+
+class CorrelationAccumulator:
+    """Mergeable pairwise co-moments for Pearson correlation over chunks.
+
+    For every pair (i, j) it keeps the count of rows where both are
+    present, column i's mean and squared deviations over those rows, and
+    the co-moment; column j's figures are the transposed entries. That is
+    what DataFrame.corr() uses, so missing values are handled pairwise.
+    Chunks are reduced with matrix products and folded in with the Chan et
+    al. update, which is exact for any split of the rows, so accumulators
+    built from different chunks, files or processes merge to the same
+    result. Memory is four (columns x columns) arrays, whatever the row
+    count.
+    """
+
+    def __init__(self, columns: Optional[List[Any]] = None) -> None:
+        # With explicit columns those are correlated whatever their dtype;
+        # otherwise numeric columns are picked up as they appear.
+        self.fixed = columns is not None
+        self.columns: List[Any] = []
+        self.non_numeric: set = set()
+        self.n = np.zeros((0, 0))
+        self.mean = np.zeros((0, 0))
+        self.m2 = np.zeros((0, 0))
+        self.comoment = np.zeros((0, 0))
+        # Largest magnitude per column, to tell rounding residue from spread.
+        self.scale = np.zeros(0)
+        if columns:
+            self._add_columns(list(dict.fromkeys(columns)))
+
+    def _add_columns(self, names: List[Any]) -> None:
+        grow = len(names)
+        pad = ((0, grow), (0, grow))
+        self.n = np.pad(self.n, pad)
+        self.mean = np.pad(self.mean, pad)
+        self.m2 = np.pad(self.m2, pad)
+        self.comoment = np.pad(self.comoment, pad)
+        self.scale = np.pad(self.scale, (0, grow))
+        self.columns.extend(names)
+
+    def _chunk_columns(self, chunk: pd.DataFrame) -> List[Any]:
+        if self.fixed:
+            return [c for c in self.columns if c in chunk.columns]
+        names = []
+        for col in chunk.columns:
+            if col in self.non_numeric:
+                continue
+            s = chunk[col]
+            if _is_describable(s) or not s.notna().any():
+                names.append(col)
+            else:
+                self.non_numeric.add(col)
+        new = [c for c in names if c not in self.columns]
+        if new:
+            self._add_columns(new)
+        return names
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        names = self._chunk_columns(chunk)
+        if not names or not len(chunk):
+            return
+        x = np.column_stack([chunk[c].to_numpy(dtype=np.float64, na_value=np.nan) for c in names])
+        valid = ~np.isnan(x)
+        counts = valid.sum(axis=0)
+        # Centre on the chunk's column means so the sums below do not cancel.
+        shift = np.divide(np.where(valid, x, 0.0).sum(axis=0), counts, out=np.zeros(len(names)), where=counts > 0)
+        x = np.where(valid, x - shift, 0.0)
+
+        if valid.all():
+            rows = float(len(chunk))
+            n = np.full((len(names), len(names)), rows)
+            sx = np.repeat(x.sum(axis=0)[:, None], len(names), axis=1)
+            sxx = np.repeat((x * x).sum(axis=0)[:, None], len(names), axis=1)
+        else:
+            m = valid.astype(np.float64)
+            n = m.T @ m
+            sx = x.T @ m
+            sxx = (x * x).T @ m
+        sxy = x.T @ x
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = np.where(n > 0, sx / n, 0.0)
+            m2 = np.where(n > 0, np.maximum(sxx - sx * mean, 0.0), 0.0)
+            comoment = np.where(n > 0, sxy - sx * mean.T, 0.0)
+
+        idx = [self.columns.index(c) for c in names]
+        self._merge_block(np.ix_(idx, idx), n, mean + shift[:, None], m2, comoment)
+        peaks = np.max(np.abs(x + shift), axis=0, initial=0.0, where=valid)
+        self.scale[idx] = np.maximum(self.scale[idx], peaks)
+
+    def _merge_block(self, at, n_b, mean_b, m2_b, comoment_b) -> None:
+        n_a, mean_a = self.n[at], self.mean[at]
+        n = n_a + n_b
+        share = np.divide(n_b, n, out=np.zeros_like(n), where=n > 0)
+        weight = n_a * share
+        delta = mean_b - mean_a
+        self.mean[at] = mean_a + delta * share
+        self.m2[at] = self.m2[at] + m2_b + delta * delta * weight
+        self.comoment[at] = self.comoment[at] + comoment_b + delta * delta.T * weight
+        self.n[at] = n
+
+    def merge(self, other: "CorrelationAccumulator") -> None:
+        self.non_numeric |= other.non_numeric
+        new = [c for c in other.columns if c not in self.columns]
+        if new:
+            self._add_columns(new)
+        idx = [self.columns.index(c) for c in other.columns]
+        self._merge_block(np.ix_(idx, idx), other.n, other.mean, other.m2, other.comoment)
+        self.scale[idx] = np.maximum(self.scale[idx], other.scale)
+
+    def correlation(self) -> pd.DataFrame:
+        """The Pearson correlation matrix, NaN where a pair shares fewer than
+        two rows or either column is constant over the shared rows."""
+        keep = [k for k, c in enumerate(self.columns) if c not in self.non_numeric]
+        at = np.ix_(keep, keep)
+        n, m2, comoment = self.n[at], self.m2[at], self.comoment[at]
+        scale = self.scale[keep]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = comoment / np.sqrt(m2 * m2.T)
+        # A constant column keeps only rounding residue from its centring.
+        floor = n * (16 * np.finfo(np.float64).eps * scale[:, None]) ** 2
+        corr[(n < 2) | (m2 <= floor) | (m2.T <= floor.T)] = np.nan
+        np.clip(corr, -1.0, 1.0, out=corr)
+        names = [self.columns[k] for k in keep]
+        return pd.DataFrame(corr, index=names, columns=names)
+
+    @classmethod
+    def from_chunks(
+        cls, chunks: Iterable[pd.DataFrame], columns: Optional[List[Any]] = None
+    ) -> "CorrelationAccumulator":
+        acc = cls(columns)
+        for chunk in chunks:
+            acc.update(chunk)
+        return acc
+
+
+def _correlation_worker(
+    p: Path,
+    columns: Optional[List[Any]],
+    chunksize: int,
+    filters: Sequence[RowFilter],
+    overrides: Dict[str, Any],
+) -> CorrelationAccumulator:
+    from ..utils.loader import iter_chunks
+
+    # Workers may be spawned rather than forked; see loader._load_worker.
+    for key, value in overrides.items():
+        setattr(settings, key, value)
+    return CorrelationAccumulator.from_chunks(iter_chunks(p, chunksize, columns, filters), columns)
+
+
+def accumulate_correlations(
+    file_path: Union[str, Path],
+    columns: Optional[List[Any]] = None,
+    chunksize: int = 100_000,
+) -> CorrelationAccumulator:
+    """Stream every input file in chunks, one process per file (up to
+    settings.jobs), and merge the per-file accumulators in file order."""
+    from concurrent.futures import ProcessPoolExecutor
+    from itertools import repeat
+    from ..utils.loader import expand_inputs
+
+    paths = expand_inputs(file_path)
+    filters = settings.row_filters
+    overrides = {"add_source_column": settings.add_source_column, "show_schema": settings.show_schema}
+    jobs = min(settings.jobs if settings.jobs > 0 else (os.cpu_count() or 1), len(paths))
+    if jobs <= 1:
+        parts = [_correlation_worker(p, columns, chunksize, filters, overrides) for p in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            parts = list(
+                pool.map(
+                    _correlation_worker, paths, repeat(columns), repeat(chunksize), repeat(filters), repeat(overrides)
+                )
+            )
+    acc = CorrelationAccumulator(columns)
+    for part in parts:
+        acc.merge(part)
+    return acc
+
+
+def find_correlations_stream(
+    acc: CorrelationAccumulator,
+    threshold: float = 0.3,
+    top_k: Optional[int] = None,
+    include_matrix: bool = True,
+) -> Dict[str, Any]:
+    corr = acc.correlation()
+    if len(corr.columns) < 2:
+        return {"error": "Need at least 2 numerical columns for correlation analysis"}
+    columns = list(corr.columns)
+    result = summarize_correlations([(0, 0, corr.to_numpy())], columns, threshold, top_k, include_matrix)
+    result["streamed"] = True
+    return result
@@ -1,33 +1,191 @@
+import importlib
+from pathlib import Path
 import typer
+import typer.main
+from typer.core import TyperCommand, TyperGroup
+from typing import Any, Dict, List, Optional, Tuple
 from .cli_config import CLI_CONTEXT_SETTINGS
+from .config.settings import settings
+
+# Command modules are imported only when their command runs, so `--help`
+# and light commands never pay for pandas, plotly or rich tables they do not
+# use. The help text here is what the top-level listing shows; it must match
+# each module's register().
+LAZY_COMMANDS: Dict[str, Tuple[str, str]] = {
+    "describe": (
+        "describe_cmd",
+        "Get an overview of the dataset: shape, column types, missing values, and basic statistics.",
+    ),
+    "correlations": (
+        "correlations_cmd",
+        "Identify relationships between numerical columns and show strong correlations.",
+    ),
+    "segment": (
+        "segment_cmd",
+        "Group data by a categorical column and compute aggregate stats for numerical columns.",
+    ),
+    "distributions": (
+        "distributions_cmd",
+        "Analyze a column: show numerical stats or categorical frequency counts.",
+    ),
+    "detect-outliers": (
+        "detect_outliers_cmd",
+        "Find anomalies in your data using IQR (default) or Z-score.",
+    ),
+    "time-series": (
+        "time_series_cmd",
+        "Analyze trends over time using a date column and a numerical value column.",
+    ),
+    "validate-quality": (
+        "validate_quality_cmd",
+        "Run data health checks (missing values, duplicates, mixed types) and return a quality score.",
+    ),
+    "analyze": (
+        "analyze_cmd",
+        "Run several analyses over one load with shared column statistics and write a combined JSON report.",
+    ),
+    "chart": (
+        "chart_cmd",
+        "Generate interactive Plotly charts and save them as HTML.",
+    ),
+    "execute": (
+        "execute_cmd",
+        "Run a custom Python script against the loaded dataset (available as a pandas DataFrame `df`).\n\n"
+        "Numeric, datetime, categorical and nullable columns are shared through memory without copying. Text "
+        "columns are shared as codes plus their distinct values, so each worker rebuilds only those values "
+        "and one pointer per row; other object columns are copied into every worker.",
+    ),
+    "serve": (
+        "serve_cmd",
+        "Run a local daemon that keeps loaded datasets in memory for later commands.",
+    ),
+    "status": (
+        "serve_cmd",
+        "Show the daemon's resident datasets and memory use.",
+    ),
+    "cache": (
+        "cache_cmd",
+        "Inspect and manage the columnar load cache and the result cache.",
+    ),
+}
+
+
+def load_command(name: str) -> Any:
+    """Import a command's module and build the real click command for it."""
+    module_name, _ = LAZY_COMMANDS[name]
+    module = importlib.import_module(f"{__package__}.commands.{module_name}")
+    holder = typer.Typer()
+    module.register(holder)
+    group = typer.main.get_group(holder)
+    return group.get_command(None, name)
+
+
+class LazyCommand(TyperCommand):
+    """Placeholder listed in help; parsing and running switch to the real command."""
+
+    def __init__(self, name: str, help: str):
+        super().__init__(name, help=help)
+
+    def make_context(self, info_name: Optional[str], args: List[str], parent: Any = None, **extra: Any) -> Any:
+        return load_command(self.name).make_context(info_name, args, parent=parent, **extra)
+
+
+class LazyGroup(TyperGroup):
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        for name, (_, help) in LAZY_COMMANDS.items():
+            self.add_command(LazyCommand(name, help))
+
 
 app = typer.Typer(
+    cls=LazyGroup,
     context_settings=CLI_CONTEXT_SETTINGS,
     name="quick-data",
-    help="A CLI for quick, intelligent data analysis on any CSV or JSON file."
+    help="A CLI for quick, intelligent data analysis on any CSV, JSON or Parquet file."
 )
 
-from .commands import (
-    describe_cmd,
-    correlations_cmd,
-    segment_cmd,
-    distributions_cmd,
-    detect_outliers_cmd,
-    time_series_cmd,
-    validate_quality_cmd,
-    chart_cmd,
-    execute_cmd,
-)
 
-describe_cmd.register(app)
-correlations_cmd.register(app)
-segment_cmd.register(app)
-distributions_cmd.register(app)
-detect_outliers_cmd.register(app)
-time_series_cmd.register(app)
-validate_quality_cmd.register(app)
-chart_cmd.register(app)
-execute_cmd.register(app)
+@app.callback()
+def configure(
+    ctx: typer.Context,
+    show_schema: bool = typer.Option(False, "--show-schema", help="Print the schema inferred for CSV inputs"),
+    csv_engine: str = typer.Option(settings.csv_engine, "--csv-engine", help="CSV parser: c or pyarrow"),
+    optimize_memory: bool = typer.Option(
+        settings.optimize_memory,
+        "--optimize-memory",
+        help="Downcast integers and store repeated strings as categoricals after loading",
+    ),
+    jobs: int = typer.Option(
+        settings.jobs, "--jobs", "-j", help="Processes for parsing multi-file inputs (0 = one per CPU)"
+    ),
+    source_column: bool = typer.Option(
+        False, "--source-column", help="Add a __source_file column naming each row's input file"
+    ),
+    filters: Optional[List[str]] = typer.Option(
+        None,
+        "--filter",
+        help="Keep rows matching COLUMN OP VALUE (OP: == != < <= > >=); repeatable. "
+        "Parquet row groups that cannot match are skipped.",
+    ),
+    no_daemon: bool = typer.Option(
+        False, "--no-daemon", help="Load data in this process even if a `serve` daemon is running"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Recompute results and re-parse inputs instead of using the on-disk caches"
+    ),
+    profile: bool = typer.Option(
+        False, "--profile", help="Print wall time, CPU time and peak memory of each load/compute/render stage"
+    ),
+    profile_json: Optional[Path] = typer.Option(
+        None, "--profile-json", help="Write the stage profile as JSON to this path (implies profiling)"
+    ),
+    profile_memory: bool = typer.Option(
+        False,
+        "--profile-memory",
+        help="Also trace the peak Python allocation of each stage (implies --profile; slows the traced stages)",
+    ),
+    profile_cprofile: Optional[Path] = typer.Option(
+        None,
+        "--profile-cprofile",
+        help="Dump a cProfile of the compute stage to this path (implies --profile and bypasses the result cache)",
+    ),
+):
+    if csv_engine not in ("c", "pyarrow"):
+        raise typer.BadParameter("must be 'c' or 'pyarrow'", param_hint="--csv-engine")
+    settings.show_schema = show_schema
+    settings.csv_engine = csv_engine
+    settings.optimize_memory = optimize_memory
+    settings.jobs = jobs
+    settings.add_source_column = source_column
+    if no_daemon:
+        settings.use_daemon = False
+    if no_cache:
+        settings.cache_enabled = False
+        settings.result_cache_enabled = False
+    if profile or profile_json or profile_memory or profile_cprofile:
+        from .utils.profiling import print_report, profiler, write_report
+
+        def report() -> None:
+            result = profiler.finish()
+            if profile or profile_memory or profile_cprofile or not profile_json:
+                print_report(result)
+            if profile_json:
+                write_report(result, profile_json)
+
+        if profile_cprofile:
+            # A cached result would leave no compute stage to profile.
+            settings.result_cache_enabled = False
+        profiler.start(cprofile_path=profile_cprofile, trace_memory=profile_memory)
+        ctx.call_on_close(report)
+    if filters:
+        # Parsing filters needs pandas; keep it off the path of light commands.
+        from .utils.filters import parse_filter
+
+        try:
+            settings.row_filters = [parse_filter(f) for f in filters]
+        except ValueError as e:
+            raise typer.BadParameter(str(e), param_hint="--filter")
+
 
 def main():
     app()
@@ -0,0 +1,80 @@
+import typer
+from datetime import datetime
+from pathlib import Path
+from typing import List
+from rich.console import Console
+from rich.table import Table
+from ..config.settings import settings
+from ..utils import cache
+
+console = Console()
+
+cache_app = typer.Typer(help="Inspect and manage the columnar load cache and the result cache.")
+
+
+@cache_app.command("ls", help="List cached datasets, most recently used first.")
+def cache_ls():
+    entries = cache.list_entries()
+    if not entries:
+        console.print(f"Cache is empty ({settings.cache_dir}).")
+        raise typer.Exit(0)
+
+    table = Table(title=f"Load cache: {settings.cache_dir}", show_header=True, header_style="bold")
+    table.add_column("Source")
+    table.add_column("Rows")
+    table.add_column("Columns")
+    table.add_column("Size MB")
+    table.add_column("Last used")
+    for e in entries:
+        table.add_row(
+            e["source"],
+            str(e["rows"]),
+            str(e["columns"]),
+            f"{e['bytes'] / 1024**2:.1f}",
+            datetime.fromtimestamp(e["last_used"]).strftime("%Y-%m-%d %H:%M:%S"),
+        )
+    console.print(table)
+    total = sum(e["bytes"] for e in entries)
+    console.print(f"Total: {total / 1024**2:.1f} MB of {settings.cache_max_mb} MB")
+
+
+@cache_app.command("clear", help="Remove all cached datasets and analysis results.")
+def cache_clear():
+    from ..utils import result_cache
+
+    count = cache.clear()
+    results = result_cache.clear()
+    console.print(f"Removed {count} cached datasets and {results} cached results.")
+
+
+@cache_app.command("warm", help="Parse files now and store them in the cache.")
+def cache_warm(file_paths: List[str] = typer.Argument(..., help="Files to cache")):
+    from ..utils.loader import load_data
+
+    if not cache.cache_available():
+        typer.secho(
+            "Error: cache is disabled or pyarrow is not installed",
+            err=True,
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    failed = False
+    for file_path in file_paths:
+        try:
+            df = load_data(Path(file_path))
+        except Exception as e:
+            typer.secho(f"Error: {file_path}: {e}", err=True, fg=typer.colors.RED)
+            failed = True
+            continue
+        if not cache.fits(df):
+            console.print(f"Skipped {file_path}: larger than the cache limit (QUICK_DATA_CACHE_MAX_MB)")
+            continue
+        console.print(f"Cached {file_path} ({len(df)} rows, {len(df.columns)} columns)")
+
+    if failed:
+        raise typer.Exit(1)
+
+
+def register(app: typer.Typer):
+    app.add_typer(cache_app, name="cache")
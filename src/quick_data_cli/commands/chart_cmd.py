@@ -1,8 +1,7 @@
 import typer
 from pathlib import Path
+from typing import Optional
 from rich.console import Console
-from ..utils.loader import load_data
-from ..analytics.chart import create_chart
 
 console = Console()
 
@@ -14,25 +13,49 @@ def chart(
     y_column: str = typer.Option(None, "--y"),
     groupby: str = typer.Option(None, "--groupby"),
     output: Path = typer.Option(None, "--output", help="Output HTML path"),
+    sample: Optional[str] = typer.Option(None, "--sample", help="Plot a sample: a row count or a fraction"),
+    stratify_by: Optional[str] = typer.Option(None, "--stratify-by", help="Sample proportionally per value of this column"),
+    seed: Optional[int] = typer.Option(None, "--seed", help="Random seed for --sample"),
 ):
+    from ..utils.daemon import run_analysis
+    from ..utils.sampling import load_sample, sample_note
+    from ..analytics.chart import create_chart
+
+    cols = [c for c in (x_column, y_column, groupby) if c]
+    info = None
     try:
-        df = load_data(Path(file_path))
+        if sample:
+            df, info = load_sample(Path(file_path), sample, columns=cols, stratify_by=stratify_by, seed=seed)
+            result = create_chart(
+                df,
+                chart_type=chart_type,
+                x_column=x_column,
+                y_column=y_column,
+                groupby_column=groupby,
+                output=output,
+            )
+        else:
+            result = run_analysis(
+                file_path,
+                create_chart,
+                load_columns=cols,
+                cache_result=False,
+                chart_type=chart_type,
+                x_column=x_column,
+                y_column=y_column,
+                groupby_column=groupby,
+                output=output,
+            )
     except Exception as e:
         typer.secho(f"Error: {e}", err=True, fg=typer.colors.RED)
         raise typer.Exit(1)
 
-    result = create_chart(
-        df,
-        chart_type=chart_type,
-        x_column=x_column,
-        y_column=y_column,
-        groupby_column=groupby,
-        output=output,
-    )
     if "error" in result:
         typer.secho(f"Error: {result['error']}", err=True, fg=typer.colors.RED)
         raise typer.Exit(1)
 
+    if info:
+        typer.secho(sample_note(info), fg=typer.colors.YELLOW)
     console.print(f"Chart saved to: {result['chart_file']}")
 
 
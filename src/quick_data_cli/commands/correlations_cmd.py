@@ -3,8 +3,6 @@ from pathlib import Path
 from typing import Optional
 from rich.console import Console
 from rich.table import Table
-from ..utils.loader import load_data
-from ..analytics.correlations import find_correlations
 
 console = Console()
 
@@ -13,20 +11,60 @@ def correlations(
     file_path: str,
     threshold: float = typer.Option(0.3, "--threshold"),
     columns: Optional[str] = typer.Option(None, "--columns", help="Comma-separated columns"),
+    sample: Optional[str] = typer.Option(None, "--sample", help="Analyze a sample: a row count or a fraction"),
+    stratify_by: Optional[str] = typer.Option(None, "--stratify-by", help="Sample proportionally per value of this column"),
+    seed: Optional[int] = typer.Option(None, "--seed", help="Random seed for --sample"),
+    stream: bool = typer.Option(
+        False, "--stream", help="Read the input in chunks with bounded memory, one process per file"
+    ),
+    chunksize: int = typer.Option(100_000, "--chunksize", help="Rows per chunk in --stream mode"),
+    top_k: Optional[int] = typer.Option(None, "--top-k", help="Show only the K strongest pairs above the threshold"),
+    float32: bool = typer.Option(
+        False, "--float32", help="Compute in single precision: half the memory, faster on very wide data"
+    ),
+    method: str = typer.Option("pearson", "--method", help="Correlation method: pearson, spearman or kendall"),
 ):
+    from ..config.settings import settings
+    from ..utils.daemon import run_analysis
+    from ..utils.sampling import load_sample, sample_note
+    from ..analytics.correlations import find_correlations
+
+    cols = [c.strip() for c in columns.split(",")] if columns else None
+    # Only the strong pairs are shown, so the full matrix is never built.
+    options = dict(
+        columns=cols, threshold=threshold, top_k=top_k, include_matrix=False, dtype="float32" if float32 else "float64"
+    )
+    if method != "pearson":
+        options.update(method=method, jobs=settings.jobs)
+    info = None
     try:
-        df = load_data(Path(file_path))
+        if stream and method != "pearson":
+            raise ValueError("--stream only supports --method pearson")
+        if stream:
+            from ..analytics.streaming import accumulate_correlations, find_correlations_stream
+
+            acc = accumulate_correlations(file_path, columns=cols, chunksize=chunksize)
+            result = find_correlations_stream(acc, threshold=threshold, top_k=top_k, include_matrix=False)
+        elif sample:
+            df, info = load_sample(Path(file_path), sample, columns=cols, stratify_by=stratify_by, seed=seed)
+            result = find_correlations(df, **options)
+        else:
+            result = run_analysis(file_path, find_correlations, load_columns=cols, **options)
     except Exception as e:
         typer.secho(f"Error: {e}", err=True, fg=typer.colors.RED)
         raise typer.Exit(1)
 
-    cols = [c.strip() for c in columns.split(",")] if columns else None
-    result = find_correlations(df, columns=cols, threshold=threshold)
     if "error" in result:
         typer.secho(f"Error: {result['error']}", err=True, fg=typer.colors.RED)
         raise typer.Exit(1)
 
-    table = Table(title="Strong Correlations", show_header=True, header_style="bold")
+    if info:
+        typer.secho(sample_note(info), fg=typer.colors.YELLOW)
+
+    title = "Strong Correlations" if method == "pearson" else f"Strong Correlations ({method.capitalize()})"
+    if stream:
+        title += " (streamed)"
+    table = Table(title=title, show_header=True, header_style="bold")
     table.add_column("Column 1")
     table.add_column("Column 2")
     table.add_column("Correlation")
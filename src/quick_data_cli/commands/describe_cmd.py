@@ -1,15 +1,15 @@
 import typer
 from pathlib import Path
-import pandas as pd
+from typing import Optional
 from rich.console import Console
 from rich.table import Table
-from ..utils.loader import load_data
-from ..utils.dtypes import display_dtype
 
 console = Console()
 
 
 def _format_number(v) -> str:
+    import pandas as pd
+
     if pd.isna(v):
         return "-"
     try:
@@ -24,29 +24,80 @@ def _format_number(v) -> str:
     return s.rstrip("0").rstrip(".")
 
 
-def describe(file_path: str):
+def _describe_streamed(file_path: str, chunksize: int):
+    from ..utils.loader import iter_chunks
+    from ..analytics.streaming import describe_stream
+
+    try:
+        result = describe_stream(iter_chunks(Path(file_path), chunksize=chunksize))
+    except Exception as e:
+        typer.secho(f"Error: {e}", err=True, fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    console.print(f"Rows: {result['rows']} Columns: {result['column_count']} (streamed)")
+
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Column")
+    table.add_column("Dtype")
+    table.add_column("Non-Null")
+    table.add_column("Null %")
+    for c in result["columns"]:
+        table.add_row(str(c["column"]), c["dtype"], str(c["non_null"]), f"{c['null_percentage']:.2f}")
+    console.print(table)
+
+    numeric = result["numeric_summary"]
+    if numeric:
+        t2 = Table(show_header=True, header_style="bold")
+        t2.add_column("Metric")
+        for c in numeric:
+            t2.add_column(str(c))
+        for metric in ["count", "mean", "std", "min", "max"]:
+            t2.add_row(metric, *[_format_number(stats[metric]) for stats in numeric.values()])
+        console.print(t2)
+
+
+def describe(
+    file_path: str,
+    stream: bool = typer.Option(False, "--stream", help="Read the file in chunks with bounded memory"),
+    chunksize: int = typer.Option(100_000, "--chunksize", help="Rows per chunk in --stream mode"),
+    sample: Optional[str] = typer.Option(None, "--sample", help="Analyze a sample: a row count or a fraction"),
+    stratify_by: Optional[str] = typer.Option(None, "--stratify-by", help="Sample proportionally per value of this column"),
+    seed: Optional[int] = typer.Option(None, "--seed", help="Random seed for --sample"),
+):
+    from ..utils.daemon import run_analysis
+    from ..utils.sampling import load_sample, sample_note
+    from ..analytics.describe import describe_dataframe
+
+    if stream:
+        _describe_streamed(file_path, chunksize)
+        return
+
+    info = None
     try:
-        df = load_data(Path(file_path))
+        if sample:
+            df, info = load_sample(Path(file_path), sample, stratify_by=stratify_by, seed=seed)
+            result = describe_dataframe(df)
+        else:
+            result = run_analysis(file_path, describe_dataframe)
     except Exception as e:
         typer.secho(f"Error: {e}", err=True, fg=typer.colors.RED)
         raise typer.Exit(1)
 
-    console.print(f"Rows: {df.shape[0]} Columns: {df.shape[1]}")
+    if info:
+        typer.secho(sample_note(info), fg=typer.colors.YELLOW)
+    console.print(f"Rows: {result['rows']} Columns: {result['column_count']}")
 
     table = Table(show_header=True, header_style="bold")
     table.add_column("Column")
     table.add_column("Dtype")
     table.add_column("Non-Null")
     table.add_column("Null %")
-    for col in df.columns:
-        s = df[col]
-        null_pct = s.isna().mean() * 100
-        non_null = s.notna().sum()
-        table.add_row(str(col), display_dtype(s), str(non_null), f"{null_pct:.2f}")
+    for c in result["columns"]:
+        table.add_row(str(c["column"]), c["dtype"], str(c["non_null"]), f"{c['null_percentage']:.2f}")
     console.print(table)
 
-    if not df.select_dtypes(include="number").empty:
-        desc = df.describe(include="number")
+    desc = result["numeric_summary"]
+    if desc is not None:
         t2 = Table(show_header=True, header_style="bold")
         t2.add_column("Metric")
         for c in desc.columns:
@@ -1,10 +1,7 @@
 import typer
-from pathlib import Path
 from typing import Optional
 from rich.console import Console
 from rich.table import Table
-from ..utils.loader import load_data
-from ..analytics.outliers import detect_outliers
 
 console = Console()
 
@@ -14,14 +11,16 @@ def detect_outliers_cmd(
     method: str = typer.Option("iqr", "--method", help="iqr or zscore"),
     columns: Optional[str] = typer.Option(None, "--columns", help="Comma-separated columns"),
 ):
+    from ..utils.daemon import run_analysis
+    from ..analytics.outliers import detect_outliers
+
+    cols = [c.strip() for c in columns.split(",")] if columns else None
     try:
-        df = load_data(Path(file_path))
+        result = run_analysis(file_path, detect_outliers, load_columns=cols, columns=cols, method=method)
     except Exception as e:
         typer.secho(f"Error: {e}", err=True, fg=typer.colors.RED)
         raise typer.Exit(1)
 
-    cols = [c.strip() for c in columns.split(",")] if columns else None
-    result = detect_outliers(df, columns=cols, method=method)
     if "error" in result:
         typer.secho(f"Error: {result['error']}", err=True, fg=typer.colors.RED)
         raise typer.Exit(1)
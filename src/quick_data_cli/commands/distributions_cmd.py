@@ -1,25 +1,41 @@
 import typer
 from pathlib import Path
+from typing import Optional
 from rich.console import Console
 from rich.table import Table
-from ..utils.loader import load_data
-from ..analytics.distributions import analyze_distributions
 
 console = Console()
 
 
-def distributions(file_path: str, column: str = typer.Argument(...)):
+def distributions(
+    file_path: str,
+    column: str = typer.Argument(...),
+    sample: Optional[str] = typer.Option(None, "--sample", help="Analyze a sample: a row count or a fraction"),
+    stratify_by: Optional[str] = typer.Option(None, "--stratify-by", help="Sample proportionally per value of this column"),
+    seed: Optional[int] = typer.Option(None, "--seed", help="Random seed for --sample"),
+):
+    from ..utils.daemon import run_analysis
+    from ..utils.sampling import load_sample, sample_note
+    from ..analytics.distributions import analyze_distributions
+
+    info = None
     try:
-        df = load_data(Path(file_path))
+        if sample:
+            df, info = load_sample(Path(file_path), sample, columns=[column], stratify_by=stratify_by, seed=seed)
+            result = analyze_distributions(df, column)
+        else:
+            result = run_analysis(file_path, analyze_distributions, load_columns=[column], column_name=column)
     except Exception as e:
         typer.secho(f"Error: {e}", err=True, fg=typer.colors.RED)
         raise typer.Exit(1)
 
-    result = analyze_distributions(df, column)
     if "error" in result:
         typer.secho(f"Error: {result['error']}", err=True, fg=typer.colors.RED)
         raise typer.Exit(1)
 
+    if info:
+        typer.secho(sample_note(info), fg=typer.colors.YELLOW)
+
     # Summary table
     summary = Table(title=f"Distribution Summary: {result['column']}")
     summary.add_column("Metric")
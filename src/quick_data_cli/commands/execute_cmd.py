@@ -1,79 +1,207 @@
+import os
 import typer
-from pathlib import Path
 import subprocess
-import shutil
+from typing import List, Optional
 
 
 def execute(
-    file_path: str = typer.Argument(..., help="Path to CSV or JSON file"),
-    script_path: str = typer.Argument(..., help="Path to a Python script to run against the data"),
+    file_path: str = typer.Argument(..., help="Path to a CSV, JSON or Parquet file"),
+    script_paths: List[str] = typer.Argument(..., help="Python script(s) to run against the data"),
+    workers: int = typer.Option(
+        0, "--workers", help="Warm worker processes for several scripts (default: one per CPU, up to the script count)"
+    ),
+    recycle_after: int = typer.Option(50, "--recycle-after", help="Restart a worker after this many scripts"),
+    max_worker_mb: float = typer.Option(
+        None, "--max-worker-mb", help="Restart a worker once its private memory exceeds this many MB"
+    ),
+    timeout: float = typer.Option(60, "--timeout", help="Seconds allowed per script (per partition with --partitions)"),
+    partitions: int = typer.Option(
+        0, "--partitions", help="Split the data into N partitions and run the script's map() on each in parallel"
+    ),
+    by: Optional[str] = typer.Option(
+        None, "--by", help="Partition by hash of this column instead of by row ranges (implies --partitions)"
+    ),
 ):
-    # Build wrapper code that loads the data and executes the user script with `df` available
-    wrapper_code = r'''
-import sys
-import pandas as pd
-import numpy as np
-from pathlib import Path
-
-file_path = Path(sys.argv[1])
-script_path = Path(sys.argv[2])
-
-if not file_path.exists():
-    print(f"ERROR: Data file not found: {file_path}")
-    raise SystemExit(2)
-if not script_path.exists():
-    print(f"ERROR: Script file not found: {script_path}")
-    raise SystemExit(2)
-
-suffix = file_path.suffix.lower()
-if suffix == '.csv':
-    df = pd.read_csv(file_path)
-elif suffix == '.json':
-    df = pd.read_json(file_path)
-else:
-    print(f"ERROR: Unsupported file format: {suffix}")
-    raise SystemExit(2)
-
-ns = {"df": df, "pd": pd, "np": np}
-code = script_path.read_text(encoding='utf-8')
-try:
-    exec(compile(code, str(script_path), 'exec'), ns, ns)
-except Exception as e:
-    import traceback
-    print(f"ERROR: {type(e).__name__}: {e}")
-    print("Traceback:")
-    print(traceback.format_exc())
-    raise SystemExit(1)
-'''
-
-    cmd = []
-    if shutil.which("uv"):
-        cmd = ["uv", "run", "python", "-c", wrapper_code, file_path, script_path]
-    else:
-        cmd = ["python", "-c", wrapper_code, file_path, script_path]
+    from contextlib import ExitStack
+    from ..utils.loader import load_data
+    from ..utils.profiling import profiler
+    from ..utils.shared_frame import shared_frame
 
-    try:
-        proc = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=60,
-        )
-    except subprocess.TimeoutExpired:
-        typer.secho("TIMEOUT: Code execution exceeded 60 seconds", err=True, fg=typer.colors.RED)
+    if by and partitions <= 0:
+        partitions = os.cpu_count() or 1
+    if partitions > 0 and len(script_paths) != 1:
+        typer.secho("Error: --partitions runs exactly one script", err=True, fg=typer.colors.RED)
         raise typer.Exit(1)
 
+    # Loaded here, with the same parsing and --filter handling as every other
+    # command, then shared with the sandboxes instead of re-read in each.
+    # Scripts get the plain dtypes they would get from pandas: integers are not
+    # downcast (arithmetic would overflow) and CSV text is not pinned as
+    # category (assigning new values would raise).
+    try:
+        df = load_data(file_path, downcast_integers=False, pin_categories=False)
+    except FileNotFoundError:
+        typer.echo(f"ERROR: Data file not found: {file_path}")
+        raise typer.Exit(2)
+    except Exception as e:
+        typer.echo(f"ERROR: {e}")
+        raise typer.Exit(2)
+
+    labels = None
+    if by:
+        if by not in df.columns:
+            typer.secho(f"Error: Column '{by}' not found", err=True, fg=typer.colors.RED)
+            raise typer.Exit(1)
+        import pandas as pd
+
+        # Equal keys always land in the same partition, so per-group work
+        # in map() sees every row of its groups.
+        hashes = pd.util.hash_pandas_object(df[by], index=False).to_numpy()
+        labels = pd.DataFrame({"partition": (hashes % partitions).astype("int32")})
+
+    with ExitStack() as stack:
+        with profiler.stage("share"):
+            frame = str(stack.enter_context(shared_frame(df)))
+            labels_frame = str(stack.enter_context(shared_frame(labels))) if labels is not None else None
+        del df, labels
+        with profiler.stage("compute"):
+            if partitions > 0:
+                _run_partitioned(frame, labels_frame, script_paths[0], partitions, workers, timeout)
+            else:
+                _run(frame, script_paths, workers, recycle_after, max_worker_mb, timeout)
+
+
+def _run_partitioned(
+    frame: str, labels: Optional[str], script: str, partitions: int, workers: int, timeout: float
+) -> None:
+    import tempfile
+    from ..utils.exec_pool import REDUCE_CODE, WorkerError, WorkerPool, interpreter_cmd
+
+    pool = WorkerPool(
+        frame,
+        workers=min(partitions, workers if workers > 0 else (os.cpu_count() or 1)),
+        timeout=timeout,
+        recycle_after=partitions,
+    )
+    with tempfile.TemporaryDirectory(prefix="quick-data-map-") as result_dir:
+        try:
+            results = pool.map_partitions(script, partitions, result_dir, labels=labels)
+        except WorkerError as e:
+            typer.echo(str(e))
+            raise typer.Exit(e.returncode)
+
+        for result in results:
+            if result.timed_out:
+                typer.secho(
+                    f"TIMEOUT: {result.script} exceeded {timeout:g} seconds", err=True, fg=typer.colors.RED
+                )
+            elif result.stdout or result.stderr or result.returncode:
+                typer.secho(f"==> {result.script} <==", bold=True)
+                if result.stdout:
+                    typer.echo(result.stdout)
+                if result.stderr:
+                    typer.echo(result.stderr)
+
+        failed = [r for r in results if r.returncode != 0]
+        if failed:
+            typer.secho(
+                f"{len(failed)} of {partitions} partitions failed; skipping reduce",
+                err=True,
+                fg=typer.colors.RED,
+            )
+            raise typer.Exit(max(r.returncode for r in failed))
+
+        try:
+            proc = subprocess.run(
+                interpreter_cmd(REDUCE_CODE, frame, script, result_dir),
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired:
+            typer.secho(f"TIMEOUT: reduce exceeded {timeout:g} seconds", err=True, fg=typer.colors.RED)
+            raise typer.Exit(1)
+
     if proc.stdout:
         typer.echo(proc.stdout)
     if proc.stderr:
         typer.echo(proc.stderr)
-
     raise typer.Exit(proc.returncode)
 
 
+def _run(
+    frame: str,
+    script_paths: List[str],
+    workers: int,
+    recycle_after: int,
+    max_worker_mb: Optional[float],
+    timeout: float,
+) -> None:
+    from ..utils.exec_pool import WRAPPER_CODE, WorkerError, WorkerPool, interpreter_cmd
+
+    if len(script_paths) == 1 and workers <= 0:
+        # One script: a one-shot interpreter maps the data and runs it.
+        try:
+            proc = subprocess.run(
+                interpreter_cmd(WRAPPER_CODE, frame, script_paths[0]),
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired:
+            typer.secho(f"TIMEOUT: Code execution exceeded {timeout:g} seconds", err=True, fg=typer.colors.RED)
+            raise typer.Exit(1)
+
+        if proc.stdout:
+            typer.echo(proc.stdout)
+        if proc.stderr:
+            typer.echo(proc.stderr)
+
+        raise typer.Exit(proc.returncode)
+
+    pool = WorkerPool(
+        frame,
+        workers=workers if workers > 0 else (os.cpu_count() or 1),
+        timeout=timeout,
+        recycle_after=max(1, recycle_after),
+        max_worker_mb=max_worker_mb,
+    )
+    try:
+        results = pool.run(script_paths)
+    except WorkerError as e:
+        typer.echo(str(e))
+        raise typer.Exit(e.returncode)
+
+    multiple = len(results) > 1
+    for result in results:
+        if multiple:
+            typer.secho(f"==> {result.script} <==", bold=True)
+        if result.timed_out:
+            typer.secho(f"TIMEOUT: Code execution exceeded {timeout:g} seconds", err=True, fg=typer.colors.RED)
+            continue
+        if result.stdout:
+            typer.echo(result.stdout)
+        if result.stderr:
+            typer.echo(result.stderr)
+
+    failed = [r for r in results if r.returncode != 0]
+    if multiple:
+        typer.echo(
+            f"{len(results) - len(failed)} of {len(results)} scripts succeeded "
+            f"({pool.started} worker start(s))"
+        )
+    raise typer.Exit(max((r.returncode for r in failed), default=0))
+
+
 def register(app: typer.Typer):
     app.command(
         "execute",
-        help="Run a custom Python script against the loaded dataset (available as a pandas DataFrame `df`).",
+        help=(
+            "Run a custom Python script against the loaded dataset (available as a pandas DataFrame `df`).\n\n"
+            "Numeric, datetime, categorical and nullable columns are shared through memory without copying. Text "
+            "columns are shared as codes plus their distinct values, so each worker rebuilds only those values "
+            "and one pointer per row; other object columns are copied into every worker."
+        ),
     )(execute)
@@ -1,9 +1,6 @@
 import typer
-from pathlib import Path
 from rich.console import Console
 from rich.table import Table
-from ..utils.loader import load_data
-from ..analytics.segment import segment_by_column
 
 console = Console()
 
@@ -13,13 +10,15 @@ def segment(
     column: str = typer.Option(..., "--column"),
     top_n: int = typer.Option(10, "--top-n"),
 ):
+    from ..utils.daemon import run_analysis
+    from ..analytics.segment import segment_by_column
+
     try:
-        df = load_data(Path(file_path))
+        result = run_analysis(file_path, segment_by_column, column_name=column, top_n=top_n)
     except Exception as e:
         typer.secho(f"Error: {e}", err=True, fg=typer.colors.RED)
         raise typer.Exit(1)
 
-    result = segment_by_column(df, column_name=column, top_n=top_n)
     if "error" in result:
         typer.secho(f"Error: {result['error']}", err=True, fg=typer.colors.RED)
         raise typer.Exit(1)
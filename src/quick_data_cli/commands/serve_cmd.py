@@ -0,0 +1,94 @@
+import typer
+from datetime import datetime
+from rich.console import Console
+from rich.table import Table
+from ..config.settings import settings
+from ..utils.daemon import DatasetDaemon, request
+
+console = Console()
+
+
+def serve(
+    idle_timeout: float = typer.Option(1800, "--idle-timeout", help="Exit after this many seconds without requests"),
+    dataset_ttl: float = typer.Option(600, "--dataset-ttl", help="Drop datasets unused for this many seconds"),
+    stop: bool = typer.Option(False, "--stop", help="Stop the running daemon"),
+):
+    if stop:
+        if request({"op": "stop"}) is None:
+            console.print("No daemon running.")
+        else:
+            console.print("Daemon stopped.")
+        return
+
+    if request({"op": "status"}) is not None:
+        typer.secho(f"Error: a daemon is already running on {settings.daemon_socket}", err=True, fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    console.print(f"Serving on {settings.daemon_socket} (idle timeout {idle_timeout:.0f}s, dataset TTL {dataset_ttl:.0f}s)")
+    try:
+        DatasetDaemon(idle_timeout=idle_timeout, dataset_ttl=dataset_ttl).serve()
+    except RuntimeError as e:
+        typer.secho(f"Error: {e}", err=True, fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except KeyboardInterrupt:
+        pass
+    console.print("Daemon exited.")
+
+
+def status():
+    response = request({"op": "status"})
+    if response is None:
+        console.print(f"No daemon running ({settings.daemon_socket}); commands load data in-process.")
+        raise typer.Exit(0)
+    if "error" in response:
+        typer.secho(f"Error: {response['error']}", err=True, fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    info = response["result"]
+    console.print(
+        f"Daemon pid {info['pid']} on {info['socket']}: up {info['uptime_seconds']:.0f}s, "
+        f"idle {info['idle_seconds']:.0f}s of {info['idle_timeout']:.0f}s, "
+        f"RSS {info['rss_bytes'] / 1024**2:.1f} MB"
+    )
+    if not info["datasets"]:
+        console.print("No resident datasets.")
+        return
+
+    table = Table(title="Resident datasets", show_header=True, header_style="bold")
+    table.add_column("Dataset", overflow="fold")
+    table.add_column("Rows")
+    table.add_column("Columns")
+    table.add_column("Memory MB")
+    table.add_column("Load s")
+    table.add_column("Hits")
+    table.add_column("Loaded")
+    table.add_column("Idle s")
+    for d in info["datasets"]:
+        table.add_row(
+            d["name"],
+            str(d["rows"]),
+            str(d["columns"]),
+            f"{d['bytes'] / 1024**2:.1f}" + (" (spilled)" if d.get("spilled") else ""),
+            f"{d['load_seconds']:.2f}",
+            str(d["hits"]),
+            datetime.fromtimestamp(d["loaded_at"]).strftime("%Y-%m-%d %H:%M:%S"),
+            f"{d['idle_seconds']:.0f}",
+        )
+    console.print(table)
+    total = sum(d["bytes"] for d in info["datasets"] if not d.get("spilled"))
+    budget = info.get("memory_budget_mb")
+    console.print(
+        f"Total in memory: {total / 1024**2:.1f} MB in {len(info['datasets'])} datasets"
+        + (f" (budget {budget} MB)" if budget else "")
+    )
+
+
+def register(app: typer.Typer):
+    app.command(
+        "serve",
+        help="Run a local daemon that keeps loaded datasets in memory for later commands.",
+    )(serve)
+    app.command(
+        "status",
+        help="Show the daemon's resident datasets and memory use.",
+    )(status)
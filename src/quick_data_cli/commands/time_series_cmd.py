@@ -1,9 +1,6 @@
 import typer
-from pathlib import Path
 from rich.console import Console
 from rich.table import Table
-from ..utils.loader import load_data
-from ..analytics.time_series import time_series_analysis
 
 console = Console()
 
@@ -14,13 +11,22 @@ def time_series(
     value_column: str = typer.Option(..., "--value-column"),
     frequency: str = typer.Option("auto", "--frequency"),
 ):
+    from ..utils.daemon import run_analysis
+    from ..analytics.time_series import time_series_analysis
+
     try:
-        df = load_data(Path(file_path))
+        result = run_analysis(
+            file_path,
+            time_series_analysis,
+            load_columns=[date_column, value_column],
+            date_column=date_column,
+            value_column=value_column,
+            frequency=frequency,
+        )
     except Exception as e:
         typer.secho(f"Error: {e}", err=True, fg=typer.colors.RED)
         raise typer.Exit(1)
 
-    result = time_series_analysis(df, date_column=date_column, value_column=value_column, frequency=frequency)
     if "error" in result:
         typer.secho(f"Error: {result['error']}", err=True, fg=typer.colors.RED)
         raise typer.Exit(1)
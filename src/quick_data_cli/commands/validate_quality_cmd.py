@@ -2,28 +2,37 @@ import typer
 from pathlib import Path
 from rich.console import Console
 from rich.table import Table
-from ..utils.loader import load_data
-from ..analytics.quality import validate_data_quality
 
 console = Console()
 
 
-def validate_quality(file_path: str):
+def validate_quality(
+    file_path: str,
+    stream: bool = typer.Option(False, "--stream", help="Read the file in chunks with bounded memory"),
+    chunksize: int = typer.Option(100_000, "--chunksize", help="Rows per chunk in --stream mode"),
+):
+    from ..utils.daemon import run_analysis
+    from ..utils.loader import iter_chunks
+    from ..analytics.quality import validate_data_quality
+    from ..analytics.streaming import validate_data_quality_stream
+
     try:
-        df = load_data(Path(file_path))
+        if stream:
+            result = validate_data_quality_stream(iter_chunks(Path(file_path), chunksize=chunksize))
+        else:
+            result = run_analysis(file_path, validate_data_quality)
     except Exception as e:
         typer.secho(f"Error: {e}", err=True, fg=typer.colors.RED)
         raise typer.Exit(1)
 
-    result = validate_data_quality(df)
-
     t = Table(title="Data Quality Report")
     t.add_column("Metric")
     t.add_column("Value")
     t.add_row("rows", str(result.get("total_rows")))
     t.add_row("columns", str(result.get("total_columns")))
     t.add_row("quality_score", str(result.get("quality_score")))
-    t.add_row("duplicate_rows", str(result.get("duplicate_rows")))
+    dupes = result.get("duplicate_rows")
+    t.add_row("duplicate_rows", "not computed (streamed)" if dupes is None else str(dupes))
     t.add_row("missing_columns", ", ".join(result.get("missing_data", {}).keys()) or "-")
     console.print(t)
 
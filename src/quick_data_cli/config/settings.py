@@ -1,7 +1,23 @@
 """Server configuration settings."""
 
 import os
-from typing import Optional
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() not in ("0", "false", "no", "off", "")
+
+
+def _default_memory_budget_mb() -> int:
+    # Half of physical memory; 0 (no budget) where it cannot be determined.
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // (2 * 1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return 0
 
 
 class Settings:
@@ -13,6 +29,28 @@ class Settings:
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
         self.api_key: Optional[str] = os.getenv("API_KEY")
         self.database_url: Optional[str] = os.getenv("DATABASE_URL")
+        self.cache_enabled = _env_flag("QUICK_DATA_CACHE", True)
+        self.cache_dir = Path(
+            os.getenv("QUICK_DATA_CACHE_DIR", str(Path.home() / ".cache" / "quick-data"))
+        )
+        self.cache_max_mb = int(os.getenv("QUICK_DATA_CACHE_MAX_MB", "4096"))
+        self.result_cache_enabled = _env_flag("QUICK_DATA_RESULT_CACHE", True)
+        self.result_cache_ttl = float(os.getenv("QUICK_DATA_RESULT_CACHE_TTL", str(24 * 3600)))
+        self.result_cache_max_mb = int(os.getenv("QUICK_DATA_RESULT_CACHE_MAX_MB", "256"))
+        self.csv_engine = os.getenv("QUICK_DATA_CSV_ENGINE", "c")
+        self.show_schema = False
+        self.optimize_memory = _env_flag("QUICK_DATA_OPTIMIZE_MEMORY", False)
+        self.jobs = int(os.getenv("QUICK_DATA_JOBS", "0"))
+        self.add_source_column = False
+        self.row_filters: List[Tuple[str, str, Any]] = []
+        self.use_daemon = _env_flag("QUICK_DATA_DAEMON", True)
+        self.daemon_socket = Path(
+            os.getenv("QUICK_DATA_SOCKET", str(self.cache_dir / "daemon.sock"))
+        )
+        budget = os.getenv("QUICK_DATA_MEMORY_BUDGET_MB")
+        self.dataset_memory_budget_mb = int(budget) if budget else _default_memory_budget_mb()
+        self.spill_datasets = _env_flag("QUICK_DATA_SPILL", True)
+        self.spill_dir = Path(os.getenv("QUICK_DATA_SPILL_DIR", str(self.cache_dir / "spill")))
     
     @property
     def server_info(self) -> dict:
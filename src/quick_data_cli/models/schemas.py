@@ -2,11 +2,54 @@
 
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any, Union
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from enum import Enum
+import atexit
+import hashlib
+import os
+import pickle
 import pandas as pd
 import numpy as np
 
+from ..config.settings import settings
+from ..utils.cardinality import approx_nunique
+from ..utils.columnar import COLUMNAR_SUFFIXES, read_columnar
+from ..utils.formats import data_suffix
+from ..utils.memory import optimize_memory as optimize_frame_memory
+
+
+# Above this many rows, schema discovery estimates distinct counts with
+# HyperLogLog instead of counting them exactly.
+APPROX_DISTINCT_ROWS = 1_000_000
+
+
+def _suggest_role(series: pd.Series, unique_values: int) -> str:
+    if pd.api.types.is_numeric_dtype(series):
+        return 'numerical'
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return 'temporal'
+    if len(series) == 0:
+        return 'categorical'
+    if unique_values / len(series) < 0.5:  # Low cardinality = categorical
+        return 'categorical'
+    if unique_values == len(series):  # Unique values = identifier
+        return 'identifier'
+    return 'categorical'
+
+
+def _sample_values(series: pd.Series, null_count: int, k: int = 3) -> List[Any]:
+    if null_count == 0:
+        return series.iloc[:k].tolist()
+    # Look at the head first; only a mostly-null head needs the full column.
+    head = series.iloc[: 32 * k].dropna()
+    if len(head) < k:
+        head = series.dropna()
+    return head.head(k).tolist()
+
 
 class ColumnInfo(BaseModel):
     """Column metadata and characteristics."""
@@ -18,28 +61,36 @@ class ColumnInfo(BaseModel):
     suggested_role: str  # 'categorical', 'numerical', 'temporal', 'identifier'
     
     @classmethod
-    def from_series(cls, series: pd.Series, name: str) -> 'ColumnInfo':
-        """Auto-discover column characteristics from pandas Series."""
-        
-        # Determine suggested role
-        if pd.api.types.is_numeric_dtype(series):
-            role = 'numerical'
-        elif pd.api.types.is_datetime64_any_dtype(series):
-            role = 'temporal'
-        elif series.nunique() / len(series) < 0.5:  # Low cardinality = categorical
-            role = 'categorical'
-        elif series.nunique() == len(series):  # Unique values = identifier
-            role = 'identifier'
+    def from_series(
+        cls,
+        series: pd.Series,
+        name: str,
+        null_count: Optional[int] = None,
+        approximate: bool = False,
+    ) -> 'ColumnInfo':
+        """Auto-discover column characteristics from pandas Series.
+
+        `null_count` may be passed in when it was computed for the whole
+        frame at once. `approximate` estimates the distinct count of numeric
+        and datetime columns, whose role does not depend on it; the other
+        columns are always counted exactly.
+        """
+        if approximate and (
+            pd.api.types.is_numeric_dtype(series) or pd.api.types.is_datetime64_any_dtype(series)
+        ):
+            unique_values = approx_nunique(series)
         else:
-            role = 'categorical'
+            unique_values = series.nunique()
+        if null_count is None:
+            null_count = int(series.isna().sum())
             
         return cls(
             name=name,
             dtype=str(series.dtype),
-            unique_values=series.nunique(),
-            null_percentage=series.isnull().mean() * 100,
-            sample_values=series.dropna().head(3).tolist(),
-            suggested_role=role
+            unique_values=unique_values,
+            null_percentage=null_count / len(series) * 100 if len(series) else float('nan'),
+            sample_values=_sample_values(series, null_count),
+            suggested_role=_suggest_role(series, unique_values)
         )
 
 
@@ -51,11 +102,40 @@ class DatasetSchema(BaseModel):
     suggested_analyses: List[str]
     
     @classmethod
-    def from_dataframe(cls, df: pd.DataFrame, name: str) -> 'DatasetSchema':
-        """Auto-discover schema from pandas DataFrame."""
+    def from_dataframe(
+        cls,
+        df: pd.DataFrame,
+        name: str,
+        approximate: Optional[bool] = None,
+        jobs: Optional[int] = None,
+    ) -> 'DatasetSchema':
+        """Auto-discover schema from pandas DataFrame.
+
+        Null counts come from one vectorized pass over the frame; distinct
+        counts are computed once per column, estimated when `approximate`
+        (by default: above APPROX_DISTINCT_ROWS rows), on up to `jobs`
+        threads (by default `settings.jobs`, 0 meaning one per CPU).
+        """
+        if approximate is None:
+            approximate = len(df) > APPROX_DISTINCT_ROWS
+        null_counts = df.isna().sum().to_numpy()
+
+        def column_info(i: int) -> ColumnInfo:
+            col = df.columns[i]
+            return ColumnInfo.from_series(df.iloc[:, i], col, int(null_counts[i]), approximate)
+
+        if jobs is None:
+            jobs = settings.jobs
+        if jobs <= 0:
+            jobs = os.cpu_count() or 1
+        if jobs > 1 and df.shape[1] > 1:
+            with ThreadPoolExecutor(max_workers=min(jobs, df.shape[1])) as pool:
+                infos = list(pool.map(column_info, range(df.shape[1])))
+        else:
+            infos = [column_info(i) for i in range(df.shape[1])]
         columns = {}
-        for col in df.columns:
-            columns[col] = ColumnInfo.from_series(df[col], col)
+        for info in infos:
+            columns[info.name] = info
         
         # Generate analysis suggestions based on column types
         suggestions = []
@@ -78,16 +158,94 @@ class DatasetSchema(BaseModel):
         )
 
 
-# Global in-memory storage for datasets
-loaded_datasets: Dict[str, pd.DataFrame] = {}
-dataset_schemas: Dict[str, DatasetSchema] = {}
+class _DatasetSchemas(MutableMapping):
+    """Schemas of every loaded dataset, discovered on first lookup.
+
+    Looking up a dataset whose schema has not been built yet builds it,
+    reloading the dataset if it was spilled; membership, length and
+    iteration cover all loaded and spilled datasets without building anything.
+    """
+
+    def __init__(self) -> None:
+        self._schemas: Dict[str, DatasetSchema] = {}
+
+    def __getitem__(self, dataset_name: str) -> DatasetSchema:
+        if dataset_name not in self._schemas:
+            if dataset_name not in loaded_datasets and dataset_name not in spilled_datasets:
+                raise KeyError(dataset_name)
+            df = DatasetManager.get_dataset(dataset_name)
+            self._schemas[dataset_name] = DatasetSchema.from_dataframe(df, dataset_name)
+        return self._schemas[dataset_name]
+
+    def __setitem__(self, dataset_name: str, schema: DatasetSchema) -> None:
+        self._schemas[dataset_name] = schema
+
+    def __delitem__(self, dataset_name: str) -> None:
+        del self._schemas[dataset_name]
+
+    def __contains__(self, dataset_name: object) -> bool:
+        return dataset_name in self._schemas or dataset_name in loaded_datasets or dataset_name in spilled_datasets
+
+    def __iter__(self):
+        names = DatasetManager.list_datasets()
+        return iter(names + [n for n in self._schemas if n not in names])
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def pop(self, dataset_name: str, *default: Any) -> Any:
+        # Forget a built schema without discovering one first.
+        return self._schemas.pop(dataset_name, *default)
+
+    def clear(self) -> None:
+        self._schemas.clear()
+
+
+# Global in-memory storage for datasets, least recently used first
+loaded_datasets: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+dataset_schemas = _DatasetSchemas()
+# Datasets evicted to disk to stay within the memory budget
+spilled_datasets: Dict[str, Path] = {}
+dataset_sizes: Dict[str, int] = {}
+dataset_stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "spills": 0, "reloads": 0}
+
+
+def _dataset_bytes(dataset_name: str) -> int:
+    # Frames inserted into loaded_datasets directly have no recorded size yet.
+    if dataset_name not in dataset_sizes:
+        dataset_sizes[dataset_name] = int(loaded_datasets[dataset_name].memory_usage(deep=True).sum())
+    return dataset_sizes[dataset_name]
+
+
+def _spill_path(dataset_name: str) -> Path:
+    digest = hashlib.blake2b(dataset_name.encode("utf-8"), digest_size=12).hexdigest()
+    return settings.spill_dir / f"{os.getpid()}-{digest}.pkl"
+
+
+def _remove_spill(dataset_name: str) -> None:
+    path = spilled_datasets.pop(dataset_name, None)
+    if path is not None:
+        path.unlink(missing_ok=True)
+
+
+@atexit.register
+def _remove_all_spills() -> None:
+    for name in list(spilled_datasets):
+        _remove_spill(name)
 
 
 class DatasetManager:
-    """Simple in-memory dataset management."""
+    """In-memory dataset management under a memory budget.
+
+    Datasets are kept in least-recently-used order. Once their combined
+    size exceeds `settings.dataset_memory_budget_mb`, the least recently
+    used ones are evicted, spilled to a pickle under `settings.spill_dir`
+    (unless `settings.spill_datasets` is off) and reloaded on their next
+    `get_dataset`.
+    """
     
     @staticmethod
-    def load_dataset(file_path: str, dataset_name: str) -> dict:
+    def load_dataset(file_path: str, dataset_name: str, optimize_memory: bool = False) -> dict:
         """Load dataset into memory with automatic schema discovery."""
         
         # Determine format from file extension
@@ -97,15 +255,20 @@ class DatasetManager:
         elif file_path.endswith('.csv'):
             df = pd.read_csv(file_path)
             file_format = 'csv'
+        elif data_suffix(Path(file_path)) in COLUMNAR_SUFFIXES:
+            # Parquet/Feather/Arrow IPC, read through a memory map
+            df = read_columnar(Path(file_path))
+            file_format = data_suffix(Path(file_path)).lstrip('.')
         else:
             raise ValueError(f"Unsupported file format: {file_path}")
         
-        # Store in global memory
-        loaded_datasets[dataset_name] = df
-        
-        # Discover and cache schema
-        schema = DatasetSchema.from_dataframe(df, dataset_name)
-        dataset_schemas[dataset_name] = schema
+        memory_before = df.memory_usage(deep=True).sum()
+        if optimize_memory:
+            # Downcast integers and encode repeated strings as categoricals
+            df, _ = optimize_frame_memory(df)
+
+        # Store within the memory budget; the schema is discovered on first use
+        DatasetManager.register_dataset(dataset_name, df)
         
         return {
             "status": "loaded",
@@ -113,55 +276,136 @@ class DatasetManager:
             "rows": len(df),
             "columns": list(df.columns),
             "format": file_format,
-            "memory_usage": f"{df.memory_usage(deep=True).sum() / 1024**2:.1f} MB"
+            "memory_usage": f"{dataset_sizes[dataset_name] / 1024**2:.1f} MB",
+            "memory_usage_before_optimization": f"{memory_before / 1024**2:.1f} MB"
         }
     
+    @staticmethod
+    def register_dataset(dataset_name: str, df: pd.DataFrame) -> None:
+        """Store an already loaded DataFrame; its schema is built on first access."""
+        dataset_schemas.pop(dataset_name, None)
+        DatasetManager._store(dataset_name, df)
+
+    @staticmethod
+    def get_schema(dataset_name: str) -> DatasetSchema:
+        """Discover the dataset's schema once, reloading the dataset if it was spilled."""
+        try:
+            return dataset_schemas[dataset_name]
+        except KeyError:
+            raise ValueError(f"Dataset '{dataset_name}' not loaded. Use load_dataset() first.") from None
+    
+    @staticmethod
+    def _store(dataset_name: str, df: pd.DataFrame) -> None:
+        _remove_spill(dataset_name)
+        loaded_datasets[dataset_name] = df
+        loaded_datasets.move_to_end(dataset_name)
+        dataset_sizes[dataset_name] = int(df.memory_usage(deep=True).sum())
+        DatasetManager._enforce_budget(keep=dataset_name)
+    
+    @staticmethod
+    def _enforce_budget(keep: Optional[str] = None) -> None:
+        """Evict least recently used datasets until the rest fit the budget.
+
+        `keep` (the dataset just stored or requested) is never evicted, even
+        if it alone exceeds the budget.
+        """
+        budget = settings.dataset_memory_budget_mb * 1024**2
+        if budget <= 0:
+            return
+        total = sum(_dataset_bytes(name) for name in loaded_datasets)
+        for name in list(loaded_datasets):
+            if total <= budget:
+                break
+            if name == keep:
+                continue
+            total -= _dataset_bytes(name)
+            DatasetManager._evict(name)
+    
+    @staticmethod
+    def _evict(dataset_name: str) -> None:
+        df = loaded_datasets.pop(dataset_name)
+        dataset_stats["evictions"] += 1
+        if settings.spill_datasets:
+            path = _spill_path(dataset_name)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_pickle(path, protocol=pickle.HIGHEST_PROTOCOL)
+            spilled_datasets[dataset_name] = path
+            dataset_stats["spills"] += 1
+        else:
+            dataset_schemas.pop(dataset_name, None)
+            dataset_sizes.pop(dataset_name, None)
+    
     @staticmethod
     def get_dataset(dataset_name: str) -> pd.DataFrame:
-        """Retrieve dataset from memory."""
-        if dataset_name not in loaded_datasets:
+        """Retrieve dataset from memory, reloading it if it was spilled."""
+        if dataset_name in loaded_datasets:
+            dataset_stats["hits"] += 1
+            loaded_datasets.move_to_end(dataset_name)
+            return loaded_datasets[dataset_name]
+        dataset_stats["misses"] += 1
+        if dataset_name not in spilled_datasets:
             raise ValueError(f"Dataset '{dataset_name}' not loaded. Use load_dataset() first.")
-        return loaded_datasets[dataset_name]
+        df = pd.read_pickle(spilled_datasets[dataset_name])
+        dataset_stats["reloads"] += 1
+        DatasetManager._store(dataset_name, df)
+        return df
     
     @staticmethod
     def list_datasets() -> List[str]:
-        """Get names of all loaded datasets."""
-        return list(loaded_datasets.keys())
+        """Get names of all loaded datasets, including spilled ones."""
+        return list(loaded_datasets.keys()) + [n for n in spilled_datasets if n not in loaded_datasets]
+    
+    @staticmethod
+    def is_resident(dataset_name: str) -> bool:
+        """Whether the dataset is in memory rather than spilled to disk."""
+        return dataset_name in loaded_datasets
     
     @staticmethod
     def get_dataset_info(dataset_name: str) -> dict:
-        """Get basic info about loaded dataset."""
-        if dataset_name not in loaded_datasets:
+        """Get basic info about a dataset, reloading it if spilled only when
+        its schema has not been discovered yet."""
+        if dataset_name not in loaded_datasets and dataset_name not in spilled_datasets:
             raise ValueError(f"Dataset '{dataset_name}' not loaded")
             
-        df = loaded_datasets[dataset_name]
-        schema = dataset_schemas[dataset_name]
+        schema = DatasetManager.get_schema(dataset_name)
+        resident = dataset_name in loaded_datasets
         
         return {
             "name": dataset_name,
-            "shape": df.shape,
-            "columns": list(df.columns),
-            "memory_usage_mb": df.memory_usage(deep=True).sum() / 1024**2,
+            "shape": (schema.row_count, len(schema.columns)),
+            "columns": list(schema.columns),
+            "memory_usage_mb": (_dataset_bytes(dataset_name) if resident else dataset_sizes[dataset_name]) / 1024**2,
+            "resident": resident,
+            "spill_path": None if resident else str(spilled_datasets[dataset_name]),
+            "cache": {
+                **dataset_stats,
+                "budget_mb": settings.dataset_memory_budget_mb,
+                "resident_mb": sum(_dataset_bytes(name) for name in loaded_datasets) / 1024**2,
+            },
             "schema": schema.model_dump()
         }
     
     @staticmethod
     def clear_dataset(dataset_name: str) -> dict:
-        """Remove dataset from memory."""
-        if dataset_name not in loaded_datasets:
+        """Remove dataset from memory and from the spill directory."""
+        if dataset_name not in loaded_datasets and dataset_name not in spilled_datasets:
             return {"error": f"Dataset '{dataset_name}' not found"}
         
-        del loaded_datasets[dataset_name]
-        del dataset_schemas[dataset_name]
+        loaded_datasets.pop(dataset_name, None)
+        _remove_spill(dataset_name)
+        dataset_schemas.pop(dataset_name, None)
+        dataset_sizes.pop(dataset_name, None)
         
         return {"status": "success", "message": f"Dataset '{dataset_name}' cleared from memory"}
     
     @staticmethod
     def clear_all_datasets() -> dict:
         """Clear all datasets from memory."""
-        count = len(loaded_datasets)
+        count = len(DatasetManager.list_datasets())
         loaded_datasets.clear()
+        _remove_all_spills()
         dataset_schemas.clear()
+        dataset_sizes.clear()
         
         return {"status": "success", "message": f"Cleared {count} datasets from memory"}
 
@@ -0,0 +1,198 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from ..config.settings import settings
+
+_FINGERPRINT_BYTES = 65536
+# Part of every entry's key: bump it whenever a parser change alters what
+# load_data returns for the same file, so older entries are never served.
+CACHE_FORMAT_VERSION = 1
+# Rows whose deep memory usage is measured to estimate a frame's size.
+_ESTIMATE_ROWS = 10_000
+
+
+def _has_arrow() -> bool:
+    try:
+        import pyarrow.feather  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def cache_available() -> bool:
+    return settings.cache_enabled and _has_arrow()
+
+
+def _entry_key(p: Path) -> str:
+    key = f"v{CACHE_FORMAT_VERSION}:{p.resolve()}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def fingerprint(p: Path) -> Dict[str, Any]:
+    # Size + mtime catch almost every change; hashing the head and tail of the
+    # file also catches in-place rewrites that preserve both.
+    st = p.stat()
+    h = hashlib.blake2b(digest_size=16)
+    with p.open("rb") as f:
+        h.update(f.read(_FINGERPRINT_BYTES))
+        if st.st_size > _FINGERPRINT_BYTES:
+            f.seek(max(_FINGERPRINT_BYTES, st.st_size - _FINGERPRINT_BYTES))
+            h.update(f.read(_FINGERPRINT_BYTES))
+    return {
+        "source": str(p.resolve()),
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "content_hash": h.hexdigest(),
+    }
+
+
+def _paths(key: str) -> tuple[Path, Path]:
+    base = settings.cache_dir
+    return base / f"{key}.feather", base / f"{key}.json"
+
+
+def _read_meta(meta_path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def get(p: Path, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+    if not cache_available():
+        return None
+    data_path, meta_path = _paths(_entry_key(p))
+    meta = _read_meta(meta_path)
+    if meta is None or not data_path.exists():
+        return None
+
+    st = p.stat()
+    if meta.get("format") != CACHE_FORMAT_VERSION:
+        return None
+    if meta.get("size") != st.st_size or meta.get("mtime_ns") != st.st_mtime_ns:
+        return None
+    if meta.get("content_hash") != fingerprint(p)["content_hash"]:
+        return None
+
+    if columns:
+        cached_columns = meta.get("column_names")
+        if cached_columns is None:
+            return None
+        # Keep file order and drop unknown names, like usecols on a fresh parse.
+        wanted = set(columns)
+        columns = [c for c in cached_columns if c in wanted]
+
+    import pyarrow.feather as feather
+
+    try:
+        df = feather.read_feather(data_path, columns=columns, memory_map=True)
+    except Exception:
+        return None
+    # Touch the entry so eviction sees it as recently used.
+    os.utime(data_path)
+    return df
+
+
+def estimated_bytes(df: pd.DataFrame) -> int:
+    if len(df) <= _ESTIMATE_ROWS:
+        return int(df.memory_usage(deep=True, index=False).sum())
+    head = df.head(_ESTIMATE_ROWS)
+    return int(head.memory_usage(deep=True, index=False).sum() * len(df) / _ESTIMATE_ROWS)
+
+
+def fits(df: pd.DataFrame) -> bool:
+    """Whether the frame can be cached without exceeding cache_max_mb on its own."""
+    return estimated_bytes(df) <= settings.cache_max_mb * 1024**2
+
+
+def put(p: Path, df: pd.DataFrame) -> bool:
+    # An entry over the cap would be written in full and evicted right away.
+    if not cache_available() or not fits(df):
+        return False
+    settings.cache_dir.mkdir(parents=True, exist_ok=True)
+    data_path, meta_path = _paths(_entry_key(p))
+
+    import pyarrow.feather as feather
+
+    tmp_path = data_path.with_suffix(".tmp")
+    try:
+        # Feather needs string column names and a default index.
+        frame = df.reset_index(drop=True)
+        frame.columns = [str(c) for c in frame.columns]
+        feather.write_feather(frame, tmp_path, compression="uncompressed")
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        return False
+    os.replace(tmp_path, data_path)
+
+    meta = fingerprint(p)
+    meta.update(
+        {
+            "format": CACHE_FORMAT_VERSION,
+            "rows": int(len(df)),
+            "columns": int(len(df.columns)),
+            "column_names": [str(c) for c in df.columns],
+            "cached_bytes": data_path.stat().st_size,
+            "created": time.time(),
+        }
+    )
+    meta_path.write_text(json.dumps(meta), encoding="utf-8")
+
+    evict()
+    return True
+
+
+def list_entries() -> List[Dict[str, Any]]:
+    base = settings.cache_dir
+    if not base.exists():
+        return []
+    entries = []
+    for data_path in base.glob("*.feather"):
+        meta = _read_meta(data_path.with_suffix(".json")) or {}
+        st = data_path.stat()
+        entries.append(
+            {
+                "key": data_path.stem,
+                "source": meta.get("source", "?"),
+                "rows": meta.get("rows"),
+                "columns": meta.get("columns"),
+                "bytes": st.st_size,
+                "last_used": st.st_mtime,
+            }
+        )
+    entries.sort(key=lambda e: e["last_used"], reverse=True)
+    return entries
+
+
+def remove(key: str) -> None:
+    data_path, meta_path = _paths(key)
+    data_path.unlink(missing_ok=True)
+    meta_path.unlink(missing_ok=True)
+
+
+def clear() -> int:
+    entries = list_entries()
+    for e in entries:
+        remove(e["key"])
+    return len(entries)
+
+
+def evict(max_bytes: Optional[int] = None) -> List[str]:
+    if max_bytes is None:
+        max_bytes = settings.cache_max_mb * 1024**2
+    entries = list_entries()
+    total = sum(e["bytes"] for e in entries)
+    evicted: List[str] = []
+    # Entries are sorted most recently used first; drop from the tail.
+    while entries and total > max_bytes:
+        e = entries.pop()
+        remove(e["key"])
+        total -= e["bytes"]
+        evicted.append(e["source"])
+    return evicted
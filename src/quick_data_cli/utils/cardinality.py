@@ -0,0 +1,36 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+HLL_PRECISION = 14
+# Relative standard error of the estimate: 1.04 / sqrt(2 ** precision).
+HLL_ERROR = 1.04 / math.sqrt(1 << HLL_PRECISION)
+
+
+def approx_nunique(series: pd.Series, precision: int = HLL_PRECISION) -> int:
+    """HyperLogLog estimate of the number of distinct non-null values.
+
+    Values are hashed with pandas' stable object hash, so equal values
+    collide regardless of dtype; the estimate is within about 1% for
+    precision 14 and needs only 2**precision registers of memory.
+    """
+    values = series.dropna()
+    if values.empty:
+        return 0
+    hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+    m = 1 << precision
+    buckets = (hashes >> np.uint64(64 - precision)).astype(np.intp)
+    # The remaining bits, with a guard bit so an all-zero tail still ranks.
+    tail = (hashes << np.uint64(precision)) | np.uint64(1 << (precision - 1))
+    ranks = 64 - np.floor(np.log2(tail.astype(np.float64))).astype(np.int8)
+    registers = np.zeros(m, dtype=np.int8)
+    np.maximum.at(registers, buckets, ranks)
+
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.sum(np.exp2(-registers.astype(np.float64)))
+    empty = int(np.count_nonzero(registers == 0))
+    if estimate <= 2.5 * m and empty:
+        # Small-range correction (linear counting).
+        estimate = m * math.log(m / empty)
+    return min(int(round(estimate)), len(values))
@@ -0,0 +1,122 @@
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .filters import RowFilter, apply_filters, ranges_may_match
+from .formats import compression_of, data_suffix
+
+PARQUET_SUFFIXES = {".parquet", ".pq"}
+ARROW_SUFFIXES = {".feather", ".arrow", ".ipc"}
+COLUMNAR_SUFFIXES = PARQUET_SUFFIXES | ARROW_SUFFIXES
+
+
+def _require_arrow() -> None:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError("Reading Parquet/Feather/Arrow files requires pyarrow: pip install 'quick-data-cli[arrow]'")
+
+
+def _check(p: Path) -> None:
+    _require_arrow()
+    if compression_of(p) is not None:
+        # These formats compress internally; an outer layer would defeat mmap.
+        raise ValueError(f"Compressed {data_suffix(p)} files are not supported: {p.name}")
+
+
+def _select(names: List[str], columns: Optional[List[str]]) -> Optional[List[str]]:
+    # Same semantics as the CSV reader: file order, unknown names dropped.
+    if not columns:
+        return None
+    wanted = set(columns)
+    return [c for c in names if c in wanted]
+
+
+def _row_group_ranges(metadata: Any, i: int) -> Dict[str, Optional[Tuple[Any, Any]]]:
+    ranges: Dict[str, Optional[Tuple[Any, Any]]] = {}
+    rg = metadata.row_group(i)
+    for j in range(rg.num_columns):
+        chunk = rg.column(j)
+        stats = chunk.statistics
+        if stats is None or not stats.has_min_max:
+            continue
+        ranges[chunk.path_in_schema] = (stats.min, stats.max)
+    return ranges
+
+
+def _parquet_row_groups(pf: Any, filters: Sequence[RowFilter]) -> List[int]:
+    metadata = pf.metadata
+    groups = range(metadata.num_row_groups)
+    if not filters:
+        return list(groups)
+    return [i for i in groups if ranges_may_match(_row_group_ranges(metadata, i), filters)]
+
+
+def _open_parquet(p: Path) -> Any:
+    import pyarrow.parquet as pq
+
+    return pq.ParquetFile(p, memory_map=True)
+
+
+def _read_arrow_table(p: Path, columns: Optional[List[str]]) -> Any:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    try:
+        # Feather v2 is the Arrow IPC file format; both are memory-mapped, so
+        # only the selected columns' buffers are paged in.
+        return feather.read_table(p, columns=columns, memory_map=True)
+    except pa.ArrowInvalid:
+        # Arrow IPC streams have no footer and must be read front to back.
+        with pa.memory_map(str(p)) as source:
+            table = pa.ipc.open_stream(source).read_all()
+        return table.select(columns) if columns is not None else table
+
+
+def _arrow_names(p: Path) -> List[str]:
+    import pyarrow as pa
+
+    try:
+        with pa.memory_map(str(p)) as source:
+            return pa.ipc.open_file(source).schema.names
+    except pa.ArrowInvalid:
+        with pa.memory_map(str(p)) as source:
+            return pa.ipc.open_stream(source).schema.names
+
+
+def read_columnar(
+    p: Path,
+    columns: Optional[List[str]] = None,
+    filters: Sequence[RowFilter] = (),
+) -> pd.DataFrame:
+    _check(p)
+    if data_suffix(p) in PARQUET_SUFFIXES:
+        pf = _open_parquet(p)
+        groups = _parquet_row_groups(pf, filters)
+        table = pf.read_row_groups(groups, columns=_select(pf.schema_arrow.names, columns))
+    else:
+        table = _read_arrow_table(p, _select(_arrow_names(p), columns))
+    # Row groups that survive pruning can still hold non-matching rows.
+    return apply_filters(table.to_pandas(), filters)
+
+
+def iter_columnar_batches(
+    p: Path,
+    batch_size: int,
+    columns: Optional[List[str]] = None,
+    filters: Sequence[RowFilter] = (),
+) -> Iterator[pd.DataFrame]:
+    _check(p)
+    if data_suffix(p) in PARQUET_SUFFIXES:
+        pf = _open_parquet(p)
+        groups = _parquet_row_groups(pf, filters)
+        if not groups:
+            return
+        batches = pf.iter_batches(
+            batch_size=batch_size, row_groups=groups, columns=_select(pf.schema_arrow.names, columns)
+        )
+    else:
+        batches = _read_arrow_table(p, _select(_arrow_names(p), columns)).to_batches(max_chunksize=batch_size)
+    for batch in batches:
+        yield apply_filters(batch.to_pandas(), filters)
@@ -0,0 +1,163 @@
+import csv
+import io
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from .formats import open_text
+
+SAMPLE_CHARS = 65536
+CATEGORY_MIN_ROWS = 20
+CATEGORY_MAX_RATIO = 0.5
+CATEGORY_MAX_UNIQUE = 1000
+
+_DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}([ T]\d{2}:\d{2}(:\d{2}(\.\d+)?)?)?(Z|[+-]\d{2}:?\d{2})?$"
+
+
+@dataclass
+class CsvSchema:
+    sep: Optional[str]
+    header: bool
+    columns: List[str]
+    sample_dtypes: Dict[str, str] = field(default_factory=dict)
+    dtypes: Dict[str, str] = field(default_factory=dict)
+    date_columns: List[str] = field(default_factory=list)
+    sample_rows: int = 0
+
+    def read_csv_kwargs(
+        self,
+        columns: Optional[List[str]] = None,
+        engine: str = "c",
+        pin_numeric: bool = True,
+    ) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {}
+        if self.sep is not None:
+            kwargs["sep"] = self.sep
+        if not self.header:
+            kwargs["header"] = None
+            kwargs["names"] = self.columns
+
+        # Resolving projection against the sniffed header gives a plain list,
+        # which every engine accepts; unknown names are dropped, not raised.
+        selected = self.columns
+        if columns:
+            wanted = set(columns)
+            selected = [c for c in self.columns if c in wanted]
+            kwargs["usecols"] = selected
+
+        dtypes = {
+            c: t for c, t in self.dtypes.items() if c in selected and (pin_numeric or t == "category")
+        }
+        if dtypes:
+            kwargs["dtype"] = dtypes
+        dates = [c for c in self.date_columns if c in selected]
+        if dates:
+            kwargs["parse_dates"] = dates
+        if engine != "c":
+            kwargs["engine"] = engine
+        return kwargs
+
+    def summary(self) -> List[Dict[str, str]]:
+        rows = []
+        for c in self.columns:
+            if c in self.date_columns:
+                load_as = "datetime"
+            else:
+                load_as = self.dtypes.get(c, "inferred")
+            rows.append({"column": c, "sample_dtype": self.sample_dtypes.get(c, "?"), "load_as": load_as})
+        return rows
+
+
+def read_sample(p: Path) -> str:
+    with open_text(p, errors="replace") as f:
+        sample = f.read(SAMPLE_CHARS)
+        truncated = bool(f.read(1))
+    if truncated and "\n" in sample:
+        # Drop the partial last line so the sample parses cleanly.
+        sample = sample[: sample.rfind("\n") + 1]
+    return sample
+
+
+def sniff_separator(sample: str) -> Optional[str]:
+    lines = [ln for ln in sample.splitlines() if ln.strip()]
+    if lines:
+        header = lines[0]
+        candidates = [";", ",", "\t", "|"]
+        counts = {c: header.count(c) for c in candidates}
+        best = max(counts, key=counts.get)
+        if counts[best] > 0:
+            return best
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=";,\t,|")
+        return dialect.delimiter
+    except Exception:
+        return None
+
+
+def _looks_numeric(value: Any) -> bool:
+    if pd.isna(value) or str(value).strip() == "":
+        return False
+    try:
+        float(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _is_low_cardinality(values: pd.Series) -> bool:
+    n = len(values)
+    if n < CATEGORY_MIN_ROWS:
+        return False
+    unique = values.nunique()
+    return unique <= CATEGORY_MAX_UNIQUE and unique / n <= CATEGORY_MAX_RATIO
+
+
+def _has_header(raw: pd.DataFrame) -> bool:
+    # Like csv.Sniffer.has_header: the first row is a header when a column
+    # that is numeric further down holds a non-number in the first row.
+    if len(raw) < 2:
+        return True
+    first, body = raw.iloc[0], raw.iloc[1:]
+    numeric_cols = [
+        c for c in raw.columns if body[c].notna().any() and body[c].dropna().map(_looks_numeric).all()
+    ]
+    if not numeric_cols:
+        return True
+    return not all(_looks_numeric(first[c]) for c in numeric_cols)
+
+
+def infer_csv_schema(p: Path) -> CsvSchema:
+    sample = read_sample(p)
+    sep = sniff_separator(sample)
+    read_sep = sep if sep is not None else ","
+
+    raw = pd.read_csv(io.StringIO(sample), sep=read_sep, header=None, dtype=str)
+    header = _has_header(raw)
+    if header:
+        typed = pd.read_csv(io.StringIO(sample), sep=read_sep)
+        columns = [str(c) for c in typed.columns]
+    else:
+        columns = [f"column_{i + 1}" for i in range(raw.shape[1])]
+        typed = pd.read_csv(io.StringIO(sample), sep=read_sep, header=None, names=columns)
+
+    schema = CsvSchema(sep=sep, header=header, columns=columns, sample_rows=len(typed))
+    for col in typed.columns:
+        s = typed[col]
+        schema.sample_dtypes[str(col)] = str(s.dtype)
+        if pd.api.types.is_float_dtype(s.dtype):
+            schema.dtypes[str(col)] = "float64"
+            continue
+        # Integers are left to the parser: a null further down turns them into
+        # floats, which a pinned int64 would reject.
+        if pd.api.types.is_numeric_dtype(s.dtype) or pd.api.types.is_bool_dtype(s.dtype):
+            continue
+        values = s.dropna().astype(str)
+        if values.empty:
+            continue
+        if values.str.match(_DATE_PATTERN).all():
+            schema.date_columns.append(str(col))
+        elif _is_low_cardinality(values):
+            schema.dtypes[str(col)] = "category"
+    return schema
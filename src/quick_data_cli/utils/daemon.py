@@ -0,0 +1,336 @@
+import importlib
+import os
+import resource
+import sys
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+from ..config.settings import settings
+from .profiling import profiler
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_ANALYTICS_PACKAGE = __name__.rsplit(".", 2)[0] + ".analytics."
+
+# Options that change what load_data returns; part of each dataset's identity.
+_LOAD_SETTINGS = ("csv_engine", "optimize_memory", "add_source_column", "row_filters")
+
+
+class DaemonError(Exception):
+    """An analysis run by the daemon raised; carries the original message."""
+
+
+def _key_path() -> Path:
+    return settings.daemon_socket.with_suffix(".key")
+
+
+def _authkey() -> Optional[bytes]:
+    try:
+        return _key_path().read_bytes()
+    except OSError:
+        return None
+
+
+def request(message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    # None means "no daemon": the caller falls back to running in-process.
+    if not settings.daemon_socket.exists():
+        return None
+    authkey = _authkey()
+    if authkey is None:
+        return None
+    try:
+        with Client(str(settings.daemon_socket), family="AF_UNIX", authkey=authkey) as conn:
+            conn.send(message)
+            return conn.recv()
+    except (OSError, EOFError, AuthenticationError):
+        # Stale socket, or the daemon went away mid-request.
+        return None
+
+
+def _func_name(func: Callable) -> str:
+    return f"{func.__module__}:{func.__qualname__}"
+
+
+def run_analysis(
+    file_path: Union[str, Path],
+    func: Callable[..., Any],
+    load_columns: Optional[List[str]] = None,
+    cache_result: bool = True,
+    **kwargs: Any,
+) -> Any:
+    # Results depend only on the input files and the arguments, so an
+    # identical earlier run can answer without loading anything.
+    # `cache_result=False` is for functions with side effects (charts).
+    load_settings = {name: getattr(settings, name) for name in _LOAD_SETTINGS}
+    key = None
+    if cache_result and settings.result_cache_enabled and not settings.show_schema:
+        from . import result_cache
+
+        with profiler.stage("result_cache"):
+            key = result_cache.result_key(file_path, func, load_columns, kwargs, load_settings)
+            cached = result_cache.get(key)
+        if cached is not None:
+            result, age = cached
+            sys.stderr.write(result_cache.note(age) + "\n")
+            return result
+
+    result = _compute(file_path, func, load_columns, load_settings, kwargs)
+    if key is not None and not (isinstance(result, dict) and "error" in result):
+        result_cache.put(key, result)
+    return result
+
+
+def _compute(
+    file_path: Union[str, Path],
+    func: Callable[..., Any],
+    load_columns: Optional[List[str]],
+    load_settings: Dict[str, Any],
+    kwargs: Dict[str, Any],
+) -> Any:
+    # The daemon is skipped for --show-schema so the schema prints here.
+    if settings.use_daemon and not settings.show_schema:
+        with profiler.stage("daemon"):
+            response = request(
+                {
+                    "op": "run",
+                    "cwd": os.getcwd(),
+                    "file_path": str(file_path),
+                    "columns": load_columns,
+                    "func": _func_name(func),
+                    "kwargs": kwargs,
+                    "settings": load_settings,
+                }
+            )
+        # A "fallback" error comes from the daemon itself (an import or a
+        # load that failed there), not from the analysis: run it here instead.
+        if response is not None and not response.get("fallback"):
+            if "error" in response:
+                raise DaemonError(response["error"])
+            return response["result"]
+
+    from .loader import load_data
+
+    df = load_data(Path(file_path), columns=load_columns)
+    with profiler.stage("compute", cprofile=True):
+        return func(df, **kwargs)
+
+
+def _resolve(name: str) -> Callable[..., Any]:
+    # Only analytics functions can be invoked; requests never name arbitrary code.
+    module_name, _, attr = name.partition(":")
+    if not module_name.startswith(_ANALYTICS_PACKAGE) or "." in attr:
+        raise ValueError(f"Not an analytics function: {name}")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    # ru_maxrss is the peak, in KB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+class DatasetDaemon:
+    """Serves analytics requests against datasets kept in memory between CLI runs."""
+
+    def __init__(self, idle_timeout: float, dataset_ttl: float):
+        self.idle_timeout = idle_timeout
+        self.dataset_ttl = dataset_ttl
+        self.started = time.time()
+        self.last_request = self.started
+        self.resident: Dict[str, Dict[str, Any]] = {}
+        self.running = True
+
+    def _dataset_name(self, file_path: str, load_settings: Dict[str, Any]) -> str:
+        name = os.path.abspath(file_path)
+        options = [f"{k}={load_settings.get(k)}" for k in _LOAD_SETTINGS]
+        return f"{name} [{', '.join(options)}]"
+
+    @staticmethod
+    def _fingerprint(file_path: str) -> Tuple[Tuple[str, int, int], ...]:
+        from .loader import expand_inputs
+
+        stats = []
+        for p in expand_inputs(file_path):
+            st = p.stat()
+            stats.append((str(p), st.st_size, st.st_mtime_ns))
+        return tuple(stats)
+
+    def dataset(self, file_path: str, load_settings: Dict[str, Any]) -> "pd.DataFrame":
+        from ..models.schemas import DatasetManager
+        from .loader import load_data
+
+        name = self._dataset_name(file_path, load_settings)
+        fingerprint = self._fingerprint(file_path)
+        self._prune()
+        entry = self.resident.get(name)
+        if entry is not None and entry["fingerprint"] == fingerprint:
+            entry["hits"] += 1
+            entry["last_used"] = time.time()
+            return DatasetManager.get_dataset(name)
+
+        if entry is not None:
+            # The file changed on disk since it was loaded.
+            self.drop(name)
+        for key, value in load_settings.items():
+            setattr(settings, key, value)
+        start = time.time()
+        df = load_data(Path(file_path))
+        DatasetManager.register_dataset(name, df)
+        self.resident[name] = {
+            "fingerprint": fingerprint,
+            "rows": int(len(df)),
+            "columns": int(len(df.columns)),
+            "bytes": int(df.memory_usage(deep=True).sum()),
+            "load_seconds": time.time() - start,
+            "loaded_at": start,
+            "last_used": time.time(),
+            "hits": 0,
+        }
+        return df
+
+    def _prune(self) -> None:
+        # Without spilling, the memory budget evicts frames from
+        # DatasetManager outright; forget those so they are loaded again.
+        from ..models.schemas import DatasetManager
+
+        known = set(DatasetManager.list_datasets())
+        for name in [n for n in self.resident if n not in known]:
+            del self.resident[name]
+
+    def drop(self, name: str) -> None:
+        from ..models.schemas import DatasetManager
+
+        DatasetManager.clear_dataset(name)
+        self.resident.pop(name, None)
+
+    def evict_idle(self) -> None:
+        now = time.time()
+        for name, entry in list(self.resident.items()):
+            if now - entry["last_used"] > self.dataset_ttl:
+                self.drop(name)
+
+    def status(self) -> Dict[str, Any]:
+        from ..models.schemas import DatasetManager
+
+        self._prune()
+        now = time.time()
+        return {
+            "pid": os.getpid(),
+            "socket": str(settings.daemon_socket),
+            "uptime_seconds": now - self.started,
+            "idle_seconds": now - self.last_request,
+            "idle_timeout": self.idle_timeout,
+            "dataset_ttl": self.dataset_ttl,
+            "rss_bytes": _rss_bytes(),
+            "memory_budget_mb": settings.dataset_memory_budget_mb,
+            "datasets": [
+                {
+                    "name": name,
+                    "idle_seconds": now - e["last_used"],
+                    "spilled": not DatasetManager.is_resident(name),
+                    **{k: v for k, v in e.items() if k != "fingerprint"},
+                }
+                for name, e in self.resident.items()
+            ],
+        }
+
+    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            return self._handle(message)
+        except Exception as e:
+            return {"error": str(e), "fallback": True}
+
+    def _handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        op = message.get("op")
+        if op == "tick":
+            self.evict_idle()
+            if time.time() - self.last_request > self.idle_timeout:
+                self.running = False
+            return {"result": None}
+
+        if op == "status":
+            return {"result": self.status()}
+        if op == "stop":
+            self.running = False
+            return {"result": None}
+        if op != "run":
+            return {"error": f"Unknown request: {op}"}
+
+        self.last_request = time.time()
+
+        from .loader import _project
+
+        os.chdir(message["cwd"])
+        func = _resolve(message["func"])
+        df = _project(self.dataset(message["file_path"], message["settings"]), message["columns"])
+        try:
+            result = func(df, **message["kwargs"])
+        except Exception as e:
+            return {"error": str(e)}
+        return {"result": result}
+
+    def _ticker(self, address: str, authkey: bytes, interval: float) -> None:
+        # accept() cannot time out, so a background thread wakes the loop up
+        # to evict idle datasets and check the idle timeout.
+        while self.running:
+            time.sleep(interval)
+            try:
+                with Client(address, family="AF_UNIX", authkey=authkey) as conn:
+                    conn.send({"op": "tick"})
+                    conn.recv()
+            except (OSError, EOFError):
+                return
+
+    def serve(self) -> None:
+        sock = settings.daemon_socket
+        sock.parent.mkdir(parents=True, exist_ok=True)
+        if request({"op": "status"}) is not None:
+            raise RuntimeError(f"A daemon is already listening on {sock}")
+        sock.unlink(missing_ok=True)
+
+        authkey = os.urandom(32)
+        key_path = _key_path()
+        fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(authkey)
+
+        # Datasets are loaded by this process, never by the clients.
+        settings.show_schema = False
+        listener = Listener(str(sock), family="AF_UNIX", authkey=authkey)
+        os.chmod(sock, 0o600)
+        interval = max(1.0, min(30.0, self.idle_timeout / 4, self.dataset_ttl / 4))
+        threading.Thread(target=self._ticker, args=(str(sock), authkey, interval), daemon=True).start()
+        try:
+            while self.running:
+                try:
+                    conn = listener.accept()
+                except (OSError, EOFError, AuthenticationError):
+                    # Failed handshake, e.g. a client with a stale key.
+                    continue
+                with conn:
+                    try:
+                        message = conn.recv()
+                        response = self.handle(message)
+                        try:
+                            conn.send(response)
+                        except (TypeError, AttributeError, ValueError) as e:
+                            # The result could not be pickled.
+                            conn.send({"error": f"Cannot return result: {e}"})
+                    except (OSError, EOFError):
+                        continue
+        finally:
+            listener.close()
+            sock.unlink(missing_ok=True)
+            key_path.unlink(missing_ok=True)
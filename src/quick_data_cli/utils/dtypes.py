@@ -12,6 +12,10 @@ from pandas.api.types import (
 def display_dtype(series: pd.Series) -> str:
     if is_string_dtype(series.dtype):
         return "string"
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Report the logical type, so loading text as category (pinned or
+        # memory-optimized) does not change what the user sees.
+        return display_dtype(pd.Series(series.cat.categories))
     if is_object_dtype(series.dtype):
         non_null = series.dropna()
         if not non_null.empty:
@@ -26,3 +30,15 @@ def display_dtype(series: pd.Series) -> str:
     if is_float_dtype(series.dtype):
         return "float"
     return str(series.dtype)
+
+
+def remove_unused_categories(df: pd.DataFrame) -> pd.DataFrame:
+    # Categories pinned at load time survive filtering and sampling, and
+    # value counts would report the dropped ones with a count of zero.
+    cats = [c for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)]
+    if not cats:
+        return df
+    df = df.copy(deep=False)
+    for c in cats:
+        df[c] = df[c].cat.remove_unused_categories()
+    return df
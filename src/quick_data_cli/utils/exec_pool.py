@@ -0,0 +1,370 @@
+"""Script execution for the `execute` command.
+
+The wrapper code runs in a separate interpreter (under `uv run` when uv is
+available) so user scripts never share a process with the CLI. The CLI
+loads the dataset and shares it through utils.shared_frame; a single
+script gets a one-shot interpreter, batches go to a pool of warm workers
+that import pandas and map the dataset once, then fork a fresh process for
+each script sent over their stdin.
+"""
+
+import json
+import os
+import queue
+import select
+import shutil
+import signal
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .shared_frame import MAP_FRAME_CODE
+
+WRAPPER_CODE = MAP_FRAME_CODE + r'''
+script_path = Path(sys.argv[2])
+if not script_path.exists():
+    print(f"ERROR: Script file not found: {script_path}")
+    raise SystemExit(2)
+
+ns = {"df": df, "pd": pd, "np": np}
+code = script_path.read_text(encoding='utf-8')
+try:
+    exec(compile(code, str(script_path), 'exec'), ns, ns)
+except Exception as e:
+    import traceback
+    print(f"ERROR: {type(e).__name__}: {e}")
+    print("Traceback:")
+    print(traceback.format_exc())
+    raise SystemExit(1)
+'''
+
+# Runs the script's reduce(results) over the pickled map results, or
+# concatenates them, and prints what comes back.
+REDUCE_CODE = MAP_FRAME_CODE + r'''
+import traceback
+
+script_path = Path(sys.argv[2])
+result_paths = sorted(Path(sys.argv[3]).glob("*.pkl"), key=lambda p: int(p.stem))
+ns = {"df": df, "pd": pd, "np": np}
+try:
+    exec(compile(script_path.read_text(encoding="utf-8"), str(script_path), "exec"), ns, ns)
+    results = []
+    for path in result_paths:
+        with open(path, "rb") as f:
+            results.append(pickle.load(f))
+    reduce = ns.get("reduce")
+    if callable(reduce):
+        result = reduce(results)
+    elif results and all(isinstance(r, (pd.DataFrame, pd.Series)) for r in results):
+        result = pd.concat(results)
+    elif all(isinstance(r, list) for r in results):
+        result = [x for r in results for x in r]
+    else:
+        result = results
+except Exception as e:
+    print(f"ERROR: {type(e).__name__}: {e}")
+    print("Traceback:")
+    print(traceback.format_exc())
+    raise SystemExit(1)
+if result is not None:
+    print(result)
+'''
+
+# Protocol: one JSON line per message on a private copy of the original
+# stdout; fd 1 itself is pointed at /dev/null so stray writes from C
+# extensions or child processes cannot corrupt it. The worker announces
+# {"ready": true} once the dataset is mapped, then answers each
+# {"script": path} with {"stdout", "stderr", "returncode", "rss_bytes"}.
+# Requests carrying "partition" also call the script's map() on that slice
+# and pickle the result to request["result"].
+# rss_bytes is the warm process's private memory (the shared frame is not
+# growth); scripts run in short-lived forks and never add to it.
+WORKER_CODE = r'''
+import io
+import json
+import os
+import sys
+import traceback
+from contextlib import redirect_stdout, redirect_stderr
+
+_proto = os.fdopen(os.dup(1), "w", encoding="utf-8")
+_null = os.open(os.devnull, os.O_WRONLY)
+os.dup2(_null, 1)
+
+def _send(message):
+    _proto.write(json.dumps(message) + "\n")
+    _proto.flush()
+
+def _rss_bytes():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("RssAnon:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+''' + MAP_FRAME_CODE + r'''
+_labels = {}
+
+def _map_partition(ns, request):
+    fn = ns.get("map")
+    if not callable(fn):
+        raise TypeError("partitioned scripts must define map(df_part)")
+    k, n = request["partition"], request["partitions"]
+    if request.get("labels"):
+        part = df[_labels[request["labels"]] == k]
+    else:
+        part = df.iloc[k * len(df) // n : (k + 1) * len(df) // n]
+    result = fn(part)
+    with open(request["result"], "wb") as f:
+        pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+def _run(request):
+    script_path = Path(request["script"])
+    out, err = io.StringIO(), io.StringIO()
+    returncode = 0
+    with redirect_stdout(out), redirect_stderr(err):
+        if not script_path.exists():
+            print(f"ERROR: Script file not found: {script_path}")
+            returncode = 2
+        else:
+            ns = {"df": df, "pd": pd, "np": np}
+            try:
+                code = script_path.read_text(encoding="utf-8")
+                exec(compile(code, str(script_path), "exec"), ns, ns)
+                if "partition" in request:
+                    _map_partition(ns, request)
+            except SystemExit as e:
+                if isinstance(e.code, int) or e.code is None:
+                    returncode = e.code or 0
+                else:
+                    print(e.code, file=sys.stderr)
+                    returncode = 1
+            except Exception as e:
+                print(f"ERROR: {type(e).__name__}: {e}")
+                print("Traceback:")
+                print(traceback.format_exc())
+                returncode = 1
+    return {"stdout": out.getvalue(), "stderr": err.getvalue(), "returncode": returncode}
+
+_send({"ready": True})
+
+for line in sys.stdin:
+    request = json.loads(line)
+    if request.get("labels") and request["labels"] not in _labels:
+        _labels[request["labels"]] = _map_frame(request["labels"]).iloc[:, 0].to_numpy()
+    # Each script runs in a fork of this process: pandas is imported and the
+    # frame mapped already, and whatever the script changes (options,
+    # builtins, patched modules, the frame itself) dies with the fork.
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        try:
+            data = json.dumps(_run(request)).encode()
+            with os.fdopen(write_fd, "wb") as f:
+                f.write(data)
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as f:
+        data = f.read()
+    _, status = os.waitpid(pid, 0)
+    if data:
+        reply = json.loads(data)
+    else:
+        # The script took its process down (os._exit, a crash in C code).
+        code = os.waitstatus_to_exitcode(status)
+        reply = {"stdout": "", "stderr": f"ERROR: Script process exited with status {code}", "returncode": 1}
+    reply["rss_bytes"] = _rss_bytes()
+    _send(reply)
+'''
+
+
+def interpreter_cmd(code: str, *args: str) -> List[str]:
+    if shutil.which("uv"):
+        return ["uv", "run", "python", "-c", code, *args]
+    return ["python", "-c", code, *args]
+
+
+@dataclass
+class ScriptResult:
+    script: str
+    stdout: str = ""
+    stderr: str = ""
+    returncode: int = 0
+    timed_out: bool = False
+    seconds: float = 0.0
+
+
+class WorkerError(RuntimeError):
+    """A worker failed to start or exited unexpectedly."""
+
+    def __init__(self, message: str, returncode: int):
+        super().__init__(message)
+        self.returncode = returncode
+
+
+class _Worker:
+    def __init__(self, frame_path: str, timeout: float):
+        self.runs = 0
+        self.rss_bytes = 0
+        self._buffer = b""
+        self.proc = subprocess.Popen(
+            interpreter_cmd(WORKER_CODE, frame_path),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            # Its own process group, so kill() also takes down the script's
+            # fork (and the interpreter under `uv run`).
+            start_new_session=True,
+        )
+        ready = self._read(timeout)
+        if ready is None:
+            self.kill()
+            raise WorkerError(f"TIMEOUT: Worker start exceeded {timeout:g} seconds", 1)
+
+    def _read(self, timeout: float) -> Optional[dict]:
+        """Next protocol message, or None on timeout."""
+        fd = self.proc.stdout.fileno()
+        deadline = time.monotonic() + timeout
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                return None
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                self.proc.wait()
+                raise WorkerError(f"ERROR: Worker exited with status {self.proc.returncode}", 1)
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return json.loads(line)
+
+    def run(self, request: Dict[str, Any], label: str, timeout: float) -> ScriptResult:
+        start = time.perf_counter()
+        self.runs += 1
+        self.proc.stdin.write((json.dumps(request) + "\n").encode())
+        self.proc.stdin.flush()
+        try:
+            reply = self._read(timeout)
+        except WorkerError as e:
+            # The script took the interpreter down (os._exit, a crash in C code).
+            return ScriptResult(label, stderr=str(e), returncode=1, seconds=time.perf_counter() - start)
+        seconds = time.perf_counter() - start
+        if reply is None:
+            self.kill()
+            return ScriptResult(label, returncode=1, timed_out=True, seconds=seconds)
+        self.rss_bytes = reply["rss_bytes"]
+        return ScriptResult(label, reply["stdout"], reply["stderr"], reply["returncode"], seconds=seconds)
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def close(self) -> None:
+        if self.alive:
+            self.proc.stdin.close()
+            try:
+                self.proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.kill()
+
+    def kill(self) -> None:
+        try:
+            os.killpg(self.proc.pid, signal.SIGKILL)
+        except OSError:
+            self.proc.kill()
+        self.proc.wait()
+
+
+@dataclass
+class WorkerPool:
+    """Warm interpreters with the shared frame at `frame_path` mapped, recycled after `recycle_after`
+    scripts or once their resident memory exceeds `max_worker_mb`."""
+
+    frame_path: str
+    workers: int
+    timeout: float = 60
+    recycle_after: int = 50
+    max_worker_mb: Optional[float] = None
+    # Interpreter start and pandas import; not charged to any script.
+    startup_timeout: float = 300
+    started: int = field(default=0, init=False)
+
+    def _needs_recycle(self, worker: _Worker) -> bool:
+        if not worker.alive or worker.runs >= self.recycle_after:
+            return True
+        if self.max_worker_mb is None:
+            return False
+        return worker.rss_bytes > self.max_worker_mb * 1024 * 1024
+
+    def _spawn(self) -> _Worker:
+        self.started += 1
+        return _Worker(self.frame_path, self.startup_timeout)
+
+    def run(self, scripts: List[str]) -> List[ScriptResult]:
+        """Run every script, returning results in input order."""
+        # Absolute paths, so a script that changes directory cannot break the next.
+        requests = [{"script": str(Path(s).resolve())} for s in scripts]
+        return self._dispatch(requests, scripts)
+
+    def map_partitions(
+        self, script: str, partitions: int, result_dir: str, labels: Optional[str] = None
+    ) -> List[ScriptResult]:
+        """Call the script's map() once per partition, pickling each result
+        to `result_dir/<k>.pkl`. Partitions are row ranges, or the rows whose
+        entry in the shared `labels` frame equals k."""
+        path = str(Path(script).resolve())
+        requests = [
+            {
+                "script": path,
+                "partition": k,
+                "partitions": partitions,
+                "labels": labels,
+                "result": str(Path(result_dir) / f"{k}.pkl"),
+            }
+            for k in range(partitions)
+        ]
+        return self._dispatch(requests, [f"partition {k + 1}/{partitions}" for k in range(partitions)])
+
+    def _dispatch(self, requests: List[Dict[str, Any]], labels: List[str]) -> List[ScriptResult]:
+        jobs: "queue.Queue[int]" = queue.Queue()
+        for i in range(len(requests)):
+            jobs.put(i)
+        results: List[Optional[ScriptResult]] = [None] * len(requests)
+        errors: List[WorkerError] = []
+
+        def drain() -> None:
+            worker: Optional[_Worker] = None
+            try:
+                while not errors:
+                    try:
+                        i = jobs.get_nowait()
+                    except queue.Empty:
+                        break
+                    if worker is None or self._needs_recycle(worker):
+                        if worker is not None:
+                            worker.close()
+                        worker = self._spawn()
+                    results[i] = worker.run(requests[i], labels[i], self.timeout)
+            except WorkerError as e:
+                errors.append(e)
+            finally:
+                if worker is not None:
+                    worker.close()
+
+        threads = [threading.Thread(target=drain) for _ in range(max(1, min(self.workers, len(requests))))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        if errors:
+            raise errors[0]
+        return results  # type: ignore[return-value]
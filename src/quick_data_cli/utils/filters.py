@@ -0,0 +1,95 @@
+import operator
+import re
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .dtypes import remove_unused_categories
+
+RowFilter = Tuple[str, str, Any]
+
+_OPS: Dict[str, Callable[[Any, Any], Any]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+_FILTER_RE = re.compile(r"^\s*(.+?)\s*(==|!=|<=|>=|<|>|=)\s*(.*?)\s*$")
+
+
+def _parse_value(text: str) -> Any:
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "'\"":
+        return text[1:-1]
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+
+def parse_filter(expr: str) -> RowFilter:
+    # "amount>=100", "region==EU", "name='a b'"; a bare "=" means "==".
+    m = _FILTER_RE.match(expr)
+    if not m or not m.group(1):
+        raise ValueError(f"Invalid filter: {expr!r}; expected COLUMN OP VALUE with OP one of {', '.join(_OPS)}")
+    column, op, value = m.groups()
+    return column, "==" if op == "=" else op, _parse_value(value)
+
+
+def filter_columns(filters: Sequence[RowFilter]) -> List[str]:
+    return list(dict.fromkeys(col for col, _, _ in filters))
+
+
+def apply_filters(df: pd.DataFrame, filters: Sequence[RowFilter]) -> pd.DataFrame:
+    if not filters:
+        return df
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in filters:
+        if column not in df.columns:
+            raise ValueError(f"Filter column '{column}' not found")
+        try:
+            mask &= _OPS[op](df[column], value).fillna(False).astype(bool)
+        except TypeError:
+            raise ValueError(f"Cannot compare column '{column}' ({df[column].dtype}) with {value!r}")
+    return remove_unused_categories(df[mask].reset_index(drop=True))
+
+
+def _coerce(bound: Any, value: Any) -> Any:
+    # Statistics come back as Python objects; compare dates as timestamps.
+    if isinstance(bound, (datetime, date)) and isinstance(value, str):
+        return pd.Timestamp(value)
+    return value
+
+
+def range_may_match(lo: Any, hi: Any, op: str, value: Any) -> bool:
+    # True unless the [lo, hi] range provably contains no matching value.
+    try:
+        value = _coerce(lo, value)
+        if op == "==":
+            return lo <= value <= hi
+        if op == "!=":
+            return not (lo == hi == value)
+        if op == "<":
+            return lo < value
+        if op == "<=":
+            return lo <= value
+        if op == ">":
+            return hi > value
+        if op == ">=":
+            return hi >= value
+    except (TypeError, ValueError):
+        pass
+    return True
+
+
+def ranges_may_match(ranges: Dict[str, Optional[Tuple[Any, Any]]], filters: Sequence[RowFilter]) -> bool:
+    for column, op, value in filters:
+        bounds = ranges.get(column)
+        if bounds is not None and not range_may_match(bounds[0], bounds[1], op, value):
+            return False
+    return True
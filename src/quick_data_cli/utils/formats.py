@@ -0,0 +1,28 @@
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+from typing import Optional, TextIO
+
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz"}
+
+_OPENERS = {"gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open}
+
+
+def compression_of(p: Path) -> Optional[str]:
+    return COMPRESSION_SUFFIXES.get(p.suffix.lower())
+
+
+def data_suffix(p: Path) -> str:
+    # The format suffix under any compression suffix: "orders.csv.gz" -> ".csv".
+    if compression_of(p) is not None:
+        return Path(p.stem).suffix.lower()
+    return p.suffix.lower()
+
+
+def open_text(p: Path, errors: str = "strict") -> TextIO:
+    # Decompresses on the fly, so callers only ever read what they consume.
+    compression = compression_of(p)
+    if compression is None:
+        return p.open("r", encoding="utf-8", errors=errors)
+    return _OPENERS[compression](p, "rt", encoding="utf-8", errors=errors)
@@ -0,0 +1,119 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, TextIO, Tuple
+
+import pandas as pd
+
+from .formats import data_suffix, open_text
+
+JSON_LINES_SUFFIXES = {".jsonl", ".ndjson"}
+JSON_SUFFIXES = {".json"} | JSON_LINES_SUFFIXES
+
+_BLOCK_CHARS = 1 << 20
+_WHITESPACE = " \t\r\n"
+
+
+class NotRecordsError(ValueError):
+    """The document is valid JSON but not an array or stream of objects."""
+
+
+def json_layout(p: Path) -> str:
+    # One of "lines", "array" or "document".
+    if data_suffix(p) in JSON_LINES_SUFFIXES:
+        return "lines"
+    with open_text(p, errors="replace") as f:
+        head = f.read(4096).lstrip()
+    if head.startswith("["):
+        return "array"
+    with open_text(p, errors="replace") as f:
+        # JSON Lines if the first two non-blank lines are each a complete
+        # object; a single-line document is read as regular JSON.
+        records = 0
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                if not isinstance(json.loads(line), dict):
+                    return "document"
+            except ValueError:
+                return "document"
+            records += 1
+            if records == 2:
+                return "lines"
+    return "document"
+
+
+def _next_token(f: TextIO, buf: str, pos: int) -> Tuple[str, int]:
+    while True:
+        while pos < len(buf) and buf[pos] in _WHITESPACE:
+            pos += 1
+        if pos < len(buf):
+            return buf, pos
+        more = f.read(_BLOCK_CHARS)
+        if not more:
+            raise ValueError("Unexpected end of JSON array")
+        buf, pos = more, 0
+
+
+def _iter_array_items(f: TextIO) -> Iterator[Any]:
+    # Decodes one element at a time with raw_decode, refilling the buffer
+    # whenever an element straddles a block boundary.
+    decoder = json.JSONDecoder()
+    buf, pos = _next_token(f, f.read(_BLOCK_CHARS), 0)
+    if buf[pos] != "[":
+        raise NotRecordsError("Expected a top-level JSON array")
+    buf, pos = _next_token(f, buf, pos + 1)
+    if buf[pos] == "]":
+        return
+
+    while True:
+        while True:
+            try:
+                item, pos = decoder.raw_decode(buf, pos)
+                break
+            except json.JSONDecodeError:
+                more = f.read(_BLOCK_CHARS)
+                if not more:
+                    raise
+                buf, pos = buf[pos:] + more, 0
+        yield item
+
+        if pos > _BLOCK_CHARS:
+            buf, pos = buf[pos:], 0
+        buf, pos = _next_token(f, buf, pos)
+        if buf[pos] == "]":
+            return
+        if buf[pos] != ",":
+            raise ValueError(f"Expected ',' or ']' in JSON array, found {buf[pos]!r}")
+        buf, pos = _next_token(f, buf, pos + 1)
+
+
+def _iter_line_items(f: TextIO) -> Iterator[Any]:
+    for line in f:
+        if line.strip():
+            yield json.loads(line)
+
+
+def _to_frame(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    # Nested objects become dotted columns, e.g. {"customer": {"id": 1}} ->
+    # "customer.id".
+    return pd.json_normalize(records)
+
+
+def iter_json_batches(p: Path, batch_size: int) -> Iterator[pd.DataFrame]:
+    layout = json_layout(p)
+    if layout == "document":
+        raise NotRecordsError("JSON document is not an array of records or JSON Lines")
+
+    with open_text(p) as f:
+        items = _iter_line_items(f) if layout == "lines" else _iter_array_items(f)
+        batch: List[Dict[str, Any]] = []
+        for item in items:
+            if not isinstance(item, dict):
+                raise NotRecordsError("JSON records must be objects")
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield _to_frame(batch)
+                batch = []
+        if batch:
+            yield _to_frame(batch)
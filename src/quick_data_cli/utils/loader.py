@@ -1,40 +1,368 @@
+import glob
+import os
 import pandas as pd
-import csv
+from pandas.api.types import union_categoricals
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
 from pathlib import Path
-from typing import Union, Optional
-
-
-def _detect_csv_separator(p: Path) -> Optional[str]:
-    with p.open("r", encoding="utf-8", errors="replace") as f:
-        sample = f.read(65536)
-    lines = [ln for ln in sample.splitlines() if ln.strip()]
-    if lines:
-        header = lines[0]
-        candidates = [";", ",", "\t", "|"]
-        counts = {c: header.count(c) for c in candidates}
-        best = max(counts, key=counts.get)
-        if counts[best] > 0:
-            return best
-    try:
-        dialect = csv.Sniffer().sniff(sample, delimiters=";,\t,|")
-        return dialect.delimiter
-    except Exception:
-        return None
+from typing import Any, Dict, Iterator, List, Sequence, Union, Optional
+
+from . import cache
+from .columnar import COLUMNAR_SUFFIXES, iter_columnar_batches, read_columnar
+from .csv_schema import CsvSchema, infer_csv_schema
+from .filters import RowFilter, apply_filters, filter_columns
+from .memory import optimize_memory
+from .formats import data_suffix
+from .profiling import profiler
+from .json_stream import JSON_SUFFIXES, NotRecordsError, iter_json_batches, json_layout
+from ..config.settings import settings
+
+_JSON_BATCH_ROWS = 100_000
+
+SOURCE_COLUMN = "__source_file"
+
+
+def _project(df: pd.DataFrame, columns: Optional[List[str]]) -> pd.DataFrame:
+    if not columns:
+        return df
+    wanted = set(columns)
+    return df[[c for c in df.columns if c in wanted]]
+
+
+def _csv_engine() -> str:
+    if settings.csv_engine == "pyarrow":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            return "c"
+    return settings.csv_engine
+
+
+def _csv_schema(p: Path) -> CsvSchema:
+    schema = infer_csv_schema(p)
+    if settings.show_schema:
+        _print_schema(p, schema)
+    return schema
+
+
+def _print_schema(p: Path, schema: CsvSchema) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(
+        title=f"Inferred schema: {p.name} (sep={schema.sep!r}, header={schema.header}, "
+        f"sample rows={schema.sample_rows})",
+        show_header=True,
+        header_style="bold",
+    )
+    table.add_column("Column")
+    table.add_column("Sample dtype")
+    table.add_column("Load as")
+    for row in schema.summary():
+        table.add_row(row["column"], row["sample_dtype"], row["load_as"])
+    Console(stderr=True).print(table)
+
+
+def _read_csv(p: Path, columns: Optional[List[str]]) -> pd.DataFrame:
+    with profiler.stage("sniff"):
+        schema = _csv_schema(p)
+    with profiler.stage("read_csv"):
+        try:
+            return pd.read_csv(p, **schema.read_csv_kwargs(columns, engine=_csv_engine()))
+        except (ValueError, TypeError):
+            # The sample did not represent the whole file (e.g. text further down
+            # a pinned float column); fall back to pandas' own inference.
+            kwargs = schema.read_csv_kwargs(columns)
+            kwargs.pop("dtype", None)
+            return pd.read_csv(p, **kwargs)
+
 
+def _print_memory_report(p: Path, report: Dict[str, Any]) -> None:
+    from rich.console import Console
+    from rich.table import Table
 
-def load_data(file_path: Union[str, Path]) -> pd.DataFrame:
+    before, after = report["bytes_before"], report["bytes_after"]
+    saved = (1 - after / before) * 100 if before else 0.0
+    table = Table(
+        title=f"Memory: {p.name} {before / 1024**2:.1f} MB -> {after / 1024**2:.1f} MB ({saved:.0f}% saved)",
+        show_header=True,
+        header_style="bold",
+    )
+    table.add_column("Column")
+    table.add_column("From")
+    table.add_column("To")
+    table.add_column("Before KB")
+    table.add_column("After KB")
+    for c in report["columns"]:
+        table.add_row(
+            str(c["column"]),
+            c["from"],
+            c["to"],
+            f"{c['bytes_before'] / 1024:.1f}",
+            f"{c['bytes_after'] / 1024:.1f}",
+        )
+    Console(stderr=True).print(table)
+
+
+def expand_inputs(file_path: Union[str, Path]) -> List[Path]:
     p = Path(file_path)
-    if not p.exists():
-        raise FileNotFoundError(str(p))
-    suffix = p.suffix.lower()
-    if suffix == ".csv":
-        sep = _detect_csv_separator(p)
-        if sep is None:
-            df = pd.read_csv(p)
+    if p.is_dir():
+        paths = sorted(c for c in p.iterdir() if c.is_file() and _is_supported(c))
+    elif not p.exists() and any(ch in str(file_path) for ch in "*?["):
+        paths = sorted(Path(m) for m in glob.glob(str(file_path), recursive=True) if _is_supported(Path(m)))
+    else:
+        if not p.exists():
+            raise FileNotFoundError(str(p))
+        return [p]
+    if not paths:
+        raise FileNotFoundError(f"No supported data files match {file_path}")
+    return paths
+
+
+def _is_supported(p: Path) -> bool:
+    suffix = data_suffix(p)
+    return p.is_file() and (suffix == ".csv" or suffix in JSON_SUFFIXES or suffix in COLUMNAR_SUFFIXES)
+
+
+def _read_columns(columns: Optional[List[str]], filters: Sequence[RowFilter]) -> Optional[List[str]]:
+    # Filter columns must be read even when the projection leaves them out.
+    if not columns:
+        return None
+    return columns + [c for c in filter_columns(filters) if c not in columns]
+
+
+def _with_source(df: pd.DataFrame, p: Path) -> pd.DataFrame:
+    if not settings.add_source_column:
+        return df
+    df = df.copy(deep=False)
+    df[SOURCE_COLUMN] = pd.Categorical([p.name] * len(df))
+    return df
+
+
+def load_data(
+    file_path: Union[str, Path],
+    columns: Optional[List[str]] = None,
+    use_cache: bool = True,
+    optimize: Optional[bool] = None,
+    filters: Optional[Sequence[RowFilter]] = None,
+    downcast_integers: bool = True,
+    pin_categories: bool = True,
+) -> pd.DataFrame:
+    with profiler.stage("load") as record:
+        paths = expand_inputs(file_path)
+        if columns and SOURCE_COLUMN in columns:
+            # The source column is added after parsing, never read from the file.
+            columns = [c for c in columns if c != SOURCE_COLUMN] or None
+        if filters is None:
+            filters = settings.row_filters
+        if len(paths) == 1:
+            df = _with_source(_load(paths[0], columns, use_cache, filters, pin_categories), paths[0])
         else:
-            df = pd.read_csv(p, sep=sep)
-    elif suffix == ".json":
-        df = pd.read_json(p)
+            df = _load_many(paths, columns, use_cache, filters, pin_categories)
+        if optimize is None:
+            optimize = settings.optimize_memory
+        if optimize:
+            with profiler.stage("optimize_memory"):
+                df, report = optimize_memory(df, downcast_integers=downcast_integers)
+            _print_memory_report(Path(file_path), report)
+    if profiler.enabled:
+        # Sized after the stage closes: a deep memory_usage is slow on strings.
+        record.update(rows=len(df), columns=len(df.columns), bytes=int(df.memory_usage(deep=True).sum()))
+    return df
+
+
+def _jobs(n_files: int) -> int:
+    jobs = settings.jobs if settings.jobs > 0 else (os.cpu_count() or 1)
+    return max(1, min(jobs, n_files))
+
+
+def _load_worker(
+    p: Path,
+    columns: Optional[List[str]],
+    use_cache: bool,
+    filters: Sequence[RowFilter],
+    pin_categories: bool,
+    overrides: Dict[str, Any],
+) -> pd.DataFrame:
+    # Worker processes may be spawned rather than forked, so the options set
+    # by the CLI callback are passed in explicitly.
+    for key, value in overrides.items():
+        setattr(settings, key, value)
+    return _with_source(_load(p, columns, use_cache, filters, pin_categories), p)
+
+
+def _load_many(
+    paths: List[Path],
+    columns: Optional[List[str]],
+    use_cache: bool,
+    filters: Sequence[RowFilter],
+    pin_categories: bool = True,
+) -> pd.DataFrame:
+    # The schema of the first file is representative; printing it once keeps
+    # --show-schema readable for hundreds of partitions.
+    if settings.show_schema and data_suffix(paths[0]) == ".csv":
+        _csv_schema(paths[0])
+    overrides = {
+        "csv_engine": settings.csv_engine,
+        "add_source_column": settings.add_source_column,
+        "show_schema": False,
+    }
+
+    jobs = _jobs(len(paths))
+    if jobs == 1:
+        frames = [_load_worker(p, columns, use_cache, filters, pin_categories, overrides) for p in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            frames = list(
+                pool.map(
+                    _load_worker,
+                    paths,
+                    repeat(columns),
+                    repeat(use_cache),
+                    repeat(filters),
+                    repeat(pin_categories),
+                    repeat(overrides),
+                )
+            )
+    # Worker frames are pickled back to the parent and concatenated into a
+    # new frame, so the peak is about twice the result; the win is parsing
+    # in parallel, not saving memory.
+    return _concat(frames)
+
+
+def _concat(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    # pd.concat turns categoricals whose categories differ between files
+    # (pinned CSV categories, the source column) into object; union them
+    # instead so they stay codes.
+    first = frames[0]
+    categorical = [
+        c
+        for c in first.columns
+        if isinstance(first[c].dtype, pd.CategoricalDtype)
+        and all(c in f.columns and isinstance(f[c].dtype, pd.CategoricalDtype) for f in frames)
+        and any(f[c].dtype != first[c].dtype for f in frames)
+    ]
+    if not categorical:
+        return pd.concat(frames, ignore_index=True)
+    order = list(dict.fromkeys(c for f in frames for c in f.columns))
+    df = pd.concat([f.drop(columns=categorical) for f in frames], ignore_index=True)
+    for c in categorical:
+        df[c] = union_categoricals([f[c] for f in frames], ignore_order=True)
+    return df[order]
+
+
+def _load(
+    p: Path,
+    columns: Optional[List[str]],
+    use_cache: bool,
+    filters: Sequence[RowFilter] = (),
+    pin_categories: bool = True,
+) -> pd.DataFrame:
+    read_columns = _read_columns(columns, filters)
+    if data_suffix(p) in COLUMNAR_SUFFIXES:
+        # Already typed and memory-mapped, so the parse cache would only add a
+        # copy; filters are pushed down to Parquet row groups instead.
+        with profiler.stage("read_columnar"):
+            return _project(read_columnar(p, read_columns, filters), columns)
+
+    with profiler.stage("cache_read"):
+        df = cache.get(p, columns=read_columns) if use_cache else None
+    if df is not None:
+        if settings.show_schema and data_suffix(p) == ".csv":
+            _csv_schema(p)
+    else:
+        df = _parse(p, read_columns)
+        # Only full parses are cached; a projected frame would poison later loads.
+        if use_cache and not read_columns:
+            with profiler.stage("cache_write"):
+                cache.put(p, df)
+    if filters:
+        with profiler.stage("filter"):
+            df = _project(apply_filters(df, filters), columns)
+    if not pin_categories and data_suffix(p) == ".csv":
+        df = _unpin_categories(df)
+    return df
+
+
+def _unpin_categories(df: pd.DataFrame) -> pd.DataFrame:
+    # Back to the dtype read_csv infers for text without a pinned category.
+    cats = [c for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)]
+    if not cats:
+        return df
+    df = df.copy(deep=False)
+    for c in cats:
+        df[c] = df[c].astype(df[c].cat.categories.dtype)
+    return df
+
+
+def _parse(p: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    suffix = data_suffix(p)
+    if suffix == ".csv":
+        df = _read_csv(p, columns)
+    elif suffix in JSON_SUFFIXES:
+        df = _read_json(p, columns)
+    elif suffix in COLUMNAR_SUFFIXES:
+        df = read_columnar(p, columns)
     else:
         raise ValueError(f"Unsupported file format: {suffix}")
     return df
+
+
+def _read_json(p: Path, columns: Optional[List[str]]) -> pd.DataFrame:
+    # Arrays of records and JSON Lines are parsed incrementally and projected
+    # per batch, so peak memory stays close to the size of the final frame.
+    with profiler.stage("read_json"):
+        try:
+            parts = [_project(batch, columns) for batch in iter_json_batches(p, _JSON_BATCH_ROWS)]
+        except NotRecordsError:
+            return _project(pd.read_json(p), columns)
+        return pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+
+
+def iter_chunks(
+    file_path: Union[str, Path],
+    chunksize: int = 100_000,
+    columns: Optional[List[str]] = None,
+    filters: Optional[Sequence[RowFilter]] = None,
+) -> Iterator[pd.DataFrame]:
+    if chunksize <= 0:
+        raise ValueError("chunksize must be a positive integer")
+    if filters is None:
+        filters = settings.row_filters
+    paths = expand_inputs(file_path)
+    readers = [_chunk_reader(p, chunksize, columns, filters) for p in paths]
+    # Partitions are streamed one after another, so memory stays bounded by
+    # the chunk size no matter how many files match.
+    return chain.from_iterable(readers)
+
+
+def _chunk_reader(
+    p: Path,
+    chunksize: int,
+    columns: Optional[List[str]],
+    filters: Sequence[RowFilter],
+) -> Iterator[pd.DataFrame]:
+    suffix = data_suffix(p)
+    read_columns = _read_columns(columns, filters)
+    if suffix == ".csv":
+        batches = _drain_csv(p, chunksize, read_columns)
+    elif suffix in JSON_SUFFIXES:
+        if json_layout(p) == "document":
+            raise ValueError("Streaming JSON requires an array of records or JSON Lines input")
+        batches = iter_json_batches(p, chunksize)
+    elif suffix in COLUMNAR_SUFFIXES:
+        return (
+            _with_source(_project(batch, columns), p)
+            for batch in iter_columnar_batches(p, chunksize, read_columns, filters)
+        )
+    else:
+        raise ValueError(f"Unsupported file format: {suffix}")
+    return (_with_source(_project(apply_filters(batch, filters), columns), p) for batch in batches)
+
+
+def _drain_csv(p: Path, chunksize: int, columns: Optional[List[str]]) -> Iterator[pd.DataFrame]:
+    # Chunked reads use the C engine and only pin categories, since a
+    # failed numeric pin cannot be retried halfway through the stream.
+    kwargs = _csv_schema(p).read_csv_kwargs(columns, pin_numeric=False)
+    with pd.read_csv(p, chunksize=chunksize, **kwargs) as reader:
+        yield from reader
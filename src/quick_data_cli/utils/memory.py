@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype
+from typing import Any, Dict, List, Tuple
+
+CATEGORY_MAX_RATIO = 0.5
+
+
+def _has_arrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _optimize_series(s: pd.Series, arrow_strings: bool, downcast_integers: bool = True) -> pd.Series:
+    dtype = s.dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return s
+    if pd.api.types.is_integer_dtype(dtype) and isinstance(dtype, np.dtype):
+        if not downcast_integers:
+            return s
+        # Signed only, so subtraction keeps its meaning; reductions in pandas
+        # accumulate small ints in int64, so sums cannot overflow.
+        return pd.to_numeric(s, downcast="integer")
+    # Floats stay float64: pandas reduces float32 in float32, so means, stds
+    # and skews would drift from the unoptimized results.
+    if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+        if isinstance(dtype, pd.CategoricalDtype):
+            return s
+        non_null = s.dropna()
+        if non_null.empty or infer_dtype(non_null, skipna=True) != "string":
+            # Mixed-type columns stay object so quality checks still see them.
+            return s
+        if non_null.nunique() / len(non_null) <= CATEGORY_MAX_RATIO:
+            return s.astype("category")
+        if arrow_strings and pd.api.types.is_object_dtype(dtype):
+            return s.astype("string[pyarrow]")
+    return s
+
+
+def optimize_memory(df: pd.DataFrame, downcast_integers: bool = True) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    # Element-wise arithmetic on downcast columns wraps around silently
+    # (int8 * int8 stays int8), so frames handed to user code keep int64.
+    arrow_strings = _has_arrow()
+    before = df.memory_usage(deep=True, index=False)
+    optimized = df.copy(deep=False)
+    # Positional assignment keeps duplicate column names intact.
+    for i in range(df.shape[1]):
+        optimized.isetitem(i, _optimize_series(df.iloc[:, i], arrow_strings, downcast_integers))
+    after = optimized.memory_usage(deep=True, index=False)
+
+    columns: List[Dict[str, Any]] = []
+    for i, col in enumerate(df.columns):
+        if df.dtypes.iloc[i] != optimized.dtypes.iloc[i]:
+            columns.append(
+                {
+                    "column": col,
+                    "from": str(df.dtypes.iloc[i]),
+                    "to": str(optimized.dtypes.iloc[i]),
+                    "bytes_before": int(before.iloc[i]),
+                    "bytes_after": int(after.iloc[i]),
+                }
+            )
+
+    report = {
+        "bytes_before": int(before.sum()),
+        "bytes_after": int(after.sum()),
+        "columns": columns,
+    }
+    return optimized, report
@@ -0,0 +1,177 @@
+"""Per-stage timing and memory for the global --profile option.
+
+Code paths wrap their work in `profiler.stage(name)`; while profiling is
+off that is a no-op. Stages nest (load > sniff > read_csv). Time before
+the first stage (imports, argument parsing) is reported as `setup`, and
+time after the last one (printing tables, writing files) as `render`.
+With `trace_memory`, tracemalloc runs inside top-level stages only, so
+imports and rendering are never traced.
+"""
+
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return _peak_rss_bytes()
+
+
+def _peak_rss_bytes() -> int:
+    # ru_maxrss is in KB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class Profiler:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.stages: List[Dict[str, Any]] = []
+        self.cprofile_path: Optional[Path] = None
+        self.trace_memory = False
+        # Highest traced memory seen by each open stage, innermost last.
+        self._peaks: List[int] = []
+        self._last_end = 0.0
+        self._first_start: Optional[float] = None
+
+    def start(self, cprofile_path: Optional[Path] = None, trace_memory: bool = False) -> None:
+        self.enabled = True
+        self.cprofile_path = cprofile_path
+        self.trace_memory = trace_memory
+        self._wall = self._last_end = time.perf_counter()
+        self._cpu = time.process_time()
+
+    @contextmanager
+    def stage(self, name: str, cprofile: bool = False) -> Iterator[Dict[str, Any]]:
+        """Time the block; callers may add fields (rows, columns, bytes) to
+        the yielded record."""
+        if not self.enabled:
+            yield {}
+            return
+        record: Dict[str, Any] = {"stage": name, "depth": len(self._peaks)}
+        self.stages.append(record)
+        if self.trace_memory:
+            if not self._peaks:
+                tracemalloc.start()
+            else:
+                # The peak counter is global: fold it into the enclosing
+                # stage before resetting it for this one.
+                self._peaks[-1] = max(self._peaks[-1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        self._peaks.append(0)
+
+        profile = None
+        if cprofile and self.cprofile_path is not None:
+            import cProfile
+
+            profile = cProfile.Profile()
+        wall, cpu = time.perf_counter(), time.process_time()
+        if self._first_start is None:
+            self._first_start = wall
+        if profile is not None:
+            profile.enable()
+        try:
+            yield record
+        finally:
+            if profile is not None:
+                profile.disable()
+                profile.dump_stats(str(self.cprofile_path))
+                record["cprofile"] = str(self.cprofile_path)
+            end = time.perf_counter()
+            cpu_s = time.process_time() - cpu
+            peak: Optional[int] = self._peaks.pop()
+            if self.trace_memory:
+                peak = max(peak, tracemalloc.get_traced_memory()[1])
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+                else:
+                    tracemalloc.stop()
+            else:
+                peak = None
+            if not self._peaks:
+                self._last_end = end
+            record.update(wall_s=end - wall, cpu_s=cpu_s, py_peak_bytes=peak, rss_bytes=_rss_bytes())
+
+    @staticmethod
+    def _unmeasured(name: str, wall: float) -> Dict[str, Any]:
+        return {"stage": name, "depth": 0, "wall_s": wall, "cpu_s": None, "py_peak_bytes": None, "rss_bytes": None}
+
+    def finish(self) -> Dict[str, Any]:
+        end = time.perf_counter()
+        cpu = time.process_time()
+        if self._first_start is not None:
+            self.stages.insert(0, self._unmeasured("setup", self._first_start - self._wall))
+        # Tables and charts are produced after the last top-level stage.
+        self.stages.append(self._unmeasured("render", end - self._last_end))
+        self.enabled = False
+        return {
+            "command": sys.argv[1:],
+            "pid": os.getpid(),
+            "wall_s": end - self._wall,
+            "cpu_s": cpu - self._cpu,
+            "peak_rss_bytes": _peak_rss_bytes(),
+            "stages": self.stages,
+        }
+
+
+profiler = Profiler()
+
+
+def _mb(value: Optional[int]) -> str:
+    return "" if value is None else f"{value / 1024**2:.1f}"
+
+
+def _seconds(value: Optional[float]) -> str:
+    return "" if value is None else f"{value:.3f}"
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(
+        title=(
+            f"Profile: {report['wall_s']:.3f}s wall, {report['cpu_s']:.3f}s CPU, "
+            f"peak RSS {_mb(report['peak_rss_bytes'])} MB"
+        ),
+        show_header=True,
+        header_style="bold",
+    )
+    table.add_column("Stage")
+    table.add_column("Wall s")
+    table.add_column("CPU s")
+    table.add_column("Py peak MB")
+    table.add_column("RSS MB")
+    table.add_column("Rows")
+    table.add_column("Columns")
+    table.add_column("Data MB")
+    for s in report["stages"]:
+        table.add_row(
+            "  " * s["depth"] + s["stage"],
+            _seconds(s["wall_s"]),
+            _seconds(s["cpu_s"]),
+            _mb(s["py_peak_bytes"]),
+            _mb(s["rss_bytes"]),
+            str(s.get("rows", "")),
+            str(s.get("columns", "")),
+            _mb(s.get("bytes")),
+        )
+    Console(stderr=True).print(table)
+
+
+def write_report(report: Dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
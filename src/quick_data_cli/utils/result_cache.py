@@ -0,0 +1,153 @@
+"""On-disk memo of analytics results.
+
+Entries are keyed by the input files' fingerprints, the analytics
+function, its arguments and the load settings, so an unchanged file and
+an identical command return the stored result dict without loading data.
+Entries expire `settings.result_cache_ttl` seconds after they were
+stored, and the least recently used are evicted beyond
+`settings.result_cache_max_mb`.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from ..config.settings import settings
+from .cache import fingerprint
+
+
+def _dir() -> Path:
+    return settings.cache_dir / "results"
+
+
+def _normalize(value: Any) -> Any:
+    # Tuples and lists compare equal; everything else by its repr.
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return repr(value)
+
+
+@lru_cache(maxsize=1)
+def _code_version() -> Tuple[str, str]:
+    # Results depend on the analytics function and on everything it calls
+    # (loader, schema inference, column stats...), so editing any module of
+    # the package invalidates them.
+    package = Path(__file__).resolve().parents[1]
+    h = hashlib.blake2b(digest_size=16)
+    for path in sorted(package.rglob("*.py")):
+        h.update(f"{path.relative_to(package)}:{path.stat().st_mtime_ns};".encode("utf-8"))
+    return settings.version, h.hexdigest()
+
+
+def result_key(
+    file_path: Union[str, Path],
+    func: Callable[..., Any],
+    load_columns: Optional[List[str]],
+    kwargs: Dict[str, Any],
+    load_settings: Dict[str, Any],
+) -> str:
+    from .loader import expand_inputs
+
+    identity = {
+        "files": [fingerprint(p) for p in expand_inputs(file_path)],
+        "func": f"{func.__module__}:{func.__qualname__}",
+        "code": _code_version(),
+        "columns": _normalize(load_columns),
+        "kwargs": _normalize(kwargs),
+        "settings": _normalize(load_settings),
+    }
+    encoded = json.dumps(identity, sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def get(key: str) -> Optional[Tuple[Any, float]]:
+    """The stored result and its age in seconds, or None."""
+    path = _dir() / f"{key}.pkl"
+    try:
+        with path.open("rb") as f:
+            entry = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        path.unlink(missing_ok=True)
+        return None
+    age = time.time() - entry["created"]
+    if age > settings.result_cache_ttl:
+        path.unlink(missing_ok=True)
+        return None
+    # Touch the entry so eviction sees it as recently used.
+    os.utime(path)
+    return entry["result"], age
+
+
+def put(key: str, result: Any) -> None:
+    directory = _dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{key}.pkl"
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            pickle.dump({"created": time.time(), "result": result}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception:
+        # Results that cannot be pickled are simply not cached.
+        tmp_path.unlink(missing_ok=True)
+        return
+    evict()
+
+
+def list_entries() -> List[Dict[str, Any]]:
+    entries = []
+    for path in _dir().glob("*.pkl"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append({"key": path.stem, "bytes": st.st_size, "last_used": st.st_mtime})
+    entries.sort(key=lambda e: e["last_used"], reverse=True)
+    return entries
+
+
+def evict(max_bytes: Optional[int] = None) -> int:
+    """Drop entries unused for longer than the TTL (they can only have
+    expired), then least recently used ones beyond the size cap."""
+    if max_bytes is None:
+        max_bytes = settings.result_cache_max_mb * 1024**2
+    now = time.time()
+    entries = []
+    removed = 0
+    for e in list_entries():
+        if now - e["last_used"] > settings.result_cache_ttl:
+            (_dir() / f"{e['key']}.pkl").unlink(missing_ok=True)
+            removed += 1
+        else:
+            entries.append(e)
+    total = sum(e["bytes"] for e in entries)
+    # Entries are sorted most recently used first; drop from the tail.
+    while entries and total > max_bytes:
+        e = entries.pop()
+        (_dir() / f"{e['key']}.pkl").unlink(missing_ok=True)
+        total -= e["bytes"]
+        removed += 1
+    return removed
+
+
+def clear() -> int:
+    count = 0
+    for path in _dir().glob("*.pkl"):
+        path.unlink(missing_ok=True)
+        count += 1
+    return count
+
+
+def note(age: float) -> str:
+    return f"Cached result from {age:.0f}s ago (file unchanged); pass --no-cache to recompute."
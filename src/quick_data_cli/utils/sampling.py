@@ -0,0 +1,200 @@
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .dtypes import remove_unused_categories
+from .loader import iter_chunks
+from .profiling import profiler
+
+SAMPLE_CHUNK_ROWS = 100_000
+
+_KEY = "__sample_key"
+_ROW = "__sample_row"
+
+
+def parse_sample_spec(spec: str) -> Tuple[Optional[int], Optional[float]]:
+    # "50000" -> a fixed-size sample, "0.05" -> a fraction of the rows.
+    try:
+        value = float(spec)
+    except ValueError:
+        raise ValueError(f"Invalid sample size: {spec!r}; use a row count or a fraction")
+    if 0 < value < 1:
+        return None, value
+    if value >= 1 and value.is_integer():
+        return int(value), None
+    raise ValueError(f"Invalid sample size: {spec!r}; use a row count or a fraction")
+
+
+def _keyed(chunk: pd.DataFrame, offset: int, rng: np.random.Generator) -> pd.DataFrame:
+    chunk = chunk.reset_index(drop=True)
+    chunk[_KEY] = rng.random(len(chunk))
+    chunk[_ROW] = np.arange(offset, offset + len(chunk))
+    return chunk
+
+
+def _finish(sample: pd.DataFrame) -> pd.DataFrame:
+    # Return rows in file order, as a full load would.
+    sample = sample.sort_values(_ROW, kind="stable")
+    return remove_unused_categories(sample.drop(columns=[_KEY, _ROW]).reset_index(drop=True))
+
+
+def reservoir_sample(
+    chunks: Iterable[pd.DataFrame],
+    n: int,
+    seed: Optional[int] = None,
+) -> Tuple[pd.DataFrame, int]:
+    # Bottom-k reservoir: every row draws a uniform key and the n smallest
+    # keys win, which is a uniform sample without replacement. Once the
+    # reservoir is full only rows beating the current largest key are kept,
+    # so most chunks are discarded after one comparison.
+    rng = np.random.default_rng(seed)
+    reservoir: Optional[pd.DataFrame] = None
+    total = 0
+    for chunk in chunks:
+        keyed = _keyed(chunk, total, rng)
+        total += len(chunk)
+        if reservoir is not None and len(reservoir) >= n:
+            keyed = keyed[keyed[_KEY] < reservoir[_KEY].max()]
+            if keyed.empty:
+                continue
+        combined = keyed if reservoir is None else pd.concat([reservoir, keyed], ignore_index=True)
+        reservoir = combined.nsmallest(n, _KEY) if len(combined) > n else combined
+    if reservoir is None:
+        return pd.DataFrame(), 0
+    return _finish(reservoir), total
+
+
+def count_strata(chunks: Iterable[pd.DataFrame], stratify_by: str) -> Tuple[pd.Series, int]:
+    # Rows per value of `stratify_by` (missing values counted as one stratum).
+    counts: Optional[pd.Series] = None
+    total = 0
+    for chunk in chunks:
+        if stratify_by not in chunk.columns:
+            raise ValueError(f"Column '{stratify_by}' not found")
+        total += len(chunk)
+        chunk_counts = chunk[stratify_by].value_counts(dropna=False)
+        chunk_counts.index = chunk_counts.index.astype(object)
+        counts = chunk_counts if counts is None else counts.add(chunk_counts, fill_value=0)
+    if counts is None:
+        return pd.Series(dtype="int64"), 0
+    return counts[counts > 0].astype("int64"), total
+
+
+def allocate_sample(counts: pd.Series, n: int) -> pd.Series:
+    # Largest-remainder allocation of n rows in proportion to each stratum's
+    # row count, so the quotas add up to exactly n (or to every row). When n
+    # covers every stratum, strata that would round to nothing get one row
+    # from the largest quotas; otherwise the smallest strata are left out.
+    total = int(counts.sum())
+    n = min(n, total)
+    if n <= 0:
+        return pd.Series(0, index=counts.index, dtype="int64")
+    shares = counts.to_numpy(dtype=np.float64) * n / total
+    quotas = np.floor(shares).astype(np.int64)
+    order = np.argsort(quotas - shares, kind="stable")
+    quotas[order[: n - int(quotas.sum())]] += 1
+    if n >= len(quotas):
+        for i in np.flatnonzero(quotas == 0):
+            quotas[np.argmax(quotas)] -= 1
+            quotas[i] += 1
+    return pd.Series(quotas, index=counts.index)
+
+
+def stratified_sample(
+    chunks: Iterable[pd.DataFrame],
+    quotas: pd.Series,
+    stratify_by: str,
+    seed: Optional[int] = None,
+) -> Tuple[pd.DataFrame, int]:
+    # One bottom-k reservoir per stratum, sized by `quotas` (see
+    # allocate_sample), so at most quotas.sum() rows are held at a time.
+    rng = np.random.default_rng(seed)
+    reservoir: Optional[pd.DataFrame] = None
+    reservoir_quota = np.zeros(0, dtype=np.int64)
+    total = 0
+    for chunk in chunks:
+        if stratify_by not in chunk.columns:
+            raise ValueError(f"Column '{stratify_by}' not found")
+        keyed = _keyed(chunk, total, rng)
+        total += len(chunk)
+        positions = quotas.index.get_indexer(keyed[stratify_by].astype(object))
+        quota = np.where(positions >= 0, quotas.to_numpy()[positions], 0)
+        keyed, quota = keyed[quota > 0], quota[quota > 0]
+        if reservoir is not None:
+            keyed = pd.concat([reservoir, keyed], ignore_index=True)
+            quota = np.concatenate([reservoir_quota, quota])
+        rank = keyed.groupby(stratify_by, dropna=False, observed=True)[_KEY].rank(method="first")
+        keep = (rank <= quota).to_numpy()
+        reservoir, reservoir_quota = keyed[keep], quota[keep]
+    if reservoir is None:
+        return pd.DataFrame(), 0
+    return _finish(reservoir), total
+
+
+def bernoulli_sample(
+    chunks: Iterable[pd.DataFrame],
+    fraction: float,
+    seed: Optional[int] = None,
+) -> Tuple[pd.DataFrame, int]:
+    # Keeps each row independently with probability `fraction`.
+    rng = np.random.default_rng(seed)
+    parts: List[pd.DataFrame] = []
+    total = 0
+    for chunk in chunks:
+        total += len(chunk)
+        parts.append(chunk[rng.random(len(chunk)) < fraction])
+    if not parts:
+        return pd.DataFrame(), 0
+    return remove_unused_categories(pd.concat(parts, ignore_index=True)), total
+
+
+def load_sample(
+    file_path: Union[str, Path],
+    spec: str,
+    columns: Optional[List[str]] = None,
+    stratify_by: Optional[str] = None,
+    seed: Optional[int] = None,
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    n, fraction = parse_sample_spec(spec)
+    if columns and stratify_by and stratify_by not in columns:
+        columns = columns + [stratify_by]
+    with profiler.stage("load (sample)") as record:
+        if stratify_by:
+            # A first pass over just the stratum column sizes every stratum's
+            # share, so the second keeps no more rows than the sample needs.
+            counts, total = count_strata(
+                iter_chunks(file_path, chunksize=SAMPLE_CHUNK_ROWS, columns=[stratify_by]), stratify_by
+            )
+            if fraction is not None:
+                n = int(round(fraction * total))
+        chunks = iter_chunks(file_path, chunksize=SAMPLE_CHUNK_ROWS, columns=columns)
+
+        if stratify_by:
+            df, total = stratified_sample(chunks, allocate_sample(counts, n), stratify_by, seed)
+            method = f"stratified by {stratify_by}"
+        elif fraction is not None:
+            df, total = bernoulli_sample(chunks, fraction, seed)
+            method = "bernoulli"
+        else:
+            df, total = reservoir_sample(chunks, n, seed)
+            method = "reservoir"
+    if profiler.enabled:
+        record.update(rows=len(df), columns=len(df.columns), bytes=int(df.memory_usage(deep=True).sum()))
+
+    info = {
+        "sampled": True,
+        "sample_size": int(len(df)),
+        "total_rows": int(total),
+        "method": method,
+        "seed": seed,
+    }
+    return df, info
+
+
+def sample_note(info: Dict[str, Any]) -> str:
+    seed = "" if info["seed"] is None else f", seed={info['seed']}"
+    return (
+        f"SAMPLED: {info['sample_size']} of {info['total_rows']} rows "
+        f"({info['method']}{seed}); results are approximate"
+    )
@@ -0,0 +1,220 @@
+"""Hand a loaded DataFrame to `execute` sandboxes without re-parsing it.
+
+The parent writes the frame once to a file on /dev/shm (the temp dir where
+there is none). Fixed-width numpy columns are stored as raw, aligned
+buffers; the child maps the file copy-on-write and wraps those buffers as
+columns without copying. Categorical codes, tz-aware timestamps and the
+values and masks of nullable columns are shared the same way. Text columns
+are shared as int32 codes plus their distinct values (UTF-8 bytes and
+offsets), so each worker only rebuilds the distinct strings and one pointer
+per row. Other object columns travel as plain Python lists in the header.
+The header holds no pandas objects because the sandbox may run a different
+pandas version.
+
+Layout: 8-byte little-endian header length, pickled header, then column
+buffers at ALIGN-byte boundaries.
+"""
+
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype
+
+ALIGN = 64
+
+# Nullable extension arrays shared as a values buffer plus a mask.
+_MASKED = ("IntegerArray", "FloatingArray", "BooleanArray")
+
+
+def _shared_dir() -> str:
+    return "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+
+def _align(n: int) -> int:
+    return -(-n // ALIGN) * ALIGN
+
+
+def _is_raw(dtype: Any) -> bool:
+    return isinstance(dtype, np.dtype) and dtype.kind in "biufcmM"
+
+
+def _masked_kind(s: pd.Series) -> Optional[str]:
+    return next((name for name in _MASKED if isinstance(s.array, getattr(pd.arrays, name))), None)
+
+
+def _is_text(s: pd.Series) -> bool:
+    if isinstance(s.dtype, pd.StringDtype):
+        return True
+    return s.dtype == object and infer_dtype(s, skipna=True) in ("string", "empty")
+
+
+def _missing_to_none(values: List[Any]) -> List[Any]:
+    return [None if v is pd.NA or v is pd.NaT else v for v in values]
+
+
+def _index_meta(index: pd.Index) -> Dict[str, Any]:
+    if isinstance(index, pd.RangeIndex):
+        return {"range": (index.start, index.stop, index.step), "name": index.name}
+    return {"values": _missing_to_none(index.tolist()), "name": index.name}
+
+
+def write_shared_frame(df: pd.DataFrame, path: Path) -> None:
+    columns: List[Dict[str, Any]] = []
+    raw: List[Tuple[int, np.ndarray]] = []
+    data_size = 0
+
+    def share(values: np.ndarray, key: str = "") -> Dict[str, Any]:
+        nonlocal data_size
+        values = np.ascontiguousarray(values)
+        raw.append((data_size, values))
+        meta = {f"{key}dtype": values.dtype.str, f"{key}offset": data_size, f"{key}count": len(values)}
+        data_size = _align(data_size + values.nbytes)
+        return meta
+
+    for i in range(df.shape[1]):
+        s = df.iloc[:, i]
+        dtype = s.dtype
+        if _is_raw(dtype):
+            columns.append({"kind": "raw", **share(s.to_numpy())})
+        elif isinstance(dtype, pd.CategoricalDtype):
+            columns.append(
+                {
+                    "kind": "categorical",
+                    "categories": _missing_to_none(dtype.categories.tolist()),
+                    "ordered": bool(dtype.ordered),
+                    **share(s.cat.codes.to_numpy()),
+                }
+            )
+        elif isinstance(dtype, pd.DatetimeTZDtype):
+            values = s.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy()
+            columns.append({"kind": "datetimetz", "tz": str(dtype.tz), **share(values)})
+        elif _masked_kind(s):
+            mask = s.isna().to_numpy()
+            values = s.to_numpy(dtype=dtype.numpy_dtype, na_value=0)
+            columns.append({"kind": "masked", "array": _masked_kind(s), **share(values), **share(mask, "mask_")})
+        elif _is_text(s):
+            codes, uniques = pd.factorize(s, use_na_sentinel=True)
+            encoded = [str(u).encode("utf-8", "surrogatepass") for u in uniques]
+            offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            np.cumsum([len(b) for b in encoded], out=offsets[1:])
+            # String columns are left to the sandbox's default string dtype.
+            name = None if isinstance(dtype, pd.StringDtype) else str(dtype)
+            missing = s[codes < 0]
+            columns.append(
+                {
+                    "kind": "text",
+                    "dtype_name": name,
+                    # JSON nulls load as None, CSV gaps as NaN; keep whichever it was.
+                    "na_none": len(missing) > 0 and all(v is None for v in missing),
+                    **share(codes.astype(np.int32)),
+                    **share(offsets, "offsets_"),
+                    **share(np.frombuffer(b"".join(encoded) or b"\0", dtype=np.uint8), "text_"),
+                }
+            )
+        else:
+            name = str(dtype)
+            columns.append({"kind": "values", "values": _missing_to_none(s.tolist()), "dtype": name})
+
+    header = pickle.dumps(
+        {"names": list(df.columns), "index": _index_meta(df.index), "rows": len(df), "columns": columns},
+        protocol=4,
+    )
+    # Buffer offsets in the header are relative to the data section.
+    start = _align(8 + len(header))
+    size = start + data_size
+
+    with open(path, "wb+") as f:
+        f.truncate(size)
+        with mmap.mmap(f.fileno(), size) as mm:
+            mm[:8] = struct.pack("<Q", len(header))
+            mm[8 : 8 + len(header)] = header
+            for offset, values in raw:
+                begin = start + offset
+                mm[begin : begin + values.nbytes] = values.view(np.uint8).reshape(-1)
+
+
+@contextmanager
+def shared_frame(df: pd.DataFrame) -> Iterator[Path]:
+    """Write `df` to shared memory for the duration of the block."""
+    fd, name = tempfile.mkstemp(prefix="quick-data-", suffix=".frame", dir=_shared_dir())
+    os.close(fd)
+    path = Path(name)
+    try:
+        write_shared_frame(df, path)
+        yield path
+    finally:
+        path.unlink(missing_ok=True)
+
+
+# Runs in the sandbox: defines _map_frame(path), which maps a shared frame
+# copy-on-write, and binds sys.argv[1] to `df`.
+MAP_FRAME_CODE = r'''
+import mmap
+import pickle
+import struct
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+def _map_frame(path):
+    # A private mapping: pages stay shared with every other reader until a
+    # script writes to them, then the kernel copies just those pages.
+    with open(path, "rb") as f:
+        frame = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    header_len = struct.unpack("<Q", frame[:8])[0]
+    header = pickle.loads(frame[8 : 8 + header_len])
+    start = -(-(8 + header_len) // %(align)d) * %(align)d
+
+    def buffer(meta, key=""):
+        return np.frombuffer(
+            frame, dtype=np.dtype(meta[key + "dtype"]), count=meta[key + "count"], offset=start + meta[key + "offset"]
+        )
+
+    cols = {}
+    for i, meta in enumerate(header["columns"]):
+        if meta["kind"] == "values":
+            try:
+                cols[i] = pd.Series(meta["values"], dtype=meta["dtype"])
+            except (TypeError, ValueError):
+                cols[i] = pd.Series(meta["values"], dtype=object)
+            continue
+        if meta["kind"] == "text":
+            offsets, text = buffer(meta, "offsets_"), buffer(meta, "text_").tobytes()
+            uniques = [text[a:b].decode("utf-8", "surrogatepass") for a, b in zip(offsets[:-1], offsets[1:])]
+            # Code -1 (missing) picks the trailing missing value.
+            values = np.array(uniques + [None if meta["na_none"] else np.nan], dtype=object)[buffer(meta)]
+            try:
+                cols[i] = pd.Series(values, dtype=meta["dtype_name"])
+            except (TypeError, ValueError):
+                cols[i] = pd.Series(values, dtype=object)
+            continue
+        values = buffer(meta)
+        if meta["kind"] == "categorical":
+            values = pd.Categorical.from_codes(
+                values, categories=meta["categories"], ordered=meta["ordered"], validate=False
+            )
+        elif meta["kind"] == "datetimetz":
+            values = pd.Series(pd.DatetimeIndex(values).tz_localize("UTC").tz_convert(meta["tz"]))
+        elif meta["kind"] == "masked":
+            values = getattr(pd.arrays, meta["array"])(values, buffer(meta, "mask_"), copy=False)
+        cols[i] = values
+    mapped = pd.DataFrame(cols, copy=False)
+    mapped.columns = header["names"]
+    index = header["index"]
+    if "range" in index:
+        mapped.index = pd.RangeIndex(*index["range"], name=index["name"])
+    else:
+        mapped.index = pd.Index(index["values"], name=index["name"])
+    return mapped
+
+df = _map_frame(sys.argv[1])
+''' % {"align": ALIGN}
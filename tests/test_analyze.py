@@ -0,0 +1,36 @@
+"""The analyze command: one load, several analyses, one JSON report."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _analyze(tmp_path, *args):
+    env = dict(os.environ, QUICK_DATA_DAEMON="0", QUICK_DATA_CACHE="0", QUICK_DATA_CACHE_DIR=str(tmp_path / "cache"))
+    return subprocess.run(
+        [sys.executable, str(ROOT / "main.py"), *args], capture_output=True, text=True, cwd=ROOT, env=env
+    )
+
+
+def test_report_has_every_requested_analysis(tmp_path):
+    output = tmp_path / "report.json"
+    proc = _analyze(
+        tmp_path, "analyze", "data/employee_survey.csv", "--analyses", "describe,quality", "--output", str(output)
+    )
+    assert proc.returncode == 0, proc.stderr
+    report = json.loads(output.read_text())
+    assert list(report["analyses"]) == ["describe", "quality"]
+    assert set(report["timings"]) == {"describe", "quality"}
+
+
+def test_profiled_runs_recompute_instead_of_reusing_a_cached_report(tmp_path):
+    args = ["analyze", "data/employee_survey.csv", "--analyses", "describe", "--output", str(tmp_path / "r.json")]
+    assert _analyze(tmp_path, *args).returncode == 0
+    assert "Cached result" in _analyze(tmp_path, *args).stderr
+    profiled = _analyze(tmp_path, "--profile", *args)
+    assert profiled.returncode == 0, profiled.stderr
+    assert "Cached result" not in profiled.stderr
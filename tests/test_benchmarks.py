@@ -0,0 +1,85 @@
+"""Benchmark suite: synthetic data generation, runs and regression checks."""
+
+import json
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "src"))
+
+from benchmarks import datasets, history  # noqa: E402
+from benchmarks.datasets import DATASETS, generate, metric_columns, parse_size, size_name  # noqa: E402
+from benchmarks.runner import run_dataset  # noqa: E402
+from quick_data_cli.config.settings import settings  # noqa: E402
+from quick_data_cli.utils.loader import load_data  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    # Several chunks per file, so the chunked writers are exercised.
+    monkeypatch.setattr(datasets, "CHUNK_ROWS", 300)
+    monkeypatch.setattr(settings, "cache_enabled", False)
+
+
+@pytest.mark.parametrize("value, rows", [("10k", 10_000), ("1m", 1_000_000), ("2.5k", 2_500), ("1234", 1234)])
+def test_sizes(value, rows):
+    assert parse_size(value) == rows
+    assert size_name(parse_size("10m")) == "10m" and size_name(1234) == "1234"
+
+
+@pytest.mark.parametrize("name", sorted(DATASETS))
+def test_generated_files_load_and_repeat_for_a_seed(tmp_path, name):
+    path = generate(tmp_path, name, 1000)
+    assert path.name == f"{name}-1000-s0{DATASETS[name].suffix}"
+    if path.suffix == ".json":
+        assert len(json.loads(path.read_text())) == 1000
+    df = load_data(path, use_cache=False, optimize=False)
+    spec = DATASETS[name]
+    assert len(df) == 1000 and df.iloc[:, 0].is_unique
+    assert {spec.value_column, spec.category_column, *spec.numeric_columns} <= set(df.columns)
+
+    again = generate(tmp_path / "again", name, 1000)
+    assert again.read_bytes() == path.read_bytes()
+    assert generate(tmp_path, name, 1000, seed=1).read_bytes() != path.read_bytes()
+
+
+def test_wide_variant_and_reuse(tmp_path):
+    path = generate(tmp_path, "survey", 600, wide=True)
+    df = pd.read_csv(path)
+    assert list(df.columns[-len(metric_columns()):]) == metric_columns()
+    # Even metrics follow the value column, odd ones are noise.
+    corr = df[["satisfaction_score", "metric_00", "metric_01"]].corr()["satisfaction_score"]
+    assert corr["metric_00"] > 0.2 > abs(corr["metric_01"])
+    mtime = path.stat().st_mtime_ns
+    assert generate(tmp_path, "survey", 600, wide=True).stat().st_mtime_ns == mtime
+
+
+def test_run_dataset_reports_each_case(tmp_path):
+    path = generate(tmp_path, "products", 500)
+    seen = []
+    results = run_dataset(
+        path, "products", "products", cases=["load_data", "segment_by_column"], memory=False, on_result=seen.append
+    )
+    assert [r["case"] for r in results] == ["load_data", "segment_by_column"] and seen == results
+    assert all(r["rows"] == 500 and r["seconds"] > 0 and r["peak_mb"] is None for r in results)
+
+
+def test_history_flags_regressions_above_threshold_and_noise(tmp_path):
+    def result(case, seconds, peak_mb):
+        return {"dataset": "orders", "rows": 1000, "case": case, "seconds": seconds, "peak_mb": peak_mb}
+
+    path = tmp_path / "history.json"
+    history.append(path, [result("load_data", 1.0, 100.0), result("tiny", 0.001, 1.0)], label="base")
+    history.append(path, [result("load_data", 1.05, 150.0), result("tiny", 0.004, 1.5), result("new", 1.0, 1.0)])
+    runs = history.load(path)
+    assert [r["label"] for r in runs] == ["base", None]
+    rows = {row["case"]: row for row in history.compare(runs, threshold=0.1)}
+    assert rows["load_data"]["regressions"] == ["peak_mb"]
+    # Large relative growth, but below the 5 ms / 1 MB noise floor.
+    assert rows["tiny"]["regressions"] == []
+    assert rows["new"]["regressions"] == [] and "base_seconds" not in rows["new"]
+    assert history.compare(runs, threshold=0.01, baseline=0)[0]["regressions"] == ["seconds", "peak_mb"]
@@ -0,0 +1,111 @@
+"""Load and result caches: hits, invalidation and size limits."""
+
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from quick_data_cli.config.settings import settings  # noqa: E402
+from quick_data_cli.utils import cache  # noqa: E402
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    monkeypatch.setattr(settings, "cache_enabled", True)
+    monkeypatch.setattr(settings, "cache_max_mb", 64)
+    return settings.cache_dir
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}).to_csv(path, index=False)
+    return path
+
+
+def test_hit_returns_the_stored_frame(cache_dir, csv_file):
+    df = pd.read_csv(csv_file)
+    assert cache.get(csv_file) is None
+    assert cache.put(csv_file, df)
+    pd.testing.assert_frame_equal(cache.get(csv_file), df)
+    assert list(cache.get(csv_file, columns=["b"]).columns) == ["b"]
+
+
+def test_changed_file_invalidates(cache_dir, csv_file):
+    cache.put(csv_file, pd.read_csv(csv_file))
+    csv_file.write_text("a,b\n4,w\n")
+    assert cache.get(csv_file) is None
+
+
+def test_rewrite_with_same_size_and_mtime_invalidates(cache_dir, csv_file):
+    cache.put(csv_file, pd.read_csv(csv_file))
+    st = csv_file.stat()
+    csv_file.write_text(csv_file.read_text().replace("x", "q"))
+    os.utime(csv_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert cache.get(csv_file) is None
+
+
+def test_format_version_is_part_of_the_key(cache_dir, csv_file, monkeypatch):
+    cache.put(csv_file, pd.read_csv(csv_file))
+    monkeypatch.setattr(cache, "CACHE_FORMAT_VERSION", cache.CACHE_FORMAT_VERSION + 1)
+    assert cache.get(csv_file) is None
+
+
+def test_frames_over_the_cap_are_not_written(cache_dir, csv_file, monkeypatch):
+    monkeypatch.setattr(settings, "cache_max_mb", 0)
+    assert not cache.put(csv_file, pd.read_csv(csv_file))
+    assert cache.list_entries() == []
+
+
+def test_eviction_keeps_most_recent(cache_dir, tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"f{i}.csv"
+        pd.DataFrame({"a": range(1000)}).to_csv(path, index=False)
+        cache.put(path, pd.read_csv(path))
+        paths.append(path)
+    newest = max(e["bytes"] for e in cache.list_entries())
+    os.utime(cache_dir / f"{cache._entry_key(paths[0])}.feather", (0, 0))
+    cache.evict(max_bytes=2 * newest)
+    assert cache.get(paths[0]) is None
+    assert cache.get(paths[2]) is not None
+
+
+def _describe(df, top=3):
+    return {"rows": len(df), "top": top}
+
+
+def test_result_cache_hit_and_invalidation(cache_dir, csv_file):
+    from quick_data_cli.utils import result_cache
+
+    key = result_cache.result_key(csv_file, _describe, None, {"top": 3}, {})
+    assert result_cache.get(key) is None
+    result_cache.put(key, {"rows": 3})
+    assert result_cache.get(key)[0] == {"rows": 3}
+    assert result_cache.result_key(csv_file, _describe, None, {"top": 3}, {}) == key
+    assert result_cache.result_key(csv_file, _describe, None, {"top": 4}, {}) != key
+    csv_file.write_text("a,b\n4,w\n")
+    assert result_cache.result_key(csv_file, _describe, None, {"top": 3}, {}) != key
+
+
+def test_result_key_tracks_every_package_module(cache_dir, csv_file):
+    from quick_data_cli.utils import memory, result_cache
+
+    key = result_cache.result_key(csv_file, _describe, None, {}, {})
+    helper = Path(memory.__file__)
+    st = helper.stat()
+    try:
+        # A helper the analysis calls, not the analysis module itself.
+        os.utime(helper, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        result_cache._code_version.cache_clear()
+        assert result_cache.result_key(csv_file, _describe, None, {}, {}) != key
+    finally:
+        os.utime(helper, ns=(st.st_atime_ns, st.st_mtime_ns))
+        result_cache._code_version.cache_clear()
@@ -0,0 +1,87 @@
+"""Compressed inputs read straight from the decompressing stream."""
+
+import bz2
+import gzip
+import lzma
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from quick_data_cli.config.settings import settings  # noqa: E402
+from quick_data_cli.utils.csv_schema import infer_csv_schema  # noqa: E402
+from quick_data_cli.utils.formats import compression_of, data_suffix  # noqa: E402
+from quick_data_cli.utils.loader import iter_chunks, load_data  # noqa: E402
+
+OPENERS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+
+FRAME = pd.DataFrame({"id": range(30), "region": ["north", "south", "east"] * 10, "amount": [i * 2.5 for i in range(30)]})
+
+
+def _compress(path: Path, suffix: str) -> Path:
+    target = path.with_name(path.name + suffix)
+    with OPENERS[suffix](target, "wb") as f:
+        f.write(path.read_bytes())
+    return target
+
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    monkeypatch.setattr(settings, "cache_enabled", False)
+
+
+def test_format_under_compression_suffix():
+    assert data_suffix(Path("orders.CSV.gz")) == ".csv"
+    assert compression_of(Path("orders.csv.xz")) == "xz"
+    assert compression_of(Path("orders.csv")) is None
+
+
+@pytest.mark.parametrize("suffix", sorted(OPENERS))
+def test_compressed_csv_matches_plain(tmp_path, suffix):
+    plain = tmp_path / "orders.csv"
+    FRAME.to_csv(plain, index=False)
+    packed = _compress(plain, suffix)
+    assert infer_csv_schema(packed).dtypes == infer_csv_schema(plain).dtypes
+    expected = load_data(plain, use_cache=False, optimize=False)
+    pd.testing.assert_frame_equal(load_data(packed, use_cache=False, optimize=False), expected)
+    chunks = list(iter_chunks(packed, chunksize=12))
+    assert [len(c) for c in chunks] == [12, 12, 6]
+
+
+@pytest.mark.parametrize("suffix", sorted(OPENERS))
+def test_compressed_json_lines(tmp_path, suffix):
+    plain = tmp_path / "orders.jsonl"
+    FRAME.to_json(plain, orient="records", lines=True)
+    df = load_data(_compress(plain, suffix), use_cache=False, optimize=False)
+    assert df["amount"].sum() == FRAME["amount"].sum() and len(df) == 30
+
+
+def test_compressed_columnar_files_are_rejected(tmp_path):
+    pytest.importorskip("pyarrow")
+    plain = tmp_path / "orders.parquet"
+    FRAME.to_parquet(plain)
+    with pytest.raises(ValueError, match="Compressed .parquet files are not supported"):
+        load_data(_compress(plain, ".gz"), use_cache=False, optimize=False)
+
+
+def test_execute_reads_compressed_input(tmp_path):
+    plain = tmp_path / "orders.csv"
+    FRAME.to_csv(plain, index=False)
+    packed = _compress(plain, ".gz")
+    script = tmp_path / "script.py"
+    script.write_text("print('ROWS', len(df))\n")
+    proc = subprocess.run(
+        [sys.executable, str(ROOT / "main.py"), "execute", str(packed), str(script)],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=dict(os.environ, QUICK_DATA_DAEMON="0", QUICK_DATA_CACHE="0"),
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert "ROWS 30" in proc.stdout
@@ -0,0 +1,97 @@
+"""Blockwise Pearson, Spearman and Kendall against the pairwise definitions."""
+
+import sys
+from itertools import combinations
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from quick_data_cli.analytics.correlations import (  # noqa: E402
+    correlation_blocks,
+    find_correlations,
+    kendall_tau,
+    rank_correlation_blocks,
+)
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    base = rng.normal(size=300)
+    df = pd.DataFrame(
+        {
+            "a": base,
+            "b": base * 2 + rng.normal(scale=0.5, size=300),
+            "c": rng.integers(0, 5, size=300).astype(float),
+            "d": -base + rng.normal(size=300),
+            "const": 1.0,
+        }
+    )
+    for col, frac in (("a", 0.1), ("c", 0.2), ("d", 0.05)):
+        df.loc[rng.random(300) < frac, col] = np.nan
+    return df
+
+
+def _assemble(blocks, width):
+    full = np.full((width, width), np.nan)
+    for a, b, corr in blocks:
+        full[a : a + corr.shape[0], b : b + corr.shape[1]] = corr
+        full[b : b + corr.shape[1], a : a + corr.shape[0]] = corr.T
+    return full
+
+
+def _tau_b(x, y):
+    # Brute-force Kendall tau-b over all pairs.
+    concordant = discordant = x_ties = y_ties = 0
+    for i, j in combinations(range(len(x)), 2):
+        dx, dy = np.sign(x[i] - x[j]), np.sign(y[i] - y[j])
+        if dx == 0 and dy == 0:
+            continue
+        if dx == 0:
+            x_ties += 1
+        elif dy == 0:
+            y_ties += 1
+        elif dx == dy:
+            concordant += 1
+        else:
+            discordant += 1
+    return (concordant - discordant) / np.sqrt(
+        (concordant + discordant + x_ties) * (concordant + discordant + y_ties)
+    )
+
+
+@pytest.mark.parametrize("block", [2, 512])
+def test_pearson_blocks_match_pandas(frame, block):
+    columns = list(frame.columns)
+    got = _assemble(correlation_blocks(frame, columns, block=block), len(columns))
+    np.testing.assert_allclose(got, frame.corr().to_numpy(), atol=1e-12)
+
+
+def test_spearman_matches_pandas(frame):
+    columns = list(frame.columns)
+    got = _assemble(rank_correlation_blocks(frame, columns, "spearman"), len(columns))
+    np.testing.assert_allclose(got, frame.corr(method="spearman").to_numpy(), atol=1e-12)
+
+
+def test_kendall_matches_pairwise_definition(frame):
+    columns = ["a", "b", "c", "d"]
+    got = _assemble(rank_correlation_blocks(frame.head(80), columns, "kendall"), len(columns))
+    for i, j in combinations(range(len(columns)), 2):
+        pair = frame.head(80)[[columns[i], columns[j]]].dropna().to_numpy()
+        assert got[i, j] == pytest.approx(_tau_b(pair[:, 0], pair[:, 1]), abs=1e-12)
+
+
+def test_kendall_tau_with_ties():
+    x = np.array([1.0, 2, 2, 3, 3, 3, 4])
+    y = np.array([2.0, 1, 1, 3, 5, 4, 4])
+    assert kendall_tau(x, y) == pytest.approx(_tau_b(x, y), abs=1e-12)
+
+
+def test_find_correlations_reports_the_strong_pair(frame):
+    result = find_correlations(frame, threshold=0.8, include_matrix=False)
+    pairs = {(p["column_1"], p["column_2"]) for p in result["strong_correlations"]}
+    assert pairs == {("a", "b")}
@@ -0,0 +1,91 @@
+"""CSV schema inference: pinned dtypes, and categories after filtering and sampling."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from quick_data_cli.config.settings import settings  # noqa: E402
+from quick_data_cli.utils.csv_schema import infer_csv_schema  # noqa: E402
+from quick_data_cli.utils.filters import parse_filter  # noqa: E402
+from quick_data_cli.utils.loader import load_data  # noqa: E402
+from quick_data_cli.utils.sampling import load_sample  # noqa: E402
+
+
+@pytest.fixture
+def survey(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "cache_enabled", False)
+    path = tmp_path / "survey.csv"
+    departments = ["sales", "engineering", "finance", "hr"]
+    pd.DataFrame(
+        {
+            "id": [f"emp_{i:03d}" for i in range(40)],
+            "department": [departments[i % 4] for i in range(40)],
+            "score": [i / 4 for i in range(40)],
+            "joined": pd.date_range("2024-01-01", periods=40).strftime("%Y-%m-%d"),
+            "age": range(20, 60),
+        }
+    ).to_csv(path, index=False)
+    return path
+
+
+def test_schema_pins_dtypes(survey):
+    schema = infer_csv_schema(survey)
+    assert schema.sep == "," and schema.header
+    assert schema.dtypes == {"department": "category", "score": "float64"}
+    assert schema.date_columns == ["joined"]
+    df = load_data(survey, use_cache=False, optimize=False)
+    assert df["department"].dtype == "category"
+    assert df["id"].dtype != "category"
+    assert pd.api.types.is_datetime64_any_dtype(df["joined"])
+    assert df["age"].dtype == "int64"
+
+
+def test_headerless_and_semicolon_files(tmp_path):
+    path = tmp_path / "raw.csv"
+    path.write_text("".join(f"{i};{i * 0.5}\n" for i in range(30)))
+    schema = infer_csv_schema(path)
+    assert (schema.sep, schema.header) == (";", False)
+    assert list(load_data(path, use_cache=False).columns) == ["column_1", "column_2"]
+
+
+def test_mistyped_sample_falls_back_to_inference(tmp_path, monkeypatch):
+    monkeypatch.setattr("quick_data_cli.utils.csv_schema.SAMPLE_CHARS", 64)
+    path = tmp_path / "late_text.csv"
+    path.write_text("v\n" + "1.5\n" * 40 + "n/a-ish\n")
+    df = load_data(path, use_cache=False)
+    assert df["v"].iloc[-1] == "n/a-ish"
+
+
+def test_filter_drops_unused_categories(survey):
+    df = load_data(survey, use_cache=False, filters=[parse_filter("department==sales")])
+    assert df["department"].value_counts().to_dict() == {"sales": 10}
+
+
+def test_sample_drops_unused_categories(survey):
+    df, _ = load_sample(survey, "3", seed=1)
+    assert df["department"].dtype == "category"
+    assert set(df["department"].cat.categories) == set(df["department"])
+
+
+def test_scripts_get_unpinned_text(survey, tmp_path):
+    df = load_data(survey, use_cache=False, pin_categories=False)
+    assert df["department"].dtype != "category"
+    assert df["department"].tolist()[:2] == ["sales", "engineering"]
+    script = tmp_path / "relabel.py"
+    script.write_text('df.loc[0, "department"] = "legal"\nprint(df["department"].iloc[0], df["department"].dtype)\n')
+    proc = subprocess.run(
+        [sys.executable, str(ROOT / "main.py"), "execute", str(survey), str(script)],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=dict(os.environ, QUICK_DATA_DAEMON="0", QUICK_DATA_CACHE="0"),
+    )
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+    assert "legal" in proc.stdout and "category" not in proc.stdout
@@ -0,0 +1,99 @@
+"""The serve daemon: dataset reuse, dataset identity and the client round trip."""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from quick_data_cli.config.settings import settings  # noqa: E402
+from quick_data_cli.models.schemas import DatasetManager  # noqa: E402
+from quick_data_cli.utils.daemon import _LOAD_SETTINGS, DatasetDaemon  # noqa: E402
+
+DESCRIBE = "quick_data_cli.analytics.describe:describe_dataframe"
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "cache_enabled", False)
+    monkeypatch.setattr(settings, "spill_dir", tmp_path / "spill")
+    for name in _LOAD_SETTINGS:
+        monkeypatch.setattr(settings, name, getattr(settings, name))
+    yield DatasetDaemon(idle_timeout=60, dataset_ttl=60)
+    DatasetManager.clear_all_datasets()
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"a": [1, 2, 3], "b": [0.5, 1.5, 2.5]}).to_csv(path, index=False)
+    return path
+
+
+def _run(daemon, path, func=DESCRIBE, **load_settings):
+    current = {name: getattr(settings, name) for name in _LOAD_SETTINGS}
+    message = {
+        "op": "run",
+        "cwd": os.getcwd(),
+        "file_path": str(path),
+        "columns": None,
+        "func": func,
+        "kwargs": {},
+        "settings": {**current, **load_settings},
+    }
+    return daemon.handle(message)
+
+
+def test_dataset_is_loaded_once_and_reloaded_when_the_file_changes(daemon, data_file):
+    assert _run(daemon, data_file)["result"]["column_count"] == 2
+    _run(daemon, data_file)
+    (entry,) = daemon.status()["datasets"]
+    assert entry["hits"] == 1
+    pd.DataFrame({"a": range(5)}).to_csv(data_file, index=False)
+    assert _run(daemon, data_file)["result"]["rows"] == 5
+
+
+def test_every_load_setting_is_part_of_the_dataset_key(daemon, data_file):
+    _run(daemon, data_file, csv_engine="c")
+    _run(daemon, data_file, csv_engine="python")
+    _run(daemon, data_file, optimize_memory=True)
+    assert len(daemon.status()["datasets"]) == 3
+
+
+def test_only_analytics_functions_run_and_failures_fall_back(daemon, data_file):
+    response = _run(daemon, data_file, func="os:getcwd")
+    assert response["fallback"] and "Not an analytics function" in response["error"]
+    response = _run(daemon, data_file, func="quick_data_cli.analytics.describe:missing")
+    assert response["fallback"]
+    response = _run(daemon, data_file, func="quick_data_cli.analytics.correlations:kendall_tau")
+    assert "error" in response and "fallback" not in response
+
+
+def test_client_round_trip(tmp_path, data_file):
+    env = dict(
+        os.environ,
+        QUICK_DATA_SOCKET=str(tmp_path / "d.sock"),
+        QUICK_DATA_CACHE_DIR=str(tmp_path / "cache"),
+        QUICK_DATA_RESULT_CACHE="0",
+    )
+    cli = [sys.executable, str(ROOT / "main.py")]
+    server = subprocess.Popen(cli + ["serve", "--idle-timeout", "60"], env=env, cwd=ROOT, stdout=subprocess.DEVNULL)
+    try:
+        for _ in range(100):
+            if (tmp_path / "d.key").exists() and (tmp_path / "d.sock").exists():
+                break
+            time.sleep(0.1)
+        for _ in range(2):
+            out = subprocess.run(cli + ["describe", str(data_file)], env=env, cwd=ROOT, capture_output=True, text=True)
+            assert out.returncode == 0, out.stderr
+        status = subprocess.run(cli + ["status"], env=env, cwd=ROOT, capture_output=True, text=True)
+        assert "in 1 datasets" in status.stdout
+    finally:
+        subprocess.run(cli + ["serve", "--stop"], env=env, cwd=ROOT, capture_output=True)
+        server.wait(timeout=10)
@@ -0,0 +1,106 @@
+"""DatasetManager schema discovery, memory budget and distinct-count estimates."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from quick_data_cli.config.settings import settings  # noqa: E402
+from quick_data_cli.models.schemas import (  # noqa: E402
+    DatasetManager,
+    DatasetSchema,
+    dataset_schemas,
+    dataset_stats,
+    spilled_datasets,
+)
+from quick_data_cli.utils.cardinality import HLL_ERROR, approx_nunique  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def clean_datasets():
+    yield
+    DatasetManager.clear_all_datasets()
+
+
+def _frame(rows: int = 100) -> pd.DataFrame:
+    return pd.DataFrame({"id": range(rows), "group": ["a", "b"] * (rows // 2), "value": np.linspace(0, 1, rows)})
+
+
+def test_schemas_are_discovered_on_first_lookup():
+    DatasetManager.register_dataset("sales", _frame())
+    assert "sales" in dataset_schemas and list(dataset_schemas) == ["sales"]
+    schema = dataset_schemas["sales"]
+    assert schema.row_count == 100 and schema.columns["group"].unique_values == 2
+    assert DatasetManager.get_schema("sales") is schema
+    # Registering a new frame under the same name forgets the old schema.
+    DatasetManager.register_dataset("sales", _frame(10))
+    assert dataset_schemas["sales"].row_count == 10
+
+
+def test_schemas_of_unknown_datasets_are_missing():
+    assert "missing" not in dataset_schemas
+    assert dataset_schemas.get("missing") is None
+    with pytest.raises(ValueError):
+        DatasetManager.get_schema("missing")
+    DatasetManager.register_dataset("sales", _frame())
+    DatasetManager.clear_dataset("sales")
+    assert len(dataset_schemas) == 0
+
+
+@pytest.mark.parametrize("distinct", [50, 5_000, 200_000])
+def test_approx_nunique_is_within_the_expected_error(distinct):
+    series = pd.Series(np.arange(distinct).repeat(3))
+    assert abs(approx_nunique(series) - distinct) <= max(1, 4 * HLL_ERROR * distinct)
+    assert approx_nunique(series.astype(str)) == pytest.approx(distinct, rel=4 * HLL_ERROR)
+
+
+def test_approximate_schema_matches_exact_counts_closely():
+    df = pd.DataFrame({"key": np.arange(50_000) % 20_000, "flag": [True, False] * 25_000})
+    exact = DatasetSchema.from_dataframe(df, "d", approximate=False)
+    approx = DatasetSchema.from_dataframe(df, "d", approximate=True)
+    assert exact.columns["key"].unique_values == 20_000
+    assert approx.columns["key"].unique_values == pytest.approx(20_000, rel=4 * HLL_ERROR)
+    assert approx.columns["flag"].unique_values == 2
+    assert approx.columns["key"].suggested_role == exact.columns["key"].suggested_role
+
+
+def test_datasets_over_budget_spill_and_reload(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "dataset_memory_budget_mb", 1)
+    monkeypatch.setattr(settings, "spill_datasets", True)
+    monkeypatch.setattr(settings, "spill_dir", tmp_path)
+    big = pd.DataFrame({"x": np.arange(100_000, dtype=np.float64)})
+    DatasetManager.register_dataset("first", big)
+    DatasetManager.register_dataset("second", big + 1)
+    DatasetManager.get_schema("second")
+    assert not DatasetManager.is_resident("first") and spilled_datasets["first"].exists()
+    assert DatasetManager.list_datasets() == ["second", "first"]
+
+    reloads = dataset_stats["reloads"]
+    # Discovering the spilled dataset's schema reloads it and spills the other.
+    assert DatasetManager.get_dataset_info("first")["shape"] == (100_000, 1)
+    assert dataset_stats["reloads"] == reloads + 1
+    assert DatasetManager.is_resident("first") and not DatasetManager.is_resident("second")
+    pd.testing.assert_frame_equal(DatasetManager.get_dataset("first"), big)
+    # A known schema is answered for a spilled dataset without reloading it.
+    assert DatasetManager.get_dataset_info("second")["resident"] is False
+    assert dataset_stats["reloads"] == reloads + 1
+
+    DatasetManager.clear_all_datasets()
+    assert not list(tmp_path.iterdir())
+
+
+def test_datasets_over_budget_are_dropped_without_spilling(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "dataset_memory_budget_mb", 1)
+    monkeypatch.setattr(settings, "spill_datasets", False)
+    monkeypatch.setattr(settings, "spill_dir", tmp_path)
+    big = pd.DataFrame({"x": np.arange(100_000, dtype=np.float64)})
+    DatasetManager.register_dataset("first", big)
+    DatasetManager.register_dataset("second", big)
+    assert DatasetManager.list_datasets() == ["second"]
+    with pytest.raises(ValueError):
+        DatasetManager.get_dataset("first")
+    assert not list(tmp_path.iterdir())
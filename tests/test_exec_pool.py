@@ -0,0 +1,82 @@
+"""Warm worker pool for `execute`: isolation, recycling and timeouts."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from quick_data_cli.utils.exec_pool import WorkerPool  # noqa: E402
+from quick_data_cli.utils.shared_frame import shared_frame  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def frame():
+    with shared_frame(pd.DataFrame({"x": [1, 2, 3], "label": ["a", "b", "c"]})) as path:
+        yield str(path)
+
+
+def _scripts(tmp_path, *sources):
+    paths = []
+    for i, source in enumerate(sources):
+        path = tmp_path / f"script_{i}.py"
+        path.write_text(source)
+        paths.append(str(path))
+    return paths
+
+
+def test_results_come_back_in_order_and_scripts_are_isolated(frame, tmp_path):
+    scripts = _scripts(
+        tmp_path,
+        "df['x'] = 0\npd.set_option('display.max_rows', 1)\nimport builtins\nbuiltins.leak = 1\nprint(df['x'].sum())",
+        "import builtins\nprint(df['x'].sum(), hasattr(builtins, 'leak'), pd.get_option('display.max_rows'))",
+        "raise ValueError('boom')",
+        "import sys\nsys.exit(3)",
+    )
+    pool = WorkerPool(frame, workers=1, timeout=30)
+    results = pool.run(scripts + [str(tmp_path / "missing.py")])
+    assert [r.script for r in results[:4]] == scripts
+    assert results[0].stdout.strip() == "0"
+    assert results[1].stdout.split() == ["6", "False", "60"]
+    assert results[2].returncode == 1 and "ValueError: boom" in results[2].stdout
+    assert results[3].returncode == 3
+    assert results[4].returncode == 2
+    assert pool.started == 1
+
+
+def test_workers_are_recycled(frame, tmp_path):
+    scripts = _scripts(tmp_path, *["print(len(df))"] * 3)
+    pool = WorkerPool(frame, workers=1, timeout=30, recycle_after=1)
+    assert [r.stdout.strip() for r in pool.run(scripts)] == ["3"] * 3
+    assert pool.started == 3
+
+
+def test_timeout_and_crash_do_not_stop_the_batch(frame, tmp_path):
+    scripts = _scripts(tmp_path, "import time\ntime.sleep(30)", "import os\nos._exit(9)", "print('after')")
+    pool = WorkerPool(frame, workers=1, timeout=2)
+    slow, crash, after = pool.run(scripts)
+    assert slow.timed_out and slow.returncode == 1
+    assert crash.returncode == 1 and "status 9" in crash.stderr
+    assert after.stdout.strip() == "after"
+    assert pool.started == 2
+
+
+def test_execute_reports_every_script(tmp_path):
+    data = tmp_path / "data.csv"
+    pd.DataFrame({"x": range(10)}).to_csv(data, index=False)
+    scripts = _scripts(tmp_path, "print('sum', df['x'].sum())", "raise RuntimeError('nope')")
+    proc = subprocess.run(
+        [sys.executable, str(ROOT / "main.py"), "execute", str(data), *scripts, "--workers", "2"],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=dict(os.environ, QUICK_DATA_DAEMON="0", QUICK_DATA_CACHE="0"),
+    )
+    assert proc.returncode == 1
+    assert "sum 45" in proc.stdout and "RuntimeError: nope" in proc.stdout
+    assert "1 of 2 scripts succeeded" in proc.stdout
@@ -0,0 +1,63 @@
+"""--filter expressions: parsing, application and range pruning."""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from quick_data_cli.utils.filters import (  # noqa: E402
+    apply_filters,
+    parse_filter,
+    range_may_match,
+    ranges_may_match,
+)
+
+
+@pytest.mark.parametrize(
+    "expr, expected",
+    [
+        ("amount>=100", ("amount", ">=", 100)),
+        ("amount < 2.5", ("amount", "<", 2.5)),
+        ("region=EU", ("region", "==", "EU")),
+        ("region!=EU", ("region", "!=", "EU")),
+        ("name='a b'", ("name", "==", "a b")),
+        ('code=="42"', ("code", "==", "42")),
+        ("total revenue<=-3", ("total revenue", "<=", -3)),
+        ("note=", ("note", "==", "")),
+    ],
+)
+def test_parse_filter(expr, expected):
+    assert parse_filter(expr) == expected
+
+
+@pytest.mark.parametrize("expr", ["amount", ">5", ""])
+def test_parse_filter_rejects_malformed(expr):
+    with pytest.raises(ValueError, match="Invalid filter"):
+        parse_filter(expr)
+
+
+def test_apply_filters():
+    df = pd.DataFrame({"amount": [50, 150, None, 300], "region": ["EU", "EU", "US", "US"]})
+    out = apply_filters(df, [parse_filter("amount>=100"), parse_filter("region=EU")])
+    assert out["amount"].tolist() == [150]
+    assert list(out.index) == [0]
+    with pytest.raises(ValueError, match="not found"):
+        apply_filters(df, [parse_filter("missing>1")])
+    with pytest.raises(ValueError, match="Cannot compare"):
+        apply_filters(df, [parse_filter("region>1")])
+
+
+def test_ranges_prune_only_impossible_matches():
+    assert not range_may_match(1, 10, ">", 10)
+    assert range_may_match(1, 10, ">=", 10)
+    assert not range_may_match(5, 5, "!=", 5)
+    assert range_may_match(datetime(2024, 1, 1), datetime(2024, 12, 31), "==", "2024-06-01")
+    assert not range_may_match(datetime(2024, 1, 1), datetime(2024, 12, 31), "<", "2023-06-01")
+    assert range_may_match(1, 10, "<", "abc")
+    ranges = {"amount": (0, 50), "region": None}
+    assert not ranges_may_match(ranges, [parse_filter("amount>100")])
+    assert ranges_may_match(ranges, [parse_filter("region=EU"), parse_filter("amount<10")])
@@ -0,0 +1,71 @@
+"""Incremental JSON input: JSON Lines and top-level arrays of records."""
+
+import json
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from quick_data_cli.config.settings import settings  # noqa: E402
+from quick_data_cli.utils import json_stream  # noqa: E402
+from quick_data_cli.utils.json_stream import NotRecordsError, iter_json_batches, json_layout  # noqa: E402
+from quick_data_cli.utils.loader import load_data  # noqa: E402
+
+RECORDS = [{"id": i, "name": f"n{i} é", "customer": {"tier": "gold" if i % 3 else "basic"}} for i in range(25)]
+
+
+def _write(path: Path, text: str) -> Path:
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def array_file(tmp_path):
+    return _write(tmp_path / "records.json", "[\n" + ",\n  ".join(json.dumps(r) for r in RECORDS) + "\n]\n")
+
+
+@pytest.fixture
+def lines_file(tmp_path):
+    return _write(tmp_path / "records.ndjson", "\n".join(json.dumps(r) for r in RECORDS) + "\n\n")
+
+
+def test_layout_detection(tmp_path, array_file, lines_file):
+    assert json_layout(array_file) == "array"
+    assert json_layout(lines_file) == "lines"
+    assert json_layout(_write(tmp_path / "lines.json", '{"a": 1}\n{"a": 2}\n')) == "lines"
+    assert json_layout(_write(tmp_path / "doc.json", '{"a": [1, 2]}')) == "document"
+
+
+@pytest.mark.parametrize("fixture", ["array_file", "lines_file"])
+def test_batches_match_a_full_parse(request, monkeypatch, fixture):
+    # Tiny blocks force records to straddle block boundaries.
+    monkeypatch.setattr(json_stream, "_BLOCK_CHARS", 16)
+    batches = list(iter_json_batches(request.getfixturevalue(fixture), batch_size=10))
+    assert [len(b) for b in batches] == [10, 10, 5]
+    expected = pd.json_normalize(RECORDS)
+    pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), expected)
+    assert "customer.tier" in expected.columns
+
+
+def test_load_data_reads_records_incrementally(array_file, lines_file, monkeypatch):
+    monkeypatch.setattr(settings, "cache_enabled", False)
+    for path in (array_file, lines_file):
+        df = load_data(path, use_cache=False, optimize=False)
+        assert len(df) == 25 and df["name"].iloc[3] == "n3 é"
+
+
+@pytest.mark.parametrize(
+    "text, error",
+    [
+        ('{"a": {"b": 1}}', NotRecordsError),
+        ("[1, 2, 3]", NotRecordsError),
+        ('[{"a": 1} {"a": 2}]', ValueError),
+        ('[{"a": 1},', ValueError),
+    ],
+)
+def test_malformed_input(tmp_path, text, error):
+    with pytest.raises(error):
+        list(iter_json_batches(_write(tmp_path / "bad.json", text), batch_size=10))
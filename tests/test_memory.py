@@ -0,0 +1,44 @@
+"""--optimize-memory downcasting, and the int64 frames `execute` scripts get."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from quick_data_cli.utils.memory import optimize_memory  # noqa: E402
+
+
+def test_optimize_memory_downcasts_integers():
+    df = pd.DataFrame({"v": [120, 5, -3, 7], "label": ["a", "a", "a", "b"]})
+    optimized, report = optimize_memory(df)
+    assert optimized["v"].dtype == "int8"
+    assert optimized["label"].dtype == "category"
+    assert report["bytes_after"] < report["bytes_before"]
+
+
+def test_optimize_memory_can_keep_integers():
+    df = pd.DataFrame({"v": [120, 5, -3, 7], "label": ["a", "a", "a", "b"]})
+    optimized, _ = optimize_memory(df, downcast_integers=False)
+    assert optimized["v"].dtype == "int64"
+    assert optimized["label"].dtype == "category"
+
+
+def test_execute_arithmetic_does_not_overflow(tmp_path):
+    data = tmp_path / "values.csv"
+    data.write_text("v\n120\n11\n")
+    script = tmp_path / "square.py"
+    script.write_text('s = df["v"] * df["v"]\nprint(s.iloc[0], s.dtype)\n')
+    proc = subprocess.run(
+        [sys.executable, str(ROOT / "main.py"), "--optimize-memory", "execute", str(data), str(script)],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=dict(os.environ, QUICK_DATA_DAEMON="0", QUICK_DATA_CACHE="0"),
+    )
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+    assert "14400 int64" in proc.stdout
@@ -0,0 +1,57 @@
+"""Directory and glob inputs: every matching file, concatenated in order."""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from quick_data_cli.config.settings import settings  # noqa: E402
+from quick_data_cli.utils.loader import SOURCE_COLUMN, expand_inputs, iter_chunks, load_data  # noqa: E402
+
+
+@pytest.fixture
+def partitions(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "cache_enabled", False)
+    monkeypatch.setattr(settings, "add_source_column", True)
+    # Each month has its own low-cardinality regions, so every file pins
+    # different categories.
+    regions = {"01": ["north", "south"], "02": ["east", "west"], "03": ["north", "east"]}
+    for month, names in regions.items():
+        pd.DataFrame(
+            {"order_id": range(40), "region": [names[i % 2] for i in range(40)], "amount": [i * 1.5 for i in range(40)]}
+        ).to_csv(tmp_path / f"orders_2024-{month}.csv", index=False)
+    (tmp_path / "notes.txt").write_text("not data")
+    return tmp_path
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_directory_keeps_categories_across_files(partitions, monkeypatch, jobs):
+    monkeypatch.setattr(settings, "jobs", jobs)
+    df = load_data(partitions, use_cache=False, optimize=False)
+    assert len(df) == 120
+    assert df["region"].dtype == "category"
+    assert set(df["region"].cat.categories) == {"north", "south", "east", "west"}
+    assert df[SOURCE_COLUMN].dtype == "category"
+    assert df[SOURCE_COLUMN].iloc[[0, 40, 80]].tolist() == [f"orders_2024-{m}.csv" for m in ("01", "02", "03")]
+    assert df["region"].iloc[[0, 40, 80]].tolist() == ["north", "east", "north"]
+    assert list(df.columns) == ["order_id", "region", "amount", SOURCE_COLUMN]
+
+
+def test_glob_selects_matching_files(partitions):
+    assert [p.name for p in expand_inputs(partitions / "orders_2024-0[23].csv")] == [
+        "orders_2024-02.csv",
+        "orders_2024-03.csv",
+    ]
+    df = load_data(str(partitions / "orders_2024-0[23].csv"), use_cache=False, optimize=False)
+    assert len(df) == 80 and set(df["region"]) == {"north", "east", "west"}
+    with pytest.raises(FileNotFoundError):
+        expand_inputs(partitions / "orders_2023-*.csv")
+
+
+def test_streamed_partitions_follow_one_another(partitions):
+    chunks = list(iter_chunks(partitions, chunksize=25))
+    assert [len(c) for c in chunks] == [25, 15] * 3
+    assert pd.concat(chunks)[SOURCE_COLUMN].astype(str).str[-6:-4].tolist() == ["01"] * 40 + ["02"] * 40 + ["03"] * 40
@@ -0,0 +1,59 @@
+"""Batched outlier detection against a per-column IQR and z-score reference."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from quick_data_cli.analytics import outliers  # noqa: E402
+from quick_data_cli.analytics.outliers import detect_outliers  # noqa: E402
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame(rng.standard_t(3, size=(2000, 4)), columns=["a", "b", "c", "d"])
+    df["e"] = rng.integers(0, 10, size=2000)
+    df.loc[rng.random(2000) < 0.1, "b"] = np.nan
+    df["empty"] = np.nan
+    df["flat"] = 5.0
+    return df
+
+
+def _reference(s: pd.Series, method: str):
+    values = s.dropna()
+    if method == "iqr":
+        q1, q3 = values.quantile(0.25), values.quantile(0.75)
+        lower, upper = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+        flagged = values[(values < lower) | (values > upper)]
+    else:
+        mean, std = values.mean(), values.std()
+        lower, upper = (mean - 3 * std, mean + 3 * std) if std else (mean, mean)
+        flagged = values[((values - mean) / std).abs() > 3] if std else values.iloc[:0]
+    return len(flagged), round(lower, 3), round(upper, 3), flagged.tolist()[:10]
+
+
+@pytest.mark.parametrize("method", ["iqr", "zscore"])
+@pytest.mark.parametrize("block_bytes", [8, 1 << 27])
+def test_batched_matches_per_column(frame, method, block_bytes, monkeypatch):
+    monkeypatch.setattr(outliers, "BLOCK_BYTES", block_bytes)
+    result = detect_outliers(frame, method=method)
+    total = 0
+    for col in ["a", "b", "c", "d", "e", "flat"]:
+        info = result["outliers_by_column"][col]
+        count, lower, upper, values = _reference(frame[col], method)
+        assert info["outlier_count"] == count, col
+        assert info["lower_bound"] == pytest.approx(lower, abs=1e-9), col
+        assert info["upper_bound"] == pytest.approx(upper, abs=1e-9), col
+        assert info["outlier_values"] == values, col
+        total += count
+    assert result["outliers_by_column"]["empty"]["outlier_count"] == 0
+    assert result["total_outliers"] == total
+
+
+def test_unknown_method_is_an_error(frame):
+    assert "error" in detect_outliers(frame, method="mad")
@@ -0,0 +1,82 @@
+"""execute --partitions/--by: map() per partition, then reduce()."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def data(tmp_path):
+    path = tmp_path / "orders.csv"
+    pd.DataFrame({"region": ["north", "south", "east", "west"] * 25, "amount": range(100)}).to_csv(path, index=False)
+    return path
+
+
+def _execute(tmp_path, data, source, *options):
+    script = tmp_path / "job.py"
+    script.write_text(source)
+    return subprocess.run(
+        [sys.executable, str(ROOT / "main.py"), "execute", str(data), str(script), *options],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=dict(os.environ, QUICK_DATA_DAEMON="0", QUICK_DATA_CACHE="0"),
+    )
+
+
+def test_row_partitions_are_reduced(tmp_path, data):
+    source = "def map(part):\n    return [len(part), int(part['amount'].sum())]\n\ndef reduce(results):\n    return results\n"
+    proc = _execute(tmp_path, data, source, "--partitions", "4")
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+    # Row ranges of 25, in partition order.
+    assert proc.stdout.strip() == str([[25, 300], [25, 925], [25, 1550], [25, 2175]])
+
+
+def test_partitions_by_column_keep_groups_together(tmp_path, data):
+    source = (
+        "def map(part):\n"
+        "    return part.groupby('region')['amount'].sum()\n"
+        "\n"
+        "def reduce(results):\n"
+        "    combined = pd.concat(results)\n"
+        "    print('unique', combined.index.is_unique)\n"
+        "    return int(combined['north'])\n"
+    )
+    proc = _execute(tmp_path, data, source, "--by", "region", "--partitions", "3")
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+    assert proc.stdout.split() == ["unique", "True", str(sum(range(0, 100, 4)))]
+
+
+def test_default_reduce_concatenates_lists(tmp_path, data):
+    proc = _execute(tmp_path, data, "def map(part):\n    return [len(part)]\n", "--partitions", "2")
+    assert proc.stdout.strip() == "[50, 50]"
+
+
+def test_failed_partition_skips_reduce(tmp_path, data):
+    source = (
+        "def map(part):\n"
+        "    if part.index[0] == 0:\n"
+        "        raise ValueError('bad partition')\n"
+        "    return len(part)\n"
+        "\n"
+        "def reduce(results):\n"
+        "    print('reduced')\n"
+    )
+    proc = _execute(tmp_path, data, source, "--partitions", "2")
+    assert proc.returncode == 1
+    assert "ValueError: bad partition" in proc.stdout
+    assert "1 of 2 partitions failed; skipping reduce" in proc.stderr
+    assert "reduced" not in proc.stdout
+
+
+def test_partitions_need_one_script_with_map(tmp_path, data):
+    proc = _execute(tmp_path, data, "x = 1\n", "--partitions", "2")
+    assert proc.returncode == 1 and "must define map(df_part)" in proc.stdout
+    proc = _execute(tmp_path, data, "x = 1\n", "--partitions", "2", str(tmp_path / "job.py"))
+    assert proc.returncode == 1 and "exactly one script" in proc.stderr
@@ -0,0 +1,83 @@
+"""--profile: per-stage timing and memory, without profiling itself."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from quick_data_cli.utils.profiling import Profiler  # noqa: E402
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = Profiler()
+    with profiler.stage("load") as record:
+        record["rows"] = 3
+    assert profiler.stages == []
+
+
+def test_nested_stages_and_memory_peaks():
+    profiler = Profiler()
+    profiler.start(trace_memory=True)
+    with profiler.stage("load") as record:
+        with profiler.stage("read_csv"):
+            block = bytearray(8 * 1024 * 1024)
+        del block
+        record["rows"] = 3
+    report = profiler.finish()
+    names = [(s["stage"], s["depth"]) for s in report["stages"]]
+    assert names == [("setup", 0), ("load", 0), ("read_csv", 1), ("render", 0)]
+    load, read_csv = report["stages"][1:3]
+    # The inner peak folds into its parent.
+    assert read_csv["py_peak_bytes"] >= 8 * 1024 * 1024
+    assert load["py_peak_bytes"] >= read_csv["py_peak_bytes"]
+    assert load["rows"] == 3 and load["wall_s"] >= read_csv["wall_s"]
+    assert not profiler.enabled
+
+
+def _run(tmp_path, *args, result_cache="0"):
+    env = dict(
+        os.environ,
+        QUICK_DATA_DAEMON="0",
+        QUICK_DATA_CACHE="0",
+        QUICK_DATA_RESULT_CACHE=result_cache,
+        QUICK_DATA_CACHE_DIR=str(tmp_path / "cache"),
+    )
+    return subprocess.run(
+        [sys.executable, str(ROOT / "main.py"), *args], capture_output=True, text=True, cwd=ROOT, env=env
+    )
+
+
+def test_profile_json_lists_command_stages(tmp_path):
+    path = tmp_path / "profile.json"
+    proc = _run(tmp_path, "--profile-json", str(path), "describe", "data/employee_survey.csv")
+    assert proc.returncode == 0, proc.stderr
+    report = json.loads(path.read_text())
+    stages = [s["stage"] for s in report["stages"]]
+    assert stages[0] == "setup" and stages[-1] == "render"
+    assert {"load", "read_csv", "compute"} <= set(stages)
+    load = next(s for s in report["stages"] if s["stage"] == "load")
+    assert load["rows"] > 0 and load["py_peak_bytes"] is None
+    # --profile-json alone writes the file without printing the table.
+    assert "Profile:" not in proc.stderr
+
+
+@pytest.mark.parametrize("option", ["--profile", "--profile-memory"])
+def test_profile_prints_the_stage_table(tmp_path, option):
+    proc = _run(tmp_path, option, "describe", "data/employee_survey.csv")
+    assert proc.returncode == 0, proc.stderr
+    assert "Profile:" in proc.stderr and "compute" in proc.stderr
+
+
+def test_cprofile_dump_bypasses_the_result_cache(tmp_path):
+    dump = tmp_path / "compute.prof"
+    assert _run(tmp_path, "describe", "data/employee_survey.csv", result_cache="1").returncode == 0
+    proc = _run(tmp_path, "--profile-cprofile", str(dump), "describe", "data/employee_survey.csv", result_cache="1")
+    assert proc.returncode == 0, proc.stderr
+    assert "Cached result" not in proc.stderr
+    assert dump.stat().st_size > 0
@@ -0,0 +1,53 @@
+"""Column projection pushed down into load_data and iter_chunks."""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from quick_data_cli.config.settings import settings  # noqa: E402
+from quick_data_cli.utils import cache  # noqa: E402
+from quick_data_cli.utils.filters import parse_filter  # noqa: E402
+from quick_data_cli.utils.loader import iter_chunks, load_data  # noqa: E402
+
+FRAME = pd.DataFrame({"a": [1, 2, 3], "b": [0.5, 1.5, 2.5], "c": ["x", "y", "z"]})
+
+
+@pytest.fixture(params=["csv", "jsonl", "json"])
+def data_file(request, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "cache_enabled", False)
+    path = tmp_path / f"data.{request.param}"
+    if request.param == "csv":
+        FRAME.to_csv(path, index=False)
+    else:
+        FRAME.to_json(path, orient="records", lines=request.param == "jsonl")
+    return path
+
+
+def test_only_requested_columns_are_loaded(data_file):
+    df = load_data(data_file, columns=["c", "a"], use_cache=False, optimize=False)
+    # File order is kept and unknown names are left for the analysis to report.
+    assert list(df.columns) == ["a", "c"]
+    assert list(load_data(data_file, columns=["a", "missing"], use_cache=False, optimize=False).columns) == ["a"]
+    assert [list(c.columns) for c in iter_chunks(data_file, chunksize=2, columns=["b"])] == [["b"], ["b"]]
+
+
+def test_filter_columns_are_read_but_not_returned(data_file):
+    df = load_data(data_file, columns=["a"], filters=[parse_filter("b>1")], use_cache=False, optimize=False)
+    assert list(df.columns) == ["a"] and df["a"].tolist() == [2, 3]
+
+
+def test_projected_parses_are_not_cached(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    monkeypatch.setattr(settings, "cache_enabled", True)
+    path = tmp_path / "data.csv"
+    FRAME.to_csv(path, index=False)
+    load_data(path, columns=["a"], optimize=False)
+    assert cache.get(path) is None
+    load_data(path, optimize=False)
+    assert list(load_data(path, columns=["b"], optimize=False).columns) == ["b"]
+    assert list(cache.get(path).columns) == ["a", "b", "c"]
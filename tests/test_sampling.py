@@ -0,0 +1,120 @@
+"""--sample draws: deterministic for a seed, sized as requested, in file order."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from quick_data_cli.utils.sampling import (  # noqa: E402
+    allocate_sample,
+    bernoulli_sample,
+    count_strata,
+    load_sample,
+    parse_sample_spec,
+    reservoir_sample,
+    stratified_sample,
+)
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(3)
+    return pd.DataFrame({"id": np.arange(5000), "group": rng.choice(["a", "b", "c"], size=5000, p=[0.7, 0.2, 0.1])})
+
+
+def _chunks(df, size=700):
+    return (df.iloc[i : i + size] for i in range(0, len(df), size))
+
+
+@pytest.mark.parametrize(
+    "draw",
+    [
+        lambda chunks, seed: reservoir_sample(chunks, 200, seed),
+        lambda chunks, seed: stratified_sample(chunks, pd.Series({"a": 140, "b": 40, "c": 20}), "group", seed),
+        lambda chunks, seed: bernoulli_sample(chunks, 0.05, seed),
+    ],
+)
+def test_same_seed_same_sample(frame, draw):
+    first, total = draw(_chunks(frame), 7)
+    again, _ = draw(_chunks(frame), 7)
+    other, _ = draw(_chunks(frame), 8)
+    assert total == len(frame)
+    pd.testing.assert_frame_equal(first, again)
+    assert not first["id"].equals(other["id"])
+    assert first["id"].is_monotonic_increasing
+
+
+def test_reservoir_size_and_uniqueness(frame):
+    sample, _ = reservoir_sample(_chunks(frame), 200, seed=1)
+    assert len(sample) == 200
+    assert sample["id"].is_unique
+
+
+def test_stratified_keeps_proportions(frame):
+    counts, total = count_strata(_chunks(frame), "group")
+    assert total == len(frame) and counts.equals(frame["group"].value_counts().astype("int64"))
+    sample, _ = stratified_sample(_chunks(frame), allocate_sample(counts, 200), "group", seed=1)
+    expected = (frame["group"].value_counts() / len(frame) * 200).round()
+    assert sample["group"].value_counts().sort_index().tolist() == expected.sort_index().astype(int).tolist()
+
+
+@pytest.mark.parametrize(
+    "counts, n, expected",
+    [
+        # Shares 66.67, 16.67, 16.67: the largest remainder gets the last row.
+        ([400, 100, 100], 100, [67, 17, 16]),
+        # Room for every stratum: the 0.44-row stratum takes one from the largest.
+        ([600, 200, 100], 4, [2, 1, 1]),
+        # Fewer rows than strata: shares 1.33, 0.44, 0.22 leave the smallest out.
+        ([600, 200, 100], 2, [1, 1, 0]),
+        ([600, 200, 100], 1000, [600, 200, 100]),
+    ],
+)
+def test_allocation_adds_up_to_n(counts, n, expected):
+    quotas = allocate_sample(pd.Series(counts, index=["a", "b", "c"]), n)
+    assert quotas.tolist() == expected
+    assert quotas.sum() == min(n, sum(counts))
+
+
+def test_stratified_sample_never_exceeds_n(tmp_path):
+    # Many small strata used to get one row each on top of the proportional share.
+    df = pd.DataFrame({"id": range(1000), "group": ["big"] * 900 + [f"g{i}" for i in range(100)]})
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+    sample, info = load_sample(path, "50", stratify_by="group", seed=1)
+    assert len(sample) == info["sample_size"] == 50
+    assert sample["group"].value_counts()["big"] == 45
+
+
+def test_stratified_fraction(frame, tmp_path):
+    path = tmp_path / "data.csv"
+    frame.to_csv(path, index=False)
+    sample, info = load_sample(path, "0.1", stratify_by="group", seed=2)
+    assert info["method"] == "stratified by group"
+    assert len(sample) == 500
+    expected = (frame["group"].value_counts() * 0.1).round().astype(int)
+    assert sample["group"].value_counts().sort_index().equals(expected.sort_index())
+
+
+def test_load_sample_is_deterministic(frame, tmp_path):
+    path = tmp_path / "data.csv"
+    frame.to_csv(path, index=False)
+    first, info = load_sample(path, "300", seed=5)
+    again, _ = load_sample(path, "300", seed=5)
+    pd.testing.assert_frame_equal(first, again)
+    assert (info["sample_size"], info["total_rows"], info["method"]) == (300, 5000, "reservoir")
+
+
+@pytest.mark.parametrize("spec, expected", [("500", (500, None)), ("0.25", (None, 0.25)), ("1", (1, None))])
+def test_parse_sample_spec(spec, expected):
+    assert parse_sample_spec(spec) == expected
+
+
+@pytest.mark.parametrize("spec", ["0", "-3", "2.5", "lots"])
+def test_parse_sample_spec_rejects(spec):
+    with pytest.raises(ValueError, match="Invalid sample size"):
+        parse_sample_spec(spec)
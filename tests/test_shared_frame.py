@@ -0,0 +1,96 @@
+"""Frames written to shared memory map back unchanged in the sandbox."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from quick_data_cli.utils.shared_frame import MAP_FRAME_CODE, shared_frame  # noqa: E402
+
+
+def _map(path: Path) -> pd.DataFrame:
+    namespace = {}
+    argv = sys.argv
+    sys.argv = ["sandbox", str(path)]
+    try:
+        exec(MAP_FRAME_CODE, namespace)
+    finally:
+        sys.argv = argv
+    return namespace["df"]
+
+
+def test_round_trip():
+    df = pd.DataFrame(
+        {
+            "int": np.arange(5, dtype=np.int64),
+            "small": np.arange(5, dtype=np.int8),
+            "float": [0.5, np.nan, 2.0, 3.5, -1.0],
+            "flag": [True, False, True, True, False],
+            "when": pd.date_range("2024-01-01", periods=5),
+            "when_tz": pd.date_range("2024-01-01", periods=5, tz="Europe/Paris"),
+            "cat": pd.Categorical(["a", "b", "a", None, "b"]),
+            "text": ["x", "y", None, "w", "v"],
+            "nullable": pd.array([1, None, 3, 4, 5], dtype="Int64"),
+        },
+        index=pd.RangeIndex(10, 15, name="row"),
+    )
+    with shared_frame(df) as path:
+        mapped = _map(path)
+        pd.testing.assert_frame_equal(mapped, df, check_dtype=False)
+        for col in ["int", "small", "float", "flag", "when", "when_tz", "cat", "nullable"]:
+            assert mapped[col].dtype == df[col].dtype, col
+    assert not path.exists()
+
+
+def test_writes_stay_private_to_the_script():
+    df = pd.DataFrame({"v": np.arange(1000, dtype=np.float64), "t": ["a", "b"] * 500})
+    with shared_frame(df) as path:
+        mapped = _map(path)
+        mapped.loc[0, "v"] = -1.0
+        mapped["v"] += 1
+        mapped.loc[1, "t"] = "new"
+        assert mapped["v"].iloc[:2].tolist() == [0.0, 2.0]
+        again = _map(path)
+        assert again["v"].iloc[0] == 0.0 and again["t"].iloc[1] == "b"
+
+
+def test_text_and_nullable_columns_stay_out_of_the_header():
+    n = 10_000
+    df = pd.DataFrame(
+        {
+            "text": pd.Series([f"label {i % 7} é" for i in range(n)], dtype=object),
+            "ints": pd.array([i if i % 3 else None for i in range(n)], dtype="Int64"),
+            "flags": pd.array([bool(i % 2) if i % 5 else None for i in range(n)], dtype="boolean"),
+        }
+    )
+    df.loc[3, "text"] = np.nan
+    df["strings"] = df["text"].astype("string")
+    with shared_frame(df) as path:
+        header_len = int.from_bytes(path.read_bytes()[:8], "little")
+        assert header_len < 2000
+        mapped = _map(path)
+        pd.testing.assert_frame_equal(mapped.drop(columns="strings"), df.drop(columns="strings"), check_dtype=False)
+        assert mapped["ints"].dtype == "Int64" and mapped["flags"].dtype == "boolean"
+        # The sandbox's default string dtype, with its own missing value.
+        assert mapped["strings"].isna().tolist() == df["strings"].isna().tolist()
+        assert mapped["strings"].dropna().tolist() == df["strings"].dropna().tolist()
+
+
+@pytest.mark.skipif(int(pd.__version__.split(".")[0]) >= 3, reason="copy-on-write is always on from pandas 3")
+def test_mapping_leaves_pandas_options_alone():
+    before = pd.get_option("mode.copy_on_write")
+    with shared_frame(pd.DataFrame({"v": [1.0]})) as path:
+        _map(path)
+    assert pd.get_option("mode.copy_on_write") == before
+
+
+def test_non_range_index_and_empty_frame():
+    df = pd.DataFrame({"v": [1.5, 2.5]}, index=pd.Index(["r1", "r2"], name="key"))
+    with shared_frame(df) as path:
+        pd.testing.assert_frame_equal(_map(path), df)
+    with shared_frame(pd.DataFrame({"v": np.array([], dtype=np.float64)})) as path:
+        assert _map(path).shape == (0, 1)
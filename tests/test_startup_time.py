@@ -0,0 +1,90 @@
+"""Cold-start import budget for the CLI entry point.
+
+Asserted on what gets imported rather than on wall-clock time, which
+varies too much between machines and runs to be a reliable gate.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Set
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+MAIN = ROOT / "main.py"
+
+DATA_STACK = {"pandas", "numpy", "plotly", "pyarrow", "scipy"}
+
+# Runs the CLI in-process, then reports which modules it imported.
+_MODULES_SCRIPT = """
+import json, sys
+sys.path.insert(0, {src!r})
+sys.argv = ["quick-data", *{args!r}]
+from quick_data_cli.cli import app
+try:
+    app()
+except SystemExit:
+    pass
+sys.stderr.write("MODULES " + json.dumps(sorted(sys.modules)) + "\\n")
+"""
+
+
+def _env(cache_dir: Path) -> Dict[str, str]:
+    # A cached result would skip the imports under test, and the run must not
+    # write into the user's cache directory.
+    return dict(
+        os.environ,
+        QUICK_DATA_DAEMON="0",
+        QUICK_DATA_CACHE="0",
+        QUICK_DATA_RESULT_CACHE="0",
+        QUICK_DATA_CACHE_DIR=str(cache_dir),
+    )
+
+
+def imported_modules(cache_dir: Path, *args: str) -> Set[str]:
+    script = _MODULES_SCRIPT.format(src=str(ROOT / "src"), args=list(args))
+    proc = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, cwd=ROOT, env=_env(cache_dir)
+    )
+    line = next(l for l in proc.stderr.splitlines() if l.startswith("MODULES "))
+    return set(json.loads(line[len("MODULES "):]))
+
+
+def top_packages(modules: Set[str]) -> Set[str]:
+    return {m.split(".")[0] for m in modules}
+
+
+def test_help_imports_no_data_stack(tmp_path):
+    """`--help` imports no command module and none of the data stack."""
+    modules = imported_modules(tmp_path, "--help")
+    assert not top_packages(modules) & DATA_STACK
+    assert not [m for m in modules if m.startswith("quick_data_cli.commands.")]
+
+
+@pytest.mark.parametrize("command", ["describe", "correlations", "chart", "execute"])
+def test_command_help_is_lazy(command, tmp_path):
+    """A command's --help imports only its own module and no data stack."""
+    modules = imported_modules(tmp_path, command, "--help")
+    assert not top_packages(modules) & DATA_STACK
+    command_modules = [m for m in modules if m.startswith("quick_data_cli.commands.")]
+    assert len(command_modules) == 1
+
+
+def test_describe_imports(tmp_path):
+    """`describe` loads pandas but neither plotly nor the other commands."""
+    modules = imported_modules(tmp_path, "describe", "data/employee_survey.csv")
+    assert "pandas" in top_packages(modules)
+    assert not top_packages(modules) & {"plotly", "scipy"}
+    assert [m for m in modules if m.startswith("quick_data_cli.commands.")] == ["quick_data_cli.commands.describe_cmd"]
+
+
+def test_lazy_help_matches_registered_help():
+    """The help shown in the command list must match each command's own help."""
+    sys.path.insert(0, str(ROOT / "src"))
+    from quick_data_cli.cli import LAZY_COMMANDS, load_command
+
+    for name, (_, help_text) in LAZY_COMMANDS.items():
+        assert load_command(name).help == help_text, name
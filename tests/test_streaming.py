@@ -0,0 +1,63 @@
+"""Streaming accumulators merge to the same result however rows are split."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from quick_data_cli.analytics.streaming import CorrelationAccumulator, FrameAccumulator  # noqa: E402
+
+
+@pytest.fixture
+def chunks():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame(rng.normal(loc=1e6, size=(900, 3)), columns=["x", "y", "z"])
+    df["y"] += df["x"]
+    df.loc[rng.random(900) < 0.1, "z"] = np.nan
+    return df, [df.iloc[:100], df.iloc[100:550], df.iloc[550:]]
+
+
+def _corr(chunk):
+    return CorrelationAccumulator.from_chunks([chunk])
+
+
+def test_correlation_merge_is_associative(chunks):
+    df, (a, b, c) = chunks
+    left = _corr(a)
+    left.merge(_corr(b))
+    left.merge(_corr(c))
+    right = _corr(b)
+    right.merge(_corr(c))
+    grouped = _corr(a)
+    grouped.merge(right)
+    np.testing.assert_allclose(left.correlation(), grouped.correlation(), atol=1e-12)
+    np.testing.assert_allclose(left.correlation(), df.corr(), atol=1e-9)
+
+
+def test_correlation_merge_matches_from_chunks(chunks):
+    _, parts = chunks
+    merged = _corr(parts[2])
+    merged.merge(_corr(parts[0]))
+    merged.merge(_corr(parts[1]))
+    direct = CorrelationAccumulator.from_chunks(parts)
+    pd.testing.assert_frame_equal(merged.correlation().loc[direct.columns, direct.columns], direct.correlation())
+
+
+def test_frame_merge_is_associative(chunks):
+    df, (a, b, c) = chunks
+    left = FrameAccumulator.from_chunks([a])
+    left.merge(FrameAccumulator.from_chunks([b]))
+    left.merge(FrameAccumulator.from_chunks([c]))
+    right = FrameAccumulator.from_chunks([b])
+    right.merge(FrameAccumulator.from_chunks([c]))
+    grouped = FrameAccumulator.from_chunks([a])
+    grouped.merge(right)
+    for col in df.columns:
+        one, two = left.columns[col], grouped.columns[col]
+        assert (one.rows, one.non_null, one.count) == (two.rows, two.non_null, two.count)
+        assert one.mean == pytest.approx(two.mean, rel=1e-14)
+        assert one.std == pytest.approx(df[col].std(), rel=1e-9)